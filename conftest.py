@@ -9,5 +9,9 @@ pytest_plugins = [
     "fixtures.api_clients",
     "fixtures.browser",
     "fixtures.cleanup",
-    "fixtures.auth"
+    "fixtures.auth",
+    "fixtures.load",
+    "fixtures.benchmarks",
+    "fixtures.perf",
+    "fixtures.tracing"
 ]
@@ -12,9 +12,12 @@ from logic.api.admin_api import AdminApi
 
 
 @pytest.fixture(scope="session")
-def api() -> ApiWrapper:
-    """Get API wrapper"""
-    return ApiWrapper()
+def api(config) -> ApiWrapper:
+    """
+    Get API wrapper.
+    Identical concurrent GETs share one request when config 'single_flight.enabled' is true.
+    """
+    return ApiWrapper(single_flight=config.get("single_flight.enabled", False))
 
 
 @pytest.fixture(scope="session")
@@ -4,22 +4,35 @@ Authentication and browser login fixtures.
 
 import pytest
 from typing import Dict
+from infra.jwt_claims import CachedToken
 
 
-@pytest.fixture
-def get_admin_token(auth_api, config) -> callable:
+@pytest.fixture(scope="session")
+def config_admin_token(auth_api, config) -> CachedToken:
     """
-    Get admin token for test setup.
-    Uses configured admin credentials.
-    NOTE: This uses shared admin from config. For isolated tests, use create_test_admin.
+    Get the configured admin's token, shared by the worker's tests.
+    Logs in once and again only when the token (JWT 'exp') is about to expire.
     """
-    def _get_token() -> str:
+    def _login() -> str:
         result = auth_api.login(
             email=config.admin_email,
             password=config.admin_password
         )
         return result.get("token")
     
+    return CachedToken(_login, margin=config.get("auth_tokens.refresh_margin", 60))
+
+
+@pytest.fixture
+def get_admin_token(config_admin_token) -> callable:
+    """
+    Get admin token for test setup.
+    Uses configured admin credentials (cached login, see config_admin_token).
+    NOTE: This uses shared admin from config. For isolated tests, use create_test_admin.
+    """
+    def _get_token() -> str:
+        return config_admin_token.get()
+    
     return _get_token
 
 
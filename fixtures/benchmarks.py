@@ -0,0 +1,58 @@
+"""
+Benchmark and interaction latency fixtures.
+"""
+
+import pytest
+from infra.api_wrapper import ApiWrapper
+from infra.interaction_timer import InteractionTimer
+from logic.perf.admin_scaling import AdminScalingBenchmark
+from logic.perf.auth_benchmark import AuthBenchmark
+from logic.perf.interactions import CartInteractions
+
+
+@pytest.fixture
+def cart_interactions(logged_in_browser, cart_api, orders_api, config, cleanup) -> CartInteractions:
+    """
+    Get interaction latency flows for a NEW logged in user.
+    Timing settings from config.json 'interactions' section.
+    """
+    timer = InteractionTimer(
+        logged_in_browser["driver"],
+        timeout=config.get("interactions.timeout", 10),
+        poll_interval=config.get("interactions.poll_interval_ms", 25) / 1000
+    )
+    return CartInteractions(timer, cart_api, orders_api, logged_in_browser["token"], cleanup)
+
+
+@pytest.fixture
+def admin_scaling(create_test_user, create_test_product, create_test_admin, cleanup, config) -> AdminScalingBenchmark:
+    """
+    Get admin endpoint scaling benchmark.
+    Uses a NEW admin; seeded users, products and orders are cleaned up after test.
+    Measurements bypass latency recording (seeding steps would skew route budgets).
+    """
+    admin_data = create_test_admin()
+    api = ApiWrapper(record_latency=False)
+    yield AdminScalingBenchmark(
+        api,
+        admin_data["token"],
+        create_user=create_test_user,
+        create_product=create_test_product,
+        cleanup=cleanup,
+        repeats=config.get("admin_scaling.repeats", 5)
+    )
+    api.close()
+
+
+@pytest.fixture
+def auth_benchmark(create_test_user, config) -> AuthBenchmark:
+    """
+    Get register/login benchmark over NEW users.
+    Connection pool sized for the highest 'auth_benchmark.concurrency' level;
+    users registered by the benchmark are cleaned up after test.
+    """
+    settings = config.get("auth_benchmark", {})
+    users = [create_test_user() for _ in range(settings.get("users", 5))]
+    api = ApiWrapper(pool_size=max(settings.get("concurrency", [1])), record_latency=False)
+    yield AuthBenchmark(api, users, create_test_user)
+    api.close()
@@ -3,8 +3,8 @@ Browser and page object fixtures.
 """
 
 import pytest
-from typing import Generator
-from infra.browser_wrapper import BrowserWrapper
+from typing import Generator, Optional, Union
+from infra.browser_wrapper import BrowserContext, BrowserWrapper
 from logic.ui.login_page import LoginPage
 from logic.ui.register_page import RegisterPage
 from logic.ui.home_page import HomePage
@@ -17,12 +17,16 @@ from logic.ui.admin_users_page import AdminUsersPage
 from logic.ui.admin_orders_page import AdminOrdersPage
 
 
-@pytest.fixture(scope="function")
-def browser() -> Generator[BrowserWrapper, None, None]:
+@pytest.fixture(scope="session")
+def browser_process(config) -> Generator[Optional[BrowserWrapper], None, None]:
     """
-    Get browser wrapper for each test.
-    Automatically closes after test.
+    Get one Chrome per worker shared by all tests through isolated contexts.
+    Only when config 'browser_contexts.enabled' is true (None otherwise).
     """
+    if not config.get("browser_contexts.enabled", False):
+        yield None
+        return
+    
     browser_wrapper = BrowserWrapper()
     browser_wrapper.start()
     
@@ -31,6 +35,39 @@ def browser() -> Generator[BrowserWrapper, None, None]:
     browser_wrapper.stop()
 
 
+@pytest.fixture(scope="function")
+def browser(request, browser_process) -> Generator[Union[BrowserWrapper, BrowserContext], None, None]:
+    """
+    Get browser wrapper for each test (or an isolated context of the worker's
+    shared Chrome when browser contexts are enabled).
+    Throttling profile from @pytest.mark.emulation("slow-4g") or config 'emulation.profile'.
+    Request blocking profile from @pytest.mark.request_blocking("none") or config
+    'request_blocking.profile'; blocked request counts are attached to the test report.
+    Automatically closes after test.
+    """
+    emulation = request.node.get_closest_marker("emulation")
+    blocking = request.node.get_closest_marker("request_blocking")
+    
+    if browser_process is not None:
+        # URL patterns apply per context; external host blocking differing from the shared Chrome is warned about
+        browser_wrapper = browser_process.new_context(
+            emulation=emulation.args[0] if emulation else None,
+            blocking=blocking.args[0] if blocking else None
+        )
+    else:
+        browser_wrapper = BrowserWrapper(
+            emulation=emulation.args[0] if emulation else None,
+            blocking=blocking.args[0] if blocking else None
+        )
+        browser_wrapper.start()
+    
+    yield browser_wrapper
+    
+    browser_wrapper.stop()
+    if browser_wrapper.blocked_stats is not None:
+        request.node.user_properties.append(("blocked_requests", browser_wrapper.blocked_stats))
+
+
 @pytest.fixture(scope="function")
 def driver(browser):
     """Get Selenium WebDriver"""
@@ -38,61 +75,61 @@ def driver(browser):
 
 
 @pytest.fixture
-def login_page(driver) -> LoginPage:
+def login_page(driver, browser) -> LoginPage:
     """Get Login page object"""
-    return LoginPage(driver)
+    return LoginPage(driver, browser.window_handle)
 
 
 @pytest.fixture
-def register_page(driver) -> RegisterPage:
+def register_page(driver, browser) -> RegisterPage:
     """Get Register page object"""
-    return RegisterPage(driver)
+    return RegisterPage(driver, browser.window_handle)
 
 
 @pytest.fixture
-def home_page(driver) -> HomePage:
+def home_page(driver, browser) -> HomePage:
     """Get Home page object"""
-    return HomePage(driver)
+    return HomePage(driver, browser.window_handle)
 
 
 @pytest.fixture
-def cart_page(driver) -> CartPage:
+def cart_page(driver, browser) -> CartPage:
     """Get Cart page object"""
-    return CartPage(driver)
+    return CartPage(driver, browser.window_handle)
 
 
 @pytest.fixture
-def orders_page(driver) -> OrdersPage:
+def orders_page(driver, browser) -> OrdersPage:
     """Get Orders page object"""
-    return OrdersPage(driver)
+    return OrdersPage(driver, browser.window_handle)
 
 
 @pytest.fixture
-def profile_page(driver) -> ProfilePage:
+def profile_page(driver, browser) -> ProfilePage:
     """Get Profile page object"""
-    return ProfilePage(driver)
+    return ProfilePage(driver, browser.window_handle)
 
 
 @pytest.fixture
-def admin_dashboard(driver) -> AdminDashboardPage:
+def admin_dashboard(driver, browser) -> AdminDashboardPage:
     """Get Admin Dashboard page object"""
-    return AdminDashboardPage(driver)
+    return AdminDashboardPage(driver, browser.window_handle)
 
 
 @pytest.fixture
-def admin_products_page(driver) -> AdminProductsPage:
+def admin_products_page(driver, browser) -> AdminProductsPage:
     """Get Admin Products page object"""
-    return AdminProductsPage(driver)
+    return AdminProductsPage(driver, browser.window_handle)
 
 
 @pytest.fixture
-def admin_users_page(driver) -> AdminUsersPage:
+def admin_users_page(driver, browser) -> AdminUsersPage:
     """Get Admin Users page object"""
-    return AdminUsersPage(driver)
+    return AdminUsersPage(driver, browser.window_handle)
 
 
 @pytest.fixture
-def admin_orders_page(driver) -> AdminOrdersPage:
+def admin_orders_page(driver, browser) -> AdminOrdersPage:
     """Get Admin Orders page object"""
-    return AdminOrdersPage(driver)
+    return AdminOrdersPage(driver, browser.window_handle)
 
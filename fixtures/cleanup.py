@@ -2,10 +2,13 @@
 Cleanup and test data fixtures.
 """
 
-import random
 import logging
 import pytest
-from typing import Generator, Dict
+from typing import Dict, Generator, Optional
+from infra.catalog_index import CatalogIndex
+from infra.jwt_claims import token_claims
+from infra.product_allocator import DEDICATED_PREFIX, ProductAllocator, worker_shard
+from logic.api.models import Product
 from utils.data_factory import DataFactory
 from utils.cleanup_utils import CleanupManager
 
@@ -19,7 +22,7 @@ def data_factory() -> DataFactory:
 
 
 @pytest.fixture
-def cleanup(admin_api, auth_api, config) -> Generator[CleanupManager, None, None]:
+def cleanup(admin_api, config_admin_token, config) -> Generator[CleanupManager, None, None]:
     """
     Get cleanup manager.
     Cleans up all registered resources after test.
@@ -28,10 +31,9 @@ def cleanup(admin_api, auth_api, config) -> Generator[CleanupManager, None, None
     """
     manager = CleanupManager()
     
-    # Try to login with config admin - this is required for cleanup to work
+    # Config admin token (cached across tests) - this is required for cleanup to work
     try:
-        admin_result = auth_api.login(config.admin_email, config.admin_password)
-        admin_token = admin_result.get("token")
+        admin_token = config_admin_token.get()
         if admin_token:
             manager.set_admin_api(admin_api, admin_token)
             logger.debug("Cleanup manager configured with admin token from config")
@@ -49,26 +51,36 @@ def cleanup(admin_api, auth_api, config) -> Generator[CleanupManager, None, None
     manager.cleanup_all()
 
 
+def _token_user_id(token: str) -> Optional[str]:
+    """User id from the JWT claims (no profile request), None for opaque tokens"""
+    try:
+        return token_claims(token).user_id
+    except ValueError:
+        return None
+
+
 @pytest.fixture
 def create_test_user(auth_api, cleanup) -> callable:
     """
     Factory fixture to create test user via API.
     Returns function that creates user and returns (user_data, token).
+    Optional client: AuthApi to register through (e.g. a benchmark's pooled API).
     """
     def _create_user(
         name: str = None,
         email: str = None,
-        password: str = "TestPass123"
+        password: str = "TestPass123",
+        client=None
     ) -> Dict:
         user_data = DataFactory.user(name=name, email=email, password=password)
-        result = auth_api.register(
+        result = (client or auth_api).register(
             name=user_data["name"],
             email=user_data["email"],
             password=user_data["password"]
         )
         
         # Register for cleanup - extract user_id from different possible response formats
-        user_id = result.get("_id") or result.get("user", {}).get("_id")
+        user_id = result.get("_id") or result.get("user", {}).get("_id") or _token_user_id(result.get("token"))
         if user_id:
             cleanup.register_user(user_id)
         
@@ -115,7 +127,7 @@ def create_test_product(admin_api, config, cleanup) -> callable:
 
 
 @pytest.fixture
-def create_test_order(orders_api, products_api, cleanup) -> callable:
+def create_test_order(orders_api, get_random_product, product_allocator, cleanup) -> callable:
     """
     Factory fixture to create test order via API.
     Uses RANDOM product from database for test isolation.
@@ -124,16 +136,14 @@ def create_test_order(orders_api, products_api, cleanup) -> callable:
     def _create_order(user_token: str, product: Dict = None) -> Dict:
         # Use provided product or get random one
         if product is None:
-            products = products_api.get_all_products()
-            if not products:
-                raise ValueError("No products available in the database")
-            product = random.choice(products)
+            product = get_random_product()
         
         result = orders_api.create_order(
             items=[{"product": product["_id"], "quantity": 1}],
             total_amount=product["price"],
             token=user_token
         )
+        product_allocator.consume(product["_id"], 1)
         
         # Register for cleanup
         order_id = result.get("_id") or result.get("order", {}).get("_id")
@@ -170,8 +180,8 @@ def create_test_admin(auth_api, cleanup, config) -> callable:
         )
         
         # Register for cleanup
-        admin_id = result.get("_id") or result.get("user", {}).get("_id")
         admin_token = result.get("token")
+        admin_id = result.get("_id") or result.get("user", {}).get("_id") or _token_user_id(admin_token)
         
         if admin_id:
             cleanup.register_user(admin_id, is_admin=True)  # Mark as admin - will be deleted last
@@ -193,23 +203,81 @@ def create_test_admin(auth_api, cleanup, config) -> callable:
     return _create_admin
 
 
+@pytest.fixture(scope="session")
+def catalog_index(products_api) -> CatalogIndex:
+    """
+    Get worker's columnar index of all products (ids, prices, stock, categories).
+    Refreshed in place by get_random_product when older than 'catalog_index.max_age'.
+    """
+    return CatalogIndex(products_api.iter_products())
+
+
+@pytest.fixture(scope="session")
+def product_allocator(catalog_index, admin_api, config_admin_token, config) -> Generator[ProductAllocator, None, None]:
+    """
+    Get worker's product allocator over catalog_index.
+    Products are sharded between xdist workers (no two workers share a product)
+    and stock handed out to tests is reserved until the next refresh.
+    Dedicated high-stock products created for heavy tests are deleted after the session.
+    """
+    shard, shard_count = worker_shard() if config.get("product_allocator.sharding", True) else (0, 1)
+    
+    def _create_dedicated(stock: int) -> Dict:
+        product_data = DataFactory.product(stock=stock)
+        product_data["name"] = f"{DEDICATED_PREFIX}{product_data['name']}"
+        result = admin_api.create_product(product_data, config_admin_token.get())
+        return result.get("product", result)
+    
+    allocator = ProductAllocator(
+        catalog_index,
+        shard=shard,
+        shard_count=shard_count,
+        create_product=_create_dedicated,
+        dedicated_stock=config.get("product_allocator.dedicated_stock", 10000)
+    )
+    
+    yield allocator
+    
+    for product_id in allocator.dedicated_ids():
+        try:
+            admin_api.delete_product(product_id, config_admin_token.get())
+        except Exception as e:
+            logger.warning(f"Failed to delete dedicated product {product_id}: {e}")
+
+
 @pytest.fixture
-def get_random_product(products_api) -> callable:
+def get_random_product(products_api, catalog_index, product_allocator, config) -> callable:
     """
     Get a random product from existing products in the database.
-    Each call returns a different random product WITH STOCK > 0.
+    Each call returns a different random product of this worker's shard
+    with min_stock units not yet reserved by other tests of the worker.
+    Falls back to a dedicated product when the shard has none left.
     """
-    def _get_product(min_stock: int = 1) -> Dict:
-        products = products_api.get_all_products()
-        if not products:
+    def _get_product(min_stock: int = 1) -> Product:
+        if catalog_index.age() > config.get("catalog_index.max_age", 30):
+            product_allocator.refresh(products_api.iter_products())
+        if not len(catalog_index):
             raise ValueError("No products available in the database")
         
-        # Filter products with sufficient stock
-        available_products = [p for p in products if p.get("stock", 0) >= min_stock]
-        if not available_products:
+        product = product_allocator.allocate(
+            min_stock=min_stock,
+            weights=config.get("catalog_index.weights")
+        )
+        if product is None:
             raise ValueError(f"No products available with stock >= {min_stock}")
         
-        return random.choice(available_products)
+        return Product(product)
     
     return _get_product
 
+
+@pytest.fixture
+def get_dedicated_product(product_allocator) -> callable:
+    """
+    Get a high-stock product owned by this worker (for tests consuming a lot of stock).
+    Created on first use and shared by the worker's tests for the whole session.
+    """
+    def _get_product(min_stock: int = 1) -> Product:
+        return Product(product_allocator.allocate_dedicated(min_stock))
+    
+    return _get_product
@@ -0,0 +1,172 @@
+"""
+Load testing fixtures.
+"""
+
+import functools
+import pytest
+from infra.api_wrapper import ApiWrapper
+from infra.distributed_load import DistributedLoadResult, DistributedLoadRunner
+from infra.load_scheduler import ArrivalSchedule, OpenLoopScheduler
+from infra.saturation_finder import SaturationFinder
+from logic.api.admin_api import AdminApi
+from logic.api.orders_api import OrdersApi
+from logic.api.products_api import ProductsApi
+from logic.load.contention import CheckoutContention
+from logic.load.flows import FlowData, LoadFlow, build_flow, get_flow
+from logic.load.order_lifecycle import OrderLifecycle
+
+
+@pytest.fixture(scope="session")
+def load_api(config) -> ApiWrapper:
+    """
+    Get API wrapper sized for concurrent load.
+    Connection pool matches the scheduler's max in-flight requests.
+    """
+    api = ApiWrapper(pool_size=config.get("load.max_workers", 64), record_latency=False)
+    yield api
+    api.close()
+
+
+@pytest.fixture(scope="session")
+def load_products_api(load_api) -> ProductsApi:
+    """Get Products API client on the load connection pool"""
+    return ProductsApi(load_api)
+
+
+@pytest.fixture
+def open_loop_scheduler(config) -> OpenLoopScheduler:
+    """Get open-loop scheduler configured from config.json 'load' section"""
+    return OpenLoopScheduler(
+        max_workers=config.get("load.max_workers", 64),
+        lag_threshold_ms=config.get("load.lag_threshold_ms", 50)
+    )
+
+
+@pytest.fixture
+def saturation_finder(open_loop_scheduler, config) -> SaturationFinder:
+    """Get saturation finder configured from config.json 'load.saturation' section"""
+    settings = config.get("load.saturation", {})
+    return SaturationFinder(
+        open_loop_scheduler,
+        p99_slo_ms=config.get("load.p99_slo_ms", 500),
+        max_error_rate=settings.get("max_error_rate", 0.01),
+        start_rps=settings.get("start_rps", 5),
+        step_factor=settings.get("step_factor", 1.5),
+        max_rps=settings.get("max_rps", 500),
+        window=settings.get("window", 5),
+        min_windows=settings.get("min_windows", 2),
+        max_windows=settings.get("max_windows", 6),
+        stability_tolerance=settings.get("stability_tolerance", 0.15),
+        refine_steps=settings.get("refine_steps", 2),
+        knee_trials=settings.get("knee_trials", 3),
+        confidence=settings.get("confidence", 0.95)
+    )
+
+
+@pytest.fixture
+def load_flow_data(create_test_user, create_test_product, create_test_admin, cleanup, config) -> FlowData:
+    """
+    Get test data factories for load flow preparation.
+    Uses a NEW admin for product creation; everything is cleaned up after test.
+    Checkout gets one user per in-flight request ('load.checkout_users', default 'load.max_workers').
+    """
+    admin_data = create_test_admin()
+    return FlowData(
+        create_user=create_test_user,
+        create_product=create_test_product,
+        admin_token=admin_data["token"],
+        cleanup=cleanup,
+        checkout_users=config.get("load.checkout_users", config.get("load.max_workers", 64))
+    )
+
+
+@pytest.fixture
+def build_load_flow(load_api, load_flow_data, cleanup) -> callable:
+    """
+    Factory fixture to prepare and build a load flow by name.
+    Returns function that returns ready-to-call flow.
+    """
+    def _build_flow(name: str) -> LoadFlow:
+        flow_class = get_flow(name)
+        params = flow_class.prepare(load_flow_data)
+        return flow_class(load_api, params, cleanup)
+    
+    return _build_flow
+
+
+@pytest.fixture
+def distributed_load_runner(config) -> DistributedLoadRunner:
+    """Get multi-process load runner configured from config.json 'load.distributed' section"""
+    return DistributedLoadRunner(
+        workers=config.get("load.distributed.workers") or None,
+        max_workers=config.get("load.max_workers", 64),
+        lag_threshold_ms=config.get("load.lag_threshold_ms", 50),
+        report_interval=config.get("load.distributed.report_interval", 1.0)
+    )
+
+
+@pytest.fixture
+def run_distributed_flow(distributed_load_runner, load_flow_data, cleanup, config) -> callable:
+    """
+    Factory fixture to run a load flow across worker processes.
+    Prepares flow data once, each worker builds its own flow and connection pool.
+    Resources created by workers are registered for cleanup.
+    """
+    def _run(name: str, schedule: ArrivalSchedule) -> DistributedLoadResult:
+        params = get_flow(name).prepare(load_flow_data)
+        factory = functools.partial(
+            build_flow,
+            name,
+            params,
+            config.get("load.max_workers", 64)
+        )
+        result = distributed_load_runner.run(schedule, factory)
+        for resources in result.resources:
+            cleanup.register_resources(resources)
+        return result
+    
+    return _run
+
+
+@pytest.fixture
+def checkout_contention(create_test_user, create_test_product, create_test_admin, cleanup, config) -> CheckoutContention:
+    """
+    Get checkout contention scenario (N users racing for K units of a product).
+    Uses a NEW admin for product creation; users, products and orders are cleaned up after test.
+    """
+    admin_data = create_test_admin()
+    contention = CheckoutContention(
+        create_user=create_test_user,
+        create_product=create_test_product,
+        admin_token=admin_data["token"],
+        cleanup=cleanup,
+        pool_size=config.get("contention.pool_size", 64)
+    )
+    yield contention
+    contention.close()
+
+
+@pytest.fixture
+def order_lifecycle(create_test_user, create_test_product, create_test_admin, cleanup, config) -> OrderLifecycle:
+    """
+    Get order lifecycle pipeline (customers place orders, admin stages move them to delivered).
+    Uses a NEW admin, NEW customers and a NEW high-stock product; everything is cleaned up after test.
+    Settings from config.json 'order_pipeline' section.
+    """
+    settings = config.get("order_pipeline", {})
+    admin_data = create_test_admin()
+    product = create_test_product(admin_data["token"], stock=1_000_000)
+    customers = [create_test_user()["token"] for _ in range(settings.get("customers", 10))]
+    
+    # One connection per stage worker
+    api = ApiWrapper(pool_size=max(sum(settings.get("workers", {}).values()), 1), record_latency=False)
+    yield OrderLifecycle(
+        OrdersApi(api),
+        AdminApi(api),
+        admin_data["token"],
+        customers,
+        product.get("product", product),
+        cleanup=cleanup,
+        cancel_every=settings.get("cancel_every", 0)
+    )
+    api.close()
@@ -0,0 +1,364 @@
+"""
+Performance budget and results hooks.
+Evaluates per-route latency budgets (config.json) at session end and
+per-test budgets (perf_budget marker) after each test. Aggregates web vitals
+of page navigations per UI route and checks them against route budgets.
+Stores run metrics (endpoint latencies, test durations, page action timings,
+navigation vitals) in the local results store for run-to-run comparison
+(python -m infra.perf_compare). Reports WebDriver commands per page object
+method when the WebDriver command profiler is enabled, the text reports
+load/stress/benchmark tests record as record_property("perf_report", text),
+and how many GETs were coalesced when single_flight is enabled.
+
+Usage:
+    @pytest.mark.perf_budget("PRODUCT_SEARCH", p95=150)
+    @pytest.mark.perf_budget("POST ORDERS", p99=400, min_samples=3)
+    @pytest.mark.perf_budget(duration=5000)
+"""
+
+import os
+from typing import Dict, List, Tuple
+
+import pytest
+from infra.command_profiler import get_command_profiler
+from infra.config_provider import ConfigProvider
+from infra.latency_budget import BudgetResult, LatencyBudget, format_results, percentile
+from infra.latency_histogram import LatencyHistogram
+from infra.latency_recorder import RouteResolver, get_recorder
+from infra.network_timing import summarize as summarize_timings
+from infra.results_store import ResultsStore
+from infra.single_flight import merge_stats, process_stats
+from infra.web_vitals import UNITS, get_vitals_recorder
+from utils.constants import ApiEndpoints
+
+
+class PerfBudgetWarning(pytest.PytestWarning):
+    """Latency budget exceeded (warn mode)"""
+
+
+_session_results: List[BudgetResult] = []
+_vitals_results: List[BudgetResult] = []
+_test_durations: Dict[str, List[float]] = {}
+_blocked_requests: Dict[str, Dict[str, int]] = {"count": 0, "tests": 0, "by_reason": {}, "by_type": {}}
+_stored_run: Dict[str, str] = {}
+_perf_reports: List[Tuple[str, str]] = []
+_worker_single_flight: List[Dict] = []
+
+
+def _budget_settings() -> dict:
+    """Get latency_budgets section from config"""
+    return ConfigProvider().latency_budgets
+
+
+def _marker_budgets(item) -> List[LatencyBudget]:
+    """Build budgets from perf_budget markers"""
+    budgets = []
+    for marker in item.iter_markers("perf_budget"):
+        limits = dict(marker.kwargs)
+        min_samples = limits.pop("min_samples", 1)
+        limits.pop("warmup", None)
+        duration = limits.pop("duration", None)
+        if duration is not None:
+            budgets.append(LatencyBudget(None, 100, duration))
+        if marker.args:
+            budgets.extend(LatencyBudget.parse(marker.args[0], limits, min_samples))
+    return budgets
+
+
+def _marker_warmup(item) -> int:
+    """Get number of the test's own first samples per route to skip"""
+    return max([marker.kwargs.get("warmup", 0) for marker in item.iter_markers("perf_budget")] or [0])
+
+
+# ==================== SETUP ====================
+
+def pytest_configure(config):
+    recorder = get_recorder()
+    recorder.resolver = RouteResolver.from_class(ApiEndpoints)
+    recorder.warmup_samples = _budget_settings().get("warmup_samples", 0)
+    get_vitals_recorder().enabled = ConfigProvider().web_vitals.get("enabled", True)
+    get_command_profiler().enabled = ConfigProvider().get("webdriver_profiler.enabled", False)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    recorder = get_recorder()
+    recorder.current_test = item.nodeid
+    yield
+    recorder.current_test = None
+
+
+# ==================== PER-TEST BUDGETS ====================
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+    if call.when == "teardown":
+        # Navigations are finalized when the browser stops (fixture teardown)
+        navigations = get_vitals_recorder().samples(test_id=item.nodeid)
+        if navigations:
+            report.user_properties.append(("web_vitals", [sample.to_dict() for sample in navigations]))
+    if call.when != "call" or not report.passed:
+        return
+    
+    budgets = _marker_budgets(item)
+    if not budgets:
+        return
+    
+    recorder = get_recorder()
+    warmup = _marker_warmup(item)
+    results = []
+    for budget in budgets:
+        if budget.route is None:
+            values = [call.duration * 1000]
+        else:
+            values = recorder.samples(budget.route, budget.method, test_id=item.nodeid, include_warmup=True)
+            values = values[warmup:]
+        results.append(budget.evaluate(values))
+    
+    report.user_properties.append(("perf_budget", [str(result) for result in results]))
+    if not any(result.failed for result in results):
+        return
+    
+    text = format_results(f"Latency budget exceeded for {item.nodeid}:", results)
+    if _budget_settings().get("mode", "warn") == "fail":
+        report.outcome = "failed"
+        report.longrepr = text
+    else:
+        item.warn(PerfBudgetWarning(text))
+
+
+# ==================== SESSION BUDGETS ====================
+
+def pytest_runtest_logreport(report):
+    """Collect test call durations, blocked requests and perf reports (on xdist controller, reports arrive from workers)"""
+    if report.when == "call" and report.passed:
+        _test_durations.setdefault(report.nodeid, []).append(report.duration * 1000)
+    if report.when == "call":
+        _perf_reports.extend((report.nodeid, text) for name, text in report.user_properties if name == "perf_report")
+    if report.when == "teardown":
+        for name, stats in report.user_properties:
+            if name == "blocked_requests":
+                _blocked_requests["count"] += stats["count"]
+                _blocked_requests["tests"] += 1
+                for group in ("by_reason", "by_type"):
+                    for key, count in stats[group].items():
+                        _blocked_requests[group][key] = _blocked_requests[group].get(key, 0) + count
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Merge latency samples from xdist worker"""
+    output = getattr(node, "workeroutput", {})
+    if output.get("latency_samples"):
+        get_recorder().merge(output["latency_samples"])
+    if output.get("web_vitals"):
+        get_vitals_recorder().merge(output["web_vitals"])
+    if output.get("webdriver_commands"):
+        get_command_profiler().merge(output["webdriver_commands"])
+    if output.get("single_flight"):
+        _worker_single_flight.append(output["single_flight"])
+
+
+def _single_flight_stats() -> Dict:
+    """Single-flight counters of this process and all xdist workers"""
+    return merge_stats([process_stats(), *_worker_single_flight])
+
+
+def pytest_sessionfinish(session, exitstatus):
+    recorder = get_recorder()
+    
+    # xdist worker - hand samples to controller
+    if hasattr(session.config, "workerinput"):
+        session.config.workeroutput["latency_samples"] = recorder.export()
+        session.config.workeroutput["web_vitals"] = get_vitals_recorder().export()
+        session.config.workeroutput["webdriver_commands"] = get_command_profiler().export()
+        session.config.workeroutput["single_flight"] = process_stats()
+        return
+    
+    settings = _budget_settings()
+    min_samples = settings.get("min_samples", 1)
+    _session_results.clear()
+    for key, limits in settings.get("routes", {}).items():
+        for budget in LatencyBudget.parse(key, limits, min_samples):
+            _session_results.append(budget.evaluate(recorder.samples(budget.route, budget.method)))
+    
+    failed = any(result.failed for result in _session_results)
+    if failed and settings.get("mode", "warn") == "fail" and session.exitstatus == pytest.ExitCode.OK:
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+    
+    _evaluate_vitals(session)
+    _store_run(session)
+
+
+def _evaluate_vitals(session):
+    """Check web vitals of recorded navigations against route budgets"""
+    settings = ConfigProvider().web_vitals
+    vitals = get_vitals_recorder()
+    _vitals_results.clear()
+    for route, metrics in settings.get("routes", {}).items():
+        for metric, limits in metrics.items():
+            unit = UNITS.get(metric, "ms")
+            for budget in LatencyBudget.parse(f"{route}.{metric}", limits, settings.get("min_samples", 1), unit):
+                _vitals_results.append(budget.evaluate(vitals.values(route, metric)))
+    
+    failed = any(result.failed for result in _vitals_results)
+    if failed and settings.get("mode", "warn") == "fail" and session.exitstatus == pytest.ExitCode.OK:
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+def _store_run(session):
+    """Save run metrics to the results store"""
+    config = ConfigProvider()
+    settings = config.results_store
+    if not settings.get("enabled", True):
+        return
+    
+    recorder = get_recorder()
+    metrics = {
+        "endpoint": recorder.endpoint_metrics(),
+        "test": dict(_test_durations),
+        "page_action": recorder.actions(),
+        "network": recorder.network_metrics(),
+        "navigation": get_vitals_recorder().metrics()
+    }
+    if not any(metrics.values()):
+        return
+    
+    root = os.path.join(str(session.config.rootpath), settings.get("dir", "results"))
+    _stored_run["run_id"] = ResultsStore(root).save_run(metrics, meta={
+        "api_url": config.api_url,
+        "base_url": config.base_url,
+        "emulation": config.get("emulation.profile"),
+        "single_flight": _single_flight_stats(),
+        "exitstatus": int(session.exitstatus)
+    })
+    _stored_run["root"] = root
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    if _stored_run:
+        terminalreporter.write_line(
+            f"Performance results stored as {_stored_run['run_id']} in {_stored_run['root']} "
+            f"(compare: python -m infra.perf_compare --baseline baseline --candidate latest)"
+        )
+    
+    if _blocked_requests["tests"]:
+        details = ", ".join(
+            f"{key} {count}"
+            for group in ("by_reason", "by_type")
+            for key, count in sorted(_blocked_requests[group].items())
+        )
+        terminalreporter.write_line(
+            f"Blocked requests: {_blocked_requests['count']} in {_blocked_requests['tests']} browser tests"
+            + (f" ({details})" if details else "")
+        )
+    
+    single_flight = _single_flight_stats()
+    if single_flight["calls"]:
+        terminalreporter.write_line(
+            f"Single-flight GETs: {single_flight['calls']} calls, {single_flight['executed']} requests sent, "
+            f"{single_flight['coalesced']} coalesced, {single_flight['cached']} cached "
+            f"(coalescing ratio {single_flight['coalescing_ratio']:.0%})"
+        )
+    
+    _write_vitals_summary(terminalreporter)
+    _write_command_summary(terminalreporter)
+    _write_perf_reports(terminalreporter)
+    
+    recorder = get_recorder()
+    routes = recorder.routes()
+    if not routes:
+        return
+    
+    terminalreporter.section("API latency")
+    terminalreporter.write_line(
+        f"{'route':<34} {'n':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}"
+    )
+    for method, route in routes:
+        histogram = LatencyHistogram()
+        histogram.record_all(recorder.samples(route, method))
+        if not histogram.count:
+            continue
+        p = histogram.percentiles((50, 95, 99))
+        terminalreporter.write_line(
+            f"{method + ' ' + route:<34} {histogram.count:>6} {p['p50']:>9.1f} "
+            f"{p['p95']:>9.1f} {p['p99']:>9.1f} {histogram.max:>9.1f}"
+        )
+    
+    _write_network_summary(terminalreporter)
+    
+    if _session_results:
+        settings = _budget_settings()
+        title = (
+            f"Latency budgets (mode {settings.get('mode', 'warn')}, "
+            f"warm-up {settings.get('warmup_samples', 0)}, min samples {settings.get('min_samples', 1)}):"
+        )
+        terminalreporter.section("Latency budgets")
+        terminalreporter.write_line(format_results(title, _session_results))
+
+
+def _write_network_summary(terminalreporter):
+    """Median network breakdown per route (network_timing.enabled)"""
+    network = get_recorder().network()
+    if not network:
+        return
+    
+    columns = ("connect_ms", "ttfb_ms", "download_ms", "client_ms", "server_ms", "network_ms")
+    terminalreporter.section("API network breakdown (p50)")
+    terminalreporter.write_line(
+        f"{'route':<34} {'n':>6} {'reuse':>6} " + " ".join(f"{name[:-3]:>9}" for name in columns) + f" {'KB':>7}"
+    )
+    for (method, route), timings in sorted(network.items()):
+        summary = summarize_timings(timings)
+        cells = [f"{summary[name]:>9.1f}" if summary[name] is not None else f"{'-':>9}" for name in columns]
+        terminalreporter.write_line(
+            f"{method + ' ' + route:<34} {summary['n']:>6} {summary['reuse']:>6.0%} "
+            + " ".join(cells) + f" {summary['size'] / 1024:>7.1f}"
+        )
+
+
+def _write_perf_reports(terminalreporter):
+    """Text reports recorded by tests as record_property("perf_report", text)"""
+    if not _perf_reports:
+        return
+    
+    terminalreporter.section("Performance reports")
+    for nodeid, text in _perf_reports:
+        terminalreporter.write_line(f"{nodeid}\n{text}\n")
+
+
+def _write_command_summary(terminalreporter):
+    """WebDriver commands per page object method and per test (webdriver_profiler.enabled)"""
+    report = get_command_profiler().report(ConfigProvider().get("webdriver_profiler.top", 15))
+    if report:
+        terminalreporter.section("WebDriver commands")
+        terminalreporter.write_line(report)
+
+
+def _write_vitals_summary(terminalreporter):
+    """Web vitals table (p75 per UI route) and route budget results"""
+    vitals = get_vitals_recorder()
+    routes = vitals.routes()
+    if not routes:
+        return
+    
+    columns = ("ttfb", "fcp", "dom_content_loaded", "load", "lcp", "cls", "long_task_ms", "resource_kb")
+    terminalreporter.section("Web vitals (p75)")
+    terminalreporter.write_line(f"{'route':<18} {'n':>4} " + " ".join(f"{name[:11]:>11}" for name in columns))
+    for route in routes:
+        cells = []
+        for name in columns:
+            values = vitals.values(route, name)
+            precision = 3 if name == "cls" else 1
+            cells.append(f"{percentile(values, 75):>11.{precision}f}" if values else f"{'-':>11}")
+        terminalreporter.write_line(f"{route:<18} {len(vitals.samples(route)):>4} " + " ".join(cells))
+    
+    if _vitals_results:
+        settings = ConfigProvider().web_vitals
+        title = (
+            f"Web vitals budgets (mode {settings.get('mode', 'warn')}, "
+            f"min samples {settings.get('min_samples', 1)}):"
+        )
+        terminalreporter.write_line(format_results(title, _vitals_results))
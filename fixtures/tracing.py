@@ -0,0 +1,105 @@
+"""
+Tracing hooks.
+Opens a trace per test (root span with setup/call/teardown phases and
+fixture setup spans; API requests, page actions, waits and navigations nest
+inside) and writes it as Chrome trace-event or OTLP JSON per test and per
+session (config.json 'tracing'). Open the files in ui.perfetto.dev or
+chrome://tracing.
+"""
+
+import os
+import re
+
+import pytest
+from infra.config_provider import ConfigProvider
+from infra.tracing import get_tracer, write_trace
+
+
+def _settings() -> dict:
+    return ConfigProvider().get("tracing", {})
+
+
+def _trace_dir(config) -> str:
+    return os.path.join(str(config.rootpath), _settings().get("dir", "traces"))
+
+
+def _traced_phase(name: str):
+    """Hookwrapper body: span around a test phase, marked with the phase's exception"""
+    with get_tracer().span(name, "pytest") as span:
+        outcome = yield
+        if span and outcome.excinfo:
+            span.args["error"] = outcome.excinfo[0].__name__
+
+
+# ==================== SETUP ====================
+
+def pytest_configure(config):
+    get_tracer().enabled = _settings().get("enabled", False)
+
+
+# ==================== PER-TEST TRACES ====================
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    tracer = get_tracer()
+    tracer.start_test(item.nodeid)
+    yield
+    spans = tracer.end_test()
+    settings = _settings()
+    if spans and settings.get("per_test", True):
+        filename = re.sub(r"[^\w.-]+", "_", item.nodeid)[-150:] + ".json"
+        write_trace(
+            os.path.join(_trace_dir(item.config), "tests", filename),
+            spans,
+            settings.get("format", "chrome"),
+            settings.get("service_name", "pytest")
+        )
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_setup(item):
+    yield from _traced_phase("setup")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    yield from _traced_phase("call")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_teardown(item, nextitem):
+    yield from _traced_phase("teardown")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_fixture_setup(fixturedef, request):
+    with get_tracer().span(f"fixture {fixturedef.argname}", "fixture", scope=fixturedef.scope):
+        yield
+
+
+# ==================== SESSION TRACE ====================
+
+def pytest_sessionfinish(session, exitstatus):
+    tracer = get_tracer()
+    spans = tracer.spans()
+    if not spans:
+        return
+    
+    settings = _settings()
+    # xdist workers write one session file each
+    worker = getattr(session.config, "workerinput", {}).get("workerid")
+    filename = f"session-{worker}.json" if worker else "session.json"
+    write_trace(
+        os.path.join(_trace_dir(session.config), filename),
+        spans,
+        settings.get("format", "chrome"),
+        f"{settings.get('service_name', 'pytest')}{' ' + worker if worker else ''}"
+    )
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    if get_tracer().enabled:
+        terminalreporter.write_line(
+            f"Traces ({_settings().get('format', 'chrome')}) written to {_trace_dir(config)} "
+            f"(open in ui.perfetto.dev or chrome://tracing)"
+        )
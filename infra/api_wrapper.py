@@ -3,21 +3,65 @@ API wrapper - HTTP client for REST API calls.
 Reusable across any API testing project.
 """
 
+import itertools
+import time
 from typing import Optional, Dict, Any
 import requests
 from requests import Response
+from requests.adapters import HTTPAdapter
 
 from infra.config_provider import ConfigProvider
+from infra.latency_recorder import get_recorder
+from infra.network_timing import TimingAdapter, finish_timing, start_timing
+from infra.single_flight import SingleFlight
+from infra.tracing import get_tracer
 
 
 class ApiWrapper:
     """Base HTTP client wrapper"""
     
-    def __init__(self, base_url: str = None):
+    # Process-wide, bumped when any wrapper starts or finishes a write: a single-flight
+    # GET never joins a GET that started before or during a write issued ahead of it
+    _writes = itertools.count(1)
+    _write_generation = 0
+    
+    def __init__(
+        self,
+        base_url: str = None,
+        pool_size: int = None,
+        record_latency: bool = True,
+        network_timing: bool = None,
+        single_flight: bool = False
+    ):
+        """
+        Args:
+            base_url: API base URL (default from config)
+            pool_size: connection pool size for concurrent usage
+            record_latency: record request latency in the process-wide recorder
+            network_timing: record connect/TTFB/download breakdown (default: config 'network_timing.enabled')
+            single_flight: share one request between identical concurrent GETs (off by default;
+                keep off for load generation)
+        """
         self.config = ConfigProvider()
         self.base_url = base_url or self.config.api_url
         self.session = requests.Session()
         self.timeout = self.config.timeout
+        self.recorder = get_recorder() if record_latency else None
+        if network_timing is None:
+            network_timing = self.config.get("network_timing.enabled", False)
+        self.network_timing = network_timing and self.recorder is not None
+        self.single_flight = SingleFlight(
+            ttl=self.config.get("single_flight.ttl", 0),
+            cacheable=lambda response: response.ok
+        ) if single_flight else None
+        
+        # Larger connection pool for concurrent (load) usage; timed connections for network breakdown
+        if pool_size or self.network_timing:
+            adapter_class = TimingAdapter if self.network_timing else HTTPAdapter
+            pool_kwargs = {"pool_connections": pool_size, "pool_maxsize": pool_size} if pool_size else {}
+            adapter = adapter_class(**pool_kwargs)
+            self.session.mount("http://", adapter)
+            self.session.mount("https://", adapter)
     
     def _build_url(self, endpoint: str) -> str:
         """Build full URL from endpoint"""
@@ -41,20 +85,93 @@ class ApiWrapper:
         
         return headers
     
+    def _request(
+        self,
+        method: str,
+        endpoint: str,
+        token: str = None,
+        headers: Dict = None,
+        **kwargs
+    ) -> Response:
+        """Send request; writes start a new write generation before and after (see get())"""
+        if method == "GET":
+            return self._send(method, endpoint, token, headers, **kwargs)
+        
+        # Writes change what in-flight and cached GETs returned: a GET started while the
+        # write was in flight may be answered before it lands, so start a new generation
+        # both before and after sending
+        self._start_write_generation()
+        try:
+            return self._send(method, endpoint, token, headers, **kwargs)
+        finally:
+            self._start_write_generation()
+    
+    def _start_write_generation(self):
+        ApiWrapper._write_generation = next(ApiWrapper._writes)
+        if self.single_flight:
+            self.single_flight.invalidate()
+    
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        token: str = None,
+        headers: Dict = None,
+        **kwargs
+    ) -> Response:
+        """Send request (tagged with the test's correlation id), record its latency and trace span"""
+        tracer = get_tracer()
+        if tracer.correlation_id:
+            headers = {"X-Request-ID": tracer.correlation_id, **(headers or {})}
+        
+        # Streamed bodies are read by the caller - only time to headers is measured
+        network_timing = self.network_timing and not kwargs.get("stream")
+        with tracer.span(f"{method} {endpoint.split('?', 1)[0]}", "api", request_id=tracer.correlation_id) as span:
+            if network_timing:
+                start_timing()
+            started = time.perf_counter()
+            response = self.session.request(
+                method,
+                self._build_url(endpoint),
+                headers=self._build_headers(token, headers),
+                timeout=self.timeout,
+                **kwargs
+            )
+            finished = time.perf_counter()
+            timing = finish_timing(response, started, finished) if network_timing else None
+            if span:
+                span.args["status"] = response.status_code
+                if timing:
+                    span.args.update(connect_ms=timing.connect_ms, ttfb_ms=timing.ttfb_ms, server_ms=timing.server_ms)
+        if self.recorder:
+            self.recorder.record(method, endpoint, (finished - started) * 1000, response.status_code, timing)
+        return response
+    
     def get(
         self,
         endpoint: str,
         token: str = None,
         params: Dict = None,
-        headers: Dict = None
+        headers: Dict = None,
+        stream: bool = False
     ) -> Response:
-        """HTTP GET request"""
-        return self.session.get(
+        """
+        HTTP GET request (stream=True: body is read lazily, e.g. by iter_json_array).
+        With single_flight, identical concurrent GETs (same URL, params, token and
+        headers, no write through any wrapper in between) share one request and
+        its Response; streamed GETs are never shared.
+        """
+        if self.single_flight is None or stream:
+            return self._request("GET", endpoint, token, headers, params=params, stream=stream)
+        
+        key = (
             self._build_url(endpoint),
-            params=params,
-            headers=self._build_headers(token, headers),
-            timeout=self.timeout
+            tuple(sorted((name, str(value)) for name, value in (params or {}).items())),
+            token or "",
+            tuple(sorted((headers or {}).items())),
+            ApiWrapper._write_generation
         )
+        return self.single_flight.do(key, lambda: self._request("GET", endpoint, token, headers, params=params))
     
     def post(
         self,
@@ -64,12 +181,7 @@ class ApiWrapper:
         headers: Dict = None
     ) -> Response:
         """HTTP POST request"""
-        return self.session.post(
-            self._build_url(endpoint),
-            json=data,
-            headers=self._build_headers(token, headers),
-            timeout=self.timeout
-        )
+        return self._request("POST", endpoint, token, headers, json=data)
     
     def put(
         self,
@@ -79,12 +191,7 @@ class ApiWrapper:
         headers: Dict = None
     ) -> Response:
         """HTTP PUT request"""
-        return self.session.put(
-            self._build_url(endpoint),
-            json=data,
-            headers=self._build_headers(token, headers),
-            timeout=self.timeout
-        )
+        return self._request("PUT", endpoint, token, headers, json=data)
     
     def patch(
         self,
@@ -94,12 +201,7 @@ class ApiWrapper:
         headers: Dict = None
     ) -> Response:
         """HTTP PATCH request"""
-        return self.session.patch(
-            self._build_url(endpoint),
-            json=data,
-            headers=self._build_headers(token, headers),
-            timeout=self.timeout
-        )
+        return self._request("PATCH", endpoint, token, headers, json=data)
     
     def delete(
         self,
@@ -108,11 +210,7 @@ class ApiWrapper:
         headers: Dict = None
     ) -> Response:
         """HTTP DELETE request"""
-        return self.session.delete(
-            self._build_url(endpoint),
-            headers=self._build_headers(token, headers),
-            timeout=self.timeout
-        )
+        return self._request("DELETE", endpoint, token, headers)
     
     def close(self):
         """Close session"""
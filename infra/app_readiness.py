@@ -0,0 +1,89 @@
+"""
+App readiness - SPA-level "page is usable" detection.
+Reusable across any web testing project.
+
+With the eager/none page-load strategies driver.get() returns before the
+load event, so readiness is decided by the app instead:
+- the SPA root element has mounted children
+- no fetch/XHR in flight for settle_ms (tracked by a script injected into
+  every document via CDP; without it only the DOM checks apply)
+- the page object's own ready selector matches (e.g. product grid rendered)
+A ready selector must also match the page's valid empty state (no products,
+no orders), otherwise every navigation to it waits for the full timeout.
+"""
+
+import logging
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.ui import WebDriverWait
+
+logger = logging.getLogger(__name__)
+
+
+TRACKER_SCRIPT = """
+(() => {
+    if (window.__appNetwork) return;
+    const network = window.__appNetwork = {inflight: 0, lastChange: performance.now()};
+    const started = () => { network.inflight += 1; network.lastChange = performance.now(); };
+    const finished = () => { network.inflight = Math.max(0, network.inflight - 1); network.lastChange = performance.now(); };
+    const fetch = window.fetch;
+    if (fetch) {
+        window.fetch = function () {
+            started();
+            return fetch.apply(this, arguments).finally(finished);
+        };
+    }
+    const send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        started();
+        this.addEventListener('loadend', finished, {once: true});
+        return send.apply(this, arguments);
+    };
+})();
+"""
+
+READY_SCRIPT = """
+const [rootSelector, readySelector, settleMs] = arguments;
+if (document.readyState === 'loading') return false;
+const root = document.querySelector(rootSelector);
+if (!root || root.childElementCount === 0) return false;
+if (readySelector && !document.querySelector(readySelector)) return false;
+const network = window.__appNetwork;
+return !network || (network.inflight === 0 && performance.now() - network.lastChange >= settleMs);
+"""
+
+
+def install_tracker(driver: WebDriver) -> bool:
+    """Inject fetch/XHR tracker into every new document (Chromium only)"""
+    if not hasattr(driver, "execute_cdp_cmd"):
+        return False
+    driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": TRACKER_SCRIPT})
+    return True
+
+
+def wait_until_ready(
+    driver: WebDriver,
+    root_selector: str = "#root",
+    ready_selector: str = None,
+    settle_ms: float = 100,
+    timeout: float = 10,
+    poll_frequency: float = 0.05
+) -> bool:
+    """
+    Wait until the app is mounted, network settled and ready selector matches.
+    
+    Returns:
+        True if ready, False on timeout (callers continue with their own waits)
+    """
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=poll_frequency).until(
+            lambda d: d.execute_script(READY_SCRIPT, root_selector, ready_selector, settle_ms)
+        )
+        return True
+    except TimeoutException:
+        logger.warning(
+            f"App not ready after {timeout:.1f}s at {driver.current_url} "
+            f"(root {root_selector}, ready selector {ready_selector}) - continuing"
+        )
+        return False
@@ -4,8 +4,9 @@ Reusable across any web testing project.
 """
 
 import os
+import warnings
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional
 
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
@@ -16,15 +17,131 @@ from selenium.webdriver.remote.webdriver import WebDriver
 from webdriver_manager.chrome import ChromeDriverManager
 from webdriver_manager.firefox import GeckoDriverManager
 
+from infra.app_readiness import install_tracker
+from infra.command_profiler import get_command_profiler
 from infra.config_provider import ConfigProvider
+from infra.emulation import EmulationProfile, apply_profile, forget, get_profile
+from infra import request_blocking
+from infra.web_vitals import get_vitals_recorder, install_observer
+
+
+# Active window per WebDriver session (saves a round trip per page object call)
+_active_windows: Dict[str, str] = {}
+
+
+def activate_window(driver: WebDriver, window_handle: Optional[str]):
+    """Switch driver to window unless it is already active"""
+    if window_handle is None or _active_windows.get(driver.session_id) == window_handle:
+        return
+    driver.switch_to.window(window_handle)
+    _active_windows[driver.session_id] = window_handle
+
+
+def forget_windows(driver: WebDriver):
+    """Drop active window state of a closed driver"""
+    _active_windows.pop(getattr(driver, "session_id", None), None)
+
+
+class BrowserContext:
+    """
+    Isolated browser context (own cookies, localStorage, cache) in a shared Chrome.
+    Created by BrowserWrapper.new_context(); bound to its own window handle.
+    """
+    
+    def __init__(
+        self,
+        browser: "BrowserWrapper",
+        context_id: str,
+        window_handle: str,
+        blocking: request_blocking.BlockingProfile = None
+    ):
+        self.browser = browser
+        self.driver = browser.driver
+        self.context_id = context_id
+        self.window_handle = window_handle
+        self.blocking = blocking or browser.blocking
+        self.blocked_stats: Optional[dict] = None
+    
+    def activate(self):
+        """Switch WebDriver to this context's window"""
+        activate_window(self.driver, self.window_handle)
+    
+    def stop(self):
+        """Dispose context (closes its windows, drops its storage)"""
+        if self.browser.driver is None or self.context_id is None:
+            return
+        try:
+            self.activate()
+            get_vitals_recorder().flush(self.driver)
+            # Performance log is shared by all contexts - drain it even if this context does not block
+            if self.browser.performance_log:
+                stats = request_blocking.blocked_requests(self.driver)
+                if self.blocking.active:
+                    self.blocked_stats = stats
+            forget(self.driver, self.window_handle)
+        except Exception:
+            pass
+        finally:
+            try:
+                activate_window(self.driver, self.browser.window_handle)
+                self.driver.execute_cdp_cmd("Target.disposeBrowserContext", {"browserContextId": self.context_id})
+            except Exception:
+                pass
+            self.context_id = None
+    
+    def take_screenshot(self, name: str = None) -> str:
+        """Take screenshot of this context's window and return path"""
+        self.activate()
+        return self.browser.take_screenshot(name)
+    
+    def get_current_url(self) -> str:
+        """Get current page URL"""
+        self.activate()
+        return self.driver.current_url
+    
+    def refresh(self):
+        """Refresh current page"""
+        self.activate()
+        self.driver.refresh()
+    
+    def clear_cookies(self):
+        """Clear all cookies"""
+        self.activate()
+        self.driver.delete_all_cookies()
+    
+    def clear_local_storage(self):
+        """Clear localStorage"""
+        self.activate()
+        self.driver.execute_script("window.localStorage.clear();")
+    
+    def clear_session_storage(self):
+        """Clear sessionStorage"""
+        self.activate()
+        self.driver.execute_script("window.sessionStorage.clear();")
 
 
 class BrowserWrapper:
     """WebDriver wrapper with automatic setup and teardown"""
     
-    def __init__(self):
+    def __init__(self, emulation: str = None, blocking: str = None):
+        """
+        Args:
+            emulation: throttling profile name (default: config 'emulation.profile')
+            blocking: request blocking profile name (default: config 'request_blocking.profile')
+        """
         self.config = ConfigProvider()
         self.driver: Optional[WebDriver] = None
+        profile_name = emulation or self.config.get("emulation.profile")
+        self.emulation: Optional[EmulationProfile] = (
+            get_profile(profile_name, self.config.get("emulation.profiles", {})) if profile_name else None
+        )
+        self.blocking = request_blocking.get_profile(
+            blocking or self.config.get("request_blocking.profile", "none"),
+            self.config.get("request_blocking.profiles", {})
+        )
+        self.blocked_stats: Optional[dict] = None
+        self.performance_log = False
+        self.window_handle: Optional[str] = None
         self._screenshots_dir = os.path.join(
             os.path.dirname(os.path.dirname(__file__)),
             "screenshots"
@@ -41,14 +158,103 @@ class BrowserWrapper:
         else:
             raise ValueError(f"Unsupported browser: {browser_type}")
         
-        self.driver.implicitly_wait(self.config.implicit_wait)
+        if get_command_profiler().enabled:
+            get_command_profiler().install(self.driver)
+        
+        scale = self.emulation.timeout_scale if self.emulation else 1
+        self.driver.implicitly_wait(self.config.implicit_wait * scale)
         self.driver.set_window_size(1920, 1080)
+        self.window_handle = self.driver.current_window_handle
+        _active_windows[self.driver.session_id] = self.window_handle
+        self._prepare_target(self.emulation)
         
         return self.driver
     
+    def _prepare_target(
+        self,
+        emulation: Optional[EmulationProfile],
+        window_handle: str = None,
+        blocking: request_blocking.BlockingProfile = None
+    ):
+        """Apply per-page CDP setup (blocking, throttling, injected scripts) to current window"""
+        if self.config.browser.lower() == "chrome":
+            request_blocking.apply_patterns(self.driver, blocking or self.blocking)
+        if emulation:
+            apply_profile(self.driver, emulation, window_handle)
+        if self.config.web_vitals.get("enabled", True):
+            install_observer(self.driver)
+        install_tracker(self.driver)
+    
+    # ==================== CONTEXTS ====================
+    
+    def new_context(self, emulation: str = None, blocking: str = None) -> BrowserContext:
+        """
+        Create isolated browser context with its own window (Chrome CDP Target domain).
+        Many contexts share this Chrome process instead of one process per test.
+        
+        Args:
+            emulation: throttling profile for the context (default: browser's profile)
+            blocking: request blocking profile for the context (default: browser's profile).
+                Its URL patterns apply per context; external host blocking is fixed
+                for the shared Chrome, a profile that differs there is warned about.
+        """
+        if not hasattr(self.driver, "execute_cdp_cmd"):
+            raise ValueError("Browser contexts require a Chromium browser (CDP)")
+        
+        blocking_profile = (
+            request_blocking.get_profile(blocking, self.config.get("request_blocking.profiles", {}))
+            if blocking else self.blocking
+        )
+        if blocking_profile.block_external != self.blocking.block_external:
+            warnings.warn(
+                f"Request blocking '{blocking_profile.name}': external hosts are "
+                f"{'blocked' if self.blocking.block_external else 'not blocked'} in the shared Chrome "
+                f"(profile '{self.blocking.name}'); only its URL patterns apply to this context"
+            )
+        
+        context = self.driver.execute_cdp_cmd("Target.createBrowserContext", {"disposeOnDetach": True})
+        context_id = context["browserContextId"]
+        # ChromeDriver window handles are CDP target IDs
+        target_id = self.driver.execute_cdp_cmd("Target.createTarget", {
+            "url": "about:blank",
+            "browserContextId": context_id,
+            "newWindow": True
+        })["targetId"]
+        activate_window(self.driver, target_id)
+        self.driver.set_window_size(1920, 1080)
+        
+        profile = (
+            get_profile(emulation, self.config.get("emulation.profiles", {})) if emulation else self.emulation
+        )
+        self._prepare_target(profile, target_id, blocking_profile)
+        return BrowserContext(self, context_id, target_id, blocking_profile)
+    
     def _create_chrome_driver(self) -> WebDriver:
         """Create Chrome WebDriver"""
         options = ChromeOptions()
+        options.page_load_strategy = self.config.page_load_strategy
+        
+        # Blocked requests are counted from the performance log (contexts may pick their own profile)
+        self.performance_log = self.blocking.active or self.config.get("browser_contexts.enabled", False)
+        if self.performance_log:
+            options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        rules = (
+            self.blocking.host_resolver_rules([self.config.base_url, self.config.api_url])
+            if self.blocking.active else ""
+        )
+        
+        # Attach to a shared Chrome started outside the test run (contexts isolate tests)
+        debugger_address = self.config.get("browser_contexts.debugger_address")
+        if debugger_address:
+            if rules:
+                # Command line flags of a running Chrome cannot be changed
+                warnings.warn(
+                    f"Request blocking '{self.blocking.name}': external hosts are NOT blocked in the "
+                    f"Chrome at {debugger_address} - start it with --host-resolver-rules=\"{rules}\""
+                )
+            options.debugger_address = debugger_address
+            service = ChromeService(ChromeDriverManager().install())
+            return webdriver.Chrome(service=service, options=options)
         
         if self.config.headless:
             options.add_argument("--headless=new")
@@ -63,12 +269,17 @@ class BrowserWrapper:
         # Suppress logging
         options.add_experimental_option("excludeSwitches", ["enable-logging"])
         
+        # Request blocking - fail fast on external hosts
+        if rules:
+            options.add_argument(f"--host-resolver-rules={rules}")
+        
         service = ChromeService(ChromeDriverManager().install())
         return webdriver.Chrome(service=service, options=options)
     
     def _create_firefox_driver(self) -> WebDriver:
         """Create Firefox WebDriver"""
         options = FirefoxOptions()
+        options.page_load_strategy = self.config.page_load_strategy
         
         if self.config.headless:
             options.add_argument("--headless")
@@ -80,10 +291,21 @@ class BrowserWrapper:
         """Close browser and cleanup"""
         if self.driver:
             try:
-                self.driver.quit()
+                # Finalize LCP/CLS of the last opened page
+                activate_window(self.driver, self.window_handle)
+                get_vitals_recorder().flush(self.driver)
+                forget(self.driver)
+                if self.blocking.active and self.performance_log:
+                    self.blocked_stats = request_blocking.blocked_requests(self.driver)
             except Exception:
                 pass
             finally:
+                # Bookkeeping is best effort - Chrome is quit even if it failed
+                try:
+                    self.driver.quit()
+                except Exception:
+                    pass
+                forget_windows(self.driver)
                 self.driver = None
     
     def take_screenshot(self, name: str = None) -> str:
@@ -0,0 +1,234 @@
+"""
+Catalog index - columnar in-memory product index for fast test data selection.
+Reusable across any e-commerce testing project.
+
+Ids, prices, stock and category codes live in NumPy arrays (one row per
+product), so filters (stock >= n, price range, category) are vectorized
+masks and sampling is a single rng.choice() over the matching rows - no
+refetch and no Python-level scan per selection. Candidate rows per filter
+are cached until the index changes.
+
+refresh() applies a new product list in place: changed rows are updated,
+new products appended, vanished products masked out - existing rows and
+the worker's "already taken" marks survive. Repeated ids in one list (offset
+pages shifted by concurrent inserts) are indexed once.
+"""
+
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+class CatalogIndex:
+    """Columnar product index with vectorized filters and sampling"""
+    
+    def __init__(
+        self,
+        products: Iterable[Dict] = None,
+        id_key: str = "_id",
+        seed: int = None
+    ):
+        """
+        Args:
+            products: initial product list (dicts with id, price, stock, category)
+            id_key: product id field
+            seed: random seed (None = nondeterministic)
+        """
+        self.id_key = id_key
+        self.rng = np.random.default_rng(seed)
+        self.products: List[Dict] = []
+        self.ids = np.empty(0, dtype=object)
+        self.prices = np.empty(0, dtype=np.float64)
+        self.stock = np.empty(0, dtype=np.int64)
+        self.categories = np.empty(0, dtype=np.int32)
+        self.alive = np.empty(0, dtype=bool)
+        self.taken = np.empty(0, dtype=bool)
+        self._rows: Dict[str, int] = {}
+        self._category_codes: Dict[Optional[str], int] = {}
+        self._candidates: Dict[Tuple, np.ndarray] = {}
+        self._cumulative: Dict[Tuple, np.ndarray] = {}
+        self.refreshed_at = 0.0
+        if products is not None:
+            self.refresh(products)
+    
+    def __len__(self) -> int:
+        return int(self.alive.sum())
+    
+    def __contains__(self, product_id: str) -> bool:
+        row = self._rows.get(product_id)
+        return row is not None and bool(self.alive[row])
+    
+    # ==================== LOADING ====================
+    
+    def _category_code(self, category) -> int:
+        if isinstance(category, dict):
+            category = category.get("name") or category.get("_id")
+        return self._category_codes.setdefault(category, len(self._category_codes))
+    
+    def refresh(self, products: Iterable[Dict]):
+        """Apply current product list: update changed rows, append new ones, mask removed ones"""
+        seen = np.zeros(len(self.products), dtype=bool)
+        new_products: List[Dict] = []
+        applied = set()
+        for product in products:
+            product_id = product.get(self.id_key)
+            # Offset pagination repeats products shifted by concurrent inserts - first copy wins
+            if product_id in applied:
+                continue
+            applied.add(product_id)
+            row = self._rows.get(product_id)
+            if row is None:
+                self._rows[product_id] = len(self.products) + len(new_products)
+                new_products.append(product)
+                continue
+            seen[row] = True
+            self.products[row] = product
+            self.prices[row] = product.get("price", 0) or 0
+            self.stock[row] = product.get("stock", 0) or 0
+            self.categories[row] = self._category_code(product.get("category"))
+        
+        if new_products:
+            count = len(new_products)
+            self.products.extend(new_products)
+            self.ids = np.concatenate([self.ids, np.array([p.get(self.id_key) for p in new_products], dtype=object)])
+            self.prices = np.concatenate([self.prices, np.array([p.get("price", 0) or 0 for p in new_products], dtype=np.float64)])
+            self.stock = np.concatenate([self.stock, np.array([p.get("stock", 0) or 0 for p in new_products], dtype=np.int64)])
+            self.categories = np.concatenate([
+                self.categories,
+                np.array([self._category_code(p.get("category")) for p in new_products], dtype=np.int32)
+            ])
+            self.taken = np.concatenate([self.taken, np.zeros(count, dtype=bool)])
+            seen = np.concatenate([seen, np.ones(count, dtype=bool)])
+        self.alive = seen
+        self._invalidate()
+        self.refreshed_at = time.monotonic()
+    
+    def row(self, product_id: str) -> Optional[int]:
+        """Row number of a product (None if never indexed)"""
+        return self._rows.get(product_id)
+    
+    def age(self) -> float:
+        """Seconds since last refresh"""
+        return time.monotonic() - self.refreshed_at
+    
+    def adjust_stock(self, product_id: str, delta: int):
+        """Track local stock change (e.g. an order placed by the test) until the next refresh"""
+        row = self._rows.get(product_id)
+        if row is not None:
+            self.stock[row] += delta
+            self._invalidate()
+    
+    def _invalidate(self):
+        self._candidates.clear()
+        self._cumulative.clear()
+    
+    # ==================== FILTERS ====================
+    
+    def mask(
+        self,
+        min_stock: int = None,
+        min_price: float = None,
+        max_price: float = None,
+        category: str = None
+    ) -> np.ndarray:
+        """Boolean row mask of live products matching all given filters"""
+        mask = self.alive.copy()
+        if min_stock is not None:
+            mask &= self.stock >= min_stock
+        if min_price is not None:
+            mask &= self.prices >= min_price
+        if max_price is not None:
+            mask &= self.prices <= max_price
+        if category is not None:
+            code = self._category_codes.get(category)
+            if code is None:
+                return np.zeros_like(mask)
+            mask &= self.categories == code
+        return mask
+    
+    def candidates(self, **filters) -> np.ndarray:
+        """Row numbers matching filters (cached until the index changes)"""
+        key = tuple(sorted(filters.items()))
+        rows = self._candidates.get(key)
+        if rows is None:
+            rows = self._candidates[key] = np.flatnonzero(self.mask(**filters))
+        return rows
+    
+    def filter(self, **filters) -> List[Dict]:
+        """Products matching filters (see mask())"""
+        return [self.products[row] for row in self.candidates(**filters)]
+    
+    # ==================== SAMPLING ====================
+    
+    def sample(
+        self,
+        count: int = 1,
+        weights: str = None,
+        exclusive: bool = False,
+        **filters
+    ) -> List[Dict]:
+        """
+        Random products matching filters.
+        
+        Args:
+            count: number of products (distinct within one call)
+            weights: None (uniform), "stock" or "price" - sampling probability proportional to the column
+            exclusive: without replacement across calls - products already taken by this
+                worker are skipped (marks are cleared once every match was taken)
+            **filters: min_stock, min_price, max_price, category
+        """
+        rows = self.candidates(**filters)
+        if exclusive and count == 1 and weights is None and len(rows):
+            # Few products are taken per worker - a couple of random probes usually hit a free one
+            for row in rows[self.rng.integers(len(rows), size=8)]:
+                if not self.taken[row]:
+                    self.taken[row] = True
+                    return [self.products[row]]
+        if exclusive:
+            free = rows[~self.taken[rows]]
+            if len(free) < count:
+                self.taken[rows] = False
+                free = rows
+            rows = free
+        if len(rows) == 0:
+            return []
+        count = min(count, len(rows))
+        
+        if weights is None:
+            # replace=False costs a permutation - only needed for several products
+            chosen = rows[self.rng.choice(len(rows), size=count, replace=count == 1)]
+        elif count == 1 and not exclusive:
+            # Cumulative weights cached per filter: one binary search per pick
+            key = (weights,) + tuple(sorted(filters.items()))
+            cumulative = self._cumulative.get(key)
+            if cumulative is None:
+                cumulative = self._cumulative[key] = np.cumsum(self._weights(weights, rows))
+            if cumulative[-1] <= 0:
+                chosen = rows[self.rng.integers(len(rows), size=1)]
+            else:
+                chosen = rows[[np.searchsorted(cumulative, self.rng.random() * cumulative[-1], side="right")]]
+        else:
+            column = self._weights(weights, rows)
+            total = column.sum()
+            probabilities = column / total if total > 0 and np.count_nonzero(column) >= count else None
+            chosen = rows[self.rng.choice(len(rows), size=count, replace=False, p=probabilities)]
+        if exclusive:
+            self.taken[chosen] = True
+        return [self.products[row] for row in chosen]
+    
+    def _weights(self, weights: str, rows: np.ndarray) -> np.ndarray:
+        column = {"stock": self.stock, "price": self.prices}[weights][rows]
+        return np.clip(column.astype(np.float64), 0, None)
+    
+    def choice(self, **kwargs) -> Optional[Dict]:
+        """One random product (see sample()), None if nothing matches"""
+        products = self.sample(1, **kwargs)
+        return products[0] if products else None
+    
+    def release(self, product_ids: Sequence[str]):
+        """Return products taken with exclusive=True"""
+        for product_id in product_ids:
+            row = self._rows.get(product_id)
+            if row is not None:
+                self.taken[row] = False
@@ -0,0 +1,167 @@
+"""
+WebDriver command profiler - which code issues the most WebDriver commands.
+Reusable across any web testing project.
+
+Wraps the driver's remote connection (command_executor.execute) and
+attributes every command - type, latency, request + response payload size -
+to the innermost page object method on the call stack (pushed by the page
+object layer) and to the current test.
+"""
+
+import json
+import threading
+import time
+from typing import Dict, List, Optional
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from infra.latency_recorder import get_recorder
+
+
+OUTSIDE_PAGE_OBJECTS = "<test/fixture code>"
+
+
+def _new_stats() -> Dict:
+    return {"commands": 0, "ms": 0.0, "bytes": 0, "by_command": {}}
+
+
+def _payload_size(value) -> int:
+    try:
+        return len(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return 0
+
+
+class CommandProfiler:
+    """Per page object method and per test WebDriver command statistics"""
+    
+    def __init__(self):
+        self.enabled = False
+        self._by_owner: Dict[str, Dict] = {}
+        self._by_test: Dict[str, Dict] = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+    
+    # ==================== ATTRIBUTION ====================
+    
+    def _stack(self) -> List[str]:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+    
+    def push(self, owner: str):
+        """Enter page object method (e.g. "CartPage.get_cart_items")"""
+        self._stack().append(owner)
+    
+    def pop(self):
+        """Leave page object method"""
+        stack = self._stack()
+        if stack:
+            stack.pop()
+    
+    @property
+    def owner(self) -> str:
+        stack = self._stack()
+        return stack[-1] if stack else OUTSIDE_PAGE_OBJECTS
+    
+    # ==================== RECORDING ====================
+    
+    def install(self, driver: WebDriver):
+        """Wrap driver's remote connection to record every command"""
+        executor = driver.command_executor
+        if getattr(executor, "_profiled", False):
+            return
+        original = executor.execute
+        profiler = self
+        
+        def execute(command, params):
+            started = time.perf_counter()
+            response = original(command, params)
+            if profiler.enabled:
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                size = _payload_size(params) + _payload_size(response.get("value") if response else None)
+                profiler.record(command, elapsed_ms, size)
+            return response
+        
+        executor.execute = execute
+        executor._profiled = True
+    
+    def record(self, command: str, elapsed_ms: float, size: int, test_id: str = None):
+        """Record one command for current owner and test"""
+        test_id = test_id or get_recorder().current_test or "<session>"
+        with self._lock:
+            for stats in (
+                self._by_owner.setdefault(self.owner, _new_stats()),
+                self._by_test.setdefault(test_id, _new_stats())
+            ):
+                stats["commands"] += 1
+                stats["ms"] += elapsed_ms
+                stats["bytes"] += size
+                stats["by_command"][command] = stats["by_command"].get(command, 0) + 1
+    
+    # ==================== REPORTING ====================
+    
+    def owners(self) -> Dict[str, Dict]:
+        with self._lock:
+            return {owner: dict(stats) for owner, stats in self._by_owner.items()}
+    
+    def tests(self) -> Dict[str, Dict]:
+        with self._lock:
+            return {test: dict(stats) for test, stats in self._by_test.items()}
+    
+    def report(self, top: int = 15) -> str:
+        """Top page object methods by command count and by time, top tests by count"""
+        owners = self.owners()
+        if not owners:
+            return ""
+        header = "{:<46} {:>9} {:>10} {:>8}  top commands"
+        lines = []
+        for title, key in (("By command count", "commands"), ("By time", "ms")):
+            lines.append(f"{title}:")
+            lines.append(header.format("page object method", "commands", "time ms", "KB"))
+            ranked = sorted(owners.items(), key=lambda item: item[1][key], reverse=True)[:top]
+            lines.extend(self._row(name, stats) for name, stats in ranked)
+            lines.append("")
+        lines.append("Tests by command count:")
+        lines.append(header.format("test", "commands", "time ms", "KB"))
+        ranked = sorted(self.tests().items(), key=lambda item: item[1]["commands"], reverse=True)[:top]
+        lines.extend(self._row(name, stats) for name, stats in ranked)
+        return "\n".join(lines)
+    
+    @staticmethod
+    def _row(name: str, stats: Dict) -> str:
+        commands = sorted(stats["by_command"].items(), key=lambda item: item[1], reverse=True)[:3]
+        top_commands = ", ".join(f"{command} x{count}" for command, count in commands)
+        label = name if len(name) <= 46 else "..." + name[-43:]
+        return (
+            f"{label:<46} {stats['commands']:>9} {stats['ms']:>10.1f} "
+            f"{stats['bytes'] / 1024:>8.1f}  {top_commands}"
+        )
+    
+    # ==================== XDIST ====================
+    
+    def export(self) -> Dict:
+        """Serializable statistics (e.g. to send from xdist worker to controller)"""
+        return {"owners": self.owners(), "tests": self.tests()}
+    
+    def merge(self, exported: Optional[Dict]):
+        """Merge statistics from export()"""
+        if not exported:
+            return
+        with self._lock:
+            for target, source in ((self._by_owner, exported["owners"]), (self._by_test, exported["tests"])):
+                for name, stats in source.items():
+                    merged = target.setdefault(name, _new_stats())
+                    merged["commands"] += stats["commands"]
+                    merged["ms"] += stats["ms"]
+                    merged["bytes"] += stats["bytes"]
+                    for command, count in stats["by_command"].items():
+                        merged["by_command"][command] = merged["by_command"].get(command, 0) + count
+
+
+_profiler = CommandProfiler()
+
+
+def get_command_profiler() -> CommandProfiler:
+    """Get process-wide WebDriver command profiler"""
+    return _profiler
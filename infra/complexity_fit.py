@@ -0,0 +1,161 @@
+"""
+Complexity fit - classify how a measured cost grows with input size.
+Reusable across any performance testing project.
+
+Each candidate model cost = a + b * f(n) is fitted by least squares (the
+intercept absorbs fixed per-request overhead, which otherwise makes small
+sizes look sub-linear):
+- O(1):       f(n) = 0
+- O(n):       f(n) = n
+- O(n log n): f(n) = n * log2(n)
+- O(n^2):     f(n) = n^2
+Models are tried from simplest to most complex and a more complex one wins
+only if it cuts the residual error by more than 'tolerance' - noise alone
+never promotes a linear endpoint to O(n^2). Growth smaller than 'min_growth'
+of the cost at the smallest size counts as O(1).
+"""
+
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+
+MODELS = ("O(1)", "O(n)", "O(n log n)", "O(n^2)")
+SUPER_LINEAR = ("O(n log n)", "O(n^2)")
+
+
+def model_terms(model: str, sizes: np.ndarray) -> np.ndarray:
+    """f(n) of a model"""
+    if model == "O(1)":
+        return np.zeros_like(sizes)
+    if model == "O(n)":
+        return sizes
+    if model == "O(n log n)":
+        return sizes * np.log2(np.maximum(sizes, 1))
+    if model == "O(n^2)":
+        return sizes ** 2
+    raise ValueError(f"Unknown complexity model: {model}. Available: {', '.join(MODELS)}")
+
+
+class ComplexityFit:
+    """Best model of cost vs size, with every model's fit"""
+    
+    def __init__(
+        self,
+        name: str,
+        sizes: np.ndarray,
+        values: np.ndarray,
+        model: str,
+        coefficients: Dict[str, tuple],
+        rss: Dict[str, float]
+    ):
+        self.name = name
+        self.sizes = sizes
+        self.values = values
+        self.model = model
+        self.coefficients = coefficients
+        self.rss = rss
+    
+    @property
+    def intercept(self) -> float:
+        return self.coefficients[self.model][0]
+    
+    @property
+    def slope(self) -> float:
+        """b of the best model (for O(n): cost per item)"""
+        return self.coefficients[self.model][1]
+    
+    @property
+    def per_item(self) -> float:
+        """Marginal cost per item of the linear fit"""
+        return self.coefficients["O(n)"][1]
+    
+    @property
+    def r2(self) -> float:
+        """Coefficient of determination of the best model"""
+        total = float(((self.values - self.values.mean()) ** 2).sum())
+        return 1.0 - self.rss[self.model] / total if total > 0 else 1.0
+    
+    @property
+    def exponent(self) -> float:
+        """Log-log growth exponent of the cost above the fixed overhead (1 = linear, 2 = quadratic)"""
+        if self.model == "O(1)":
+            return 0.0
+        marginal = self.values - self.intercept
+        positive = (marginal > 0) & (self.sizes > 0)
+        if np.count_nonzero(positive) < 2:
+            return 0.0
+        return float(np.polyfit(np.log(self.sizes[positive]), np.log(marginal[positive]), 1)[0])
+    
+    @property
+    def super_linear(self) -> bool:
+        return self.model in SUPER_LINEAR
+    
+    def predict(self, size: float) -> float:
+        """Cost at size according to the best model"""
+        intercept, slope = self.coefficients[self.model]
+        return float(intercept + slope * model_terms(self.model, np.array([size], dtype=np.float64))[0])
+
+
+def fit_complexity(
+    sizes: Sequence[float],
+    values: Sequence[float],
+    name: str = "",
+    tolerance: float = 0.25,
+    min_growth: float = 0.1
+) -> ComplexityFit:
+    """
+    Fit cost vs size to O(1), O(n), O(n log n) and O(n^2).
+    
+    Args:
+        sizes: input sizes (at least 3 distinct)
+        values: measured cost at each size (e.g. median latency ms, payload bytes)
+        name: label of the series
+        tolerance: relative residual reduction a more complex model needs to win
+        min_growth: growth over the size range (relative to the smallest size's cost) below which cost is O(1)
+    """
+    sizes = np.asarray(sizes, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    if len(np.unique(sizes)) < 3:
+        raise ValueError(f"Complexity fit needs at least 3 distinct sizes, got {len(np.unique(sizes))}")
+    
+    coefficients: Dict[str, tuple] = {}
+    rss: Dict[str, float] = {}
+    for model in MODELS:
+        terms = model_terms(model, sizes)
+        if not terms.any():
+            intercept, slope = float(values.mean()), 0.0
+        else:
+            design = np.column_stack([np.ones_like(sizes), terms])
+            (intercept, slope), *_ = np.linalg.lstsq(design, values, rcond=None)
+            if slope < 0:
+                # Cost falling with size is noise around a constant
+                intercept, slope = float(values.mean()), 0.0
+        residuals = values - (intercept + slope * terms)
+        coefficients[model] = (float(intercept), float(slope))
+        rss[model] = float((residuals ** 2).sum())
+    
+    best = MODELS[0]
+    growth = coefficients["O(n)"][1] * (sizes.max() - sizes.min())
+    baseline = abs(values[np.argmin(sizes)])
+    if baseline and growth < min_growth * baseline:
+        return ComplexityFit(name, sizes, values, best, coefficients, rss)
+    for model in MODELS[1:]:
+        if coefficients[model][1] > 0 and rss[model] < rss[best] * (1 - tolerance):
+            best = model
+    return ComplexityFit(name, sizes, values, best, coefficients, rss)
+
+
+def format_fits(fits: List[ComplexityFit], unit: str = "ms") -> str:
+    """Format fits as report lines"""
+    lines = [
+        f"{'series':<28} {'model':<11} {'r2':>6} {'exp':>5} {f'{unit}/item':>10} "
+        f"{'max n':>7} {f'{unit} at max':>12}"
+    ]
+    for fit in fits:
+        largest = int(np.argmax(fit.sizes))
+        lines.append(
+            f"{fit.name:<28} {fit.model:<11} {fit.r2:>6.3f} {fit.exponent:>5.2f} {fit.per_item:>10.4f} "
+            f"{int(fit.sizes[largest]):>7} {fit.values[largest]:>12.1f}"
+        )
+    return "\n".join(lines)
@@ -77,6 +77,11 @@ class ConfigProvider:
         """Browser type (chrome, firefox)"""
         return self._config.get("browser", "chrome")
     
+    @property
+    def page_load_strategy(self) -> str:
+        """WebDriver page load strategy (normal, eager, none)"""
+        return self._config.get("page_load_strategy", "normal")
+    
     @property
     def admin_email(self) -> str:
         """Admin email for tests"""
@@ -92,3 +97,18 @@ class ConfigProvider:
         """Code required to create an admin account"""
         return self._config.get("admin_creation_code", "")
 
+    
+    @property
+    def latency_budgets(self) -> dict:
+        """Latency budget settings (mode, warmup_samples, min_samples, routes)"""
+        return self._config.get("latency_budgets", {})
+    
+    @property
+    def results_store(self) -> dict:
+        """Results store settings (enabled, dir, alpha, min_effect, min_ratio, min_samples)"""
+        return self._config.get("results_store", {})
+    
+    @property
+    def web_vitals(self) -> dict:
+        """Web vitals settings (enabled, mode, min_samples, routes)"""
+        return self._config.get("web_vitals", {})
@@ -0,0 +1,265 @@
+"""
+Distributed load runner - fans an open-loop run out across worker processes.
+Reusable across any load testing project.
+
+Each worker process runs a shard of the arrival schedule with its own
+connection pool and streams compact latency histogram deltas back to the
+coordinator. The coordinator merges histograms exactly (bucket counts are
+summed, percentiles are never averaged) and logs a live aggregate.
+"""
+
+import logging
+import multiprocessing
+import queue
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from infra.latency_histogram import LatencyHistogram
+from infra.load_scheduler import ArrivalSchedule, OpenLoopScheduler
+
+logger = logging.getLogger(__name__)
+
+
+def _shard_schedule(schedule: ArrivalSchedule, workers: int, index: int) -> ArrivalSchedule:
+    """Split schedule rate evenly across workers"""
+    seed = None if schedule.seed is None else schedule.seed + index
+    steps = [(rps / workers, duration) for rps, duration in schedule.steps]
+    return ArrivalSchedule(schedule.kind, steps, seed=seed)
+
+
+def _worker_main(
+    index: int,
+    workers: int,
+    schedule: ArrivalSchedule,
+    operation_factory: Callable[[], Callable],
+    max_workers: int,
+    lag_threshold_ms: float,
+    start_at: float,
+    report_interval: float,
+    results: "multiprocessing.Queue"
+):
+    """Worker process entry point - runs one shard, streams deltas"""
+    try:
+        operation = operation_factory()
+    except Exception as e:
+        results.put({"type": "done", "worker": index, "error": f"{type(e).__name__}: {e}"})
+        return
+    
+    interval = LatencyHistogram()
+    counters = {"sent": 0, "errors": 0}
+    lock = threading.Lock()
+    finished = threading.Event()
+    
+    def _on_complete(offset: float, corrected_ms: float, error: Optional[BaseException]):
+        with lock:
+            counters["sent"] += 1
+            if error is None:
+                interval.record(corrected_ms)
+            else:
+                counters["errors"] += 1
+    
+    def _flush(message_type: str = "delta") -> Dict:
+        with lock:
+            message = {
+                "type": message_type,
+                "worker": index,
+                "histogram": interval.to_dict(),
+                "sent": counters["sent"],
+                "errors": counters["errors"]
+            }
+            interval.reset()
+            counters["sent"] = 0
+            counters["errors"] = 0
+        return message
+    
+    def _reporter():
+        while not finished.wait(report_interval):
+            results.put(_flush())
+    
+    delay = start_at - time.time()
+    if delay > 0:
+        time.sleep(delay)
+    
+    reporter = threading.Thread(target=_reporter, daemon=True)
+    reporter.start()
+    scheduler = OpenLoopScheduler(max_workers=max_workers, lag_threshold_ms=lag_threshold_ms)
+    result = scheduler.run(_shard_schedule(schedule, workers, index), operation, on_complete=_on_complete)
+    finished.set()
+    reporter.join()
+    
+    message = _flush("done")
+    message["summary"] = result.summary()
+    export = getattr(operation, "export_resources", None)
+    message["resources"] = export() if export else {}
+    results.put(message)
+
+
+class DistributedLoadResult:
+    """Merged outcome of a distributed run"""
+    
+    def __init__(self, schedule: ArrivalSchedule, workers: int):
+        self.schedule = schedule
+        self.workers = workers
+        self.corrected = LatencyHistogram()
+        self.sent = 0
+        self.errors = 0
+        self.elapsed = 0.0
+        self.worker_summaries: Dict[int, Dict] = {}
+        self.worker_errors: Dict[int, str] = {}
+        self.resources: List[Dict] = []
+    
+    @property
+    def achieved_rps(self) -> float:
+        """Sent requests per second across all workers"""
+        return self.sent / self.elapsed if self.elapsed else 0.0
+    
+    @property
+    def error_rate(self) -> float:
+        """Failed requests / sent requests"""
+        return self.errors / self.sent if self.sent else 0.0
+    
+    @property
+    def client_saturated(self) -> bool:
+        """True if any worker could not keep up with its shard"""
+        return any(
+            summary.get("client_saturated")
+            for summary in self.worker_summaries.values()
+        )
+    
+    def __str__(self) -> str:
+        p = self.corrected.percentiles((50, 99, 99.9))
+        text = (
+            f"{self.workers} workers, {self.sent} requests at {self.achieved_rps:.1f} rps, "
+            f"{self.errors} errors, p50 {p['p50']:.1f}ms / p99 {p['p99']:.1f}ms / p99.9 {p['p99.9']:.1f}ms"
+        )
+        if self.client_saturated:
+            text += " [CLIENT SATURATED - results under-state target load]"
+        return text
+
+
+class DistributedLoadRunner:
+    """Coordinator for multi-process open-loop runs"""
+    
+    def __init__(
+        self,
+        workers: int = None,
+        max_workers: int = 64,
+        lag_threshold_ms: float = 50.0,
+        report_interval: float = 1.0,
+        startup_delay: float = 2.0,
+        progress: Callable[[str], None] = None
+    ):
+        """
+        Args:
+            workers: number of worker processes (default: CPU count)
+            max_workers: max in-flight requests per worker process
+            lag_threshold_ms: per-worker saturation threshold
+            report_interval: seconds between histogram deltas / live lines
+            startup_delay: seconds reserved for worker start-up before the shared start
+            progress: callback for live aggregate lines (default: log at INFO)
+        """
+        self.workers = workers or multiprocessing.cpu_count()
+        self.max_workers = max_workers
+        self.lag_threshold_ms = lag_threshold_ms
+        self.report_interval = report_interval
+        self.startup_delay = startup_delay
+        self.progress = progress or logger.info
+    
+    def run(
+        self,
+        schedule: ArrivalSchedule,
+        operation_factory: Callable[[], Callable]
+    ) -> DistributedLoadResult:
+        """
+        Run schedule across worker processes.
+        
+        Args:
+            schedule: total arrival schedule (rate is split across workers)
+            operation_factory: PICKLABLE callable building the operation inside
+                each worker (e.g. functools.partial of a module-level function)
+        
+        Returns:
+            DistributedLoadResult with exactly merged histogram; workers that sent no
+            final result (crashed, or still running at the deadline) are in worker_errors
+        """
+        context = multiprocessing.get_context("spawn")
+        results = context.Queue()
+        start_at = time.time() + self.startup_delay
+        processes = [
+            context.Process(
+                target=_worker_main,
+                args=(
+                    index,
+                    self.workers,
+                    schedule,
+                    operation_factory,
+                    self.max_workers,
+                    self.lag_threshold_ms,
+                    start_at,
+                    self.report_interval,
+                    results
+                ),
+                daemon=True
+            )
+            for index in range(self.workers)
+        ]
+        for process in processes:
+            process.start()
+        
+        merged = DistributedLoadResult(schedule, self.workers)
+        live = LatencyHistogram()
+        done = set()
+        deadline = start_at + schedule.duration + self.startup_delay + 60
+        last_report = time.time()
+        
+        while len(done) < self.workers and time.time() < deadline:
+            try:
+                message = results.get(timeout=self.report_interval)
+            except queue.Empty:
+                if not any(process.is_alive() for process in processes):
+                    break
+                continue
+            
+            worker = message["worker"]
+            if "histogram" in message:
+                delta = LatencyHistogram.from_dict(message["histogram"])
+                merged.corrected.merge(delta)
+                live.merge(delta)
+                merged.sent += message["sent"]
+                merged.errors += message["errors"]
+            if message["type"] == "done":
+                done.add(worker)
+                if "error" in message:
+                    merged.worker_errors[worker] = message["error"]
+                merged.worker_summaries[worker] = message.get("summary", {})
+                if message.get("resources"):
+                    merged.resources.append(message["resources"])
+            
+            if time.time() - last_report >= self.report_interval:
+                self._report(merged, live, len(done), start_at)
+                live.reset()
+                last_report = time.time()
+        
+        merged.elapsed = max(0.0, time.time() - start_at)
+        for worker, process in enumerate(processes):
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+                if worker not in done:
+                    merged.worker_errors[worker] = "no result before deadline"
+            elif worker not in done:
+                merged.worker_errors[worker] = f"exited with code {process.exitcode} without a result"
+        self._report(merged, live, len(done), start_at)
+        return merged
+    
+    def _report(self, merged: DistributedLoadResult, live: LatencyHistogram, done: int, start_at: float):
+        """Print live aggregate line"""
+        elapsed = max(0.0, time.time() - start_at)
+        p = live.percentiles((50, 99))
+        total = merged.corrected.percentile(99)
+        self.progress(
+            f"[{elapsed:6.1f}s] workers done {done}/{self.workers} | sent {merged.sent} "
+            f"errors {merged.errors} | interval p50 {p['p50']:.1f}ms p99 {p['p99']:.1f}ms | "
+            f"total p99 {total:.1f}ms"
+        )
@@ -0,0 +1,125 @@
+"""
+Emulation - network and CPU throttling profiles via Chrome DevTools Protocol.
+Reusable across any web testing project.
+
+Network values follow the Chrome DevTools / Lighthouse presets:
+throughput in kbit/s, latency = added round-trip time in ms.
+"""
+
+from typing import Dict, Optional, Tuple
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+class EmulationProfile:
+    """Network conditions, CPU slowdown and matching wait timeout scale"""
+    
+    def __init__(
+        self,
+        name: str,
+        latency_ms: float = 0,
+        download_kbps: float = 0,
+        upload_kbps: float = 0,
+        cpu_rate: float = 1,
+        timeout_scale: float = 1
+    ):
+        """
+        Args:
+            name: profile name
+            latency_ms: added round-trip latency (0 = no network throttling)
+            download_kbps: download throughput (0 = unlimited)
+            upload_kbps: upload throughput (0 = unlimited)
+            cpu_rate: CPU slowdown factor (1 = no throttling)
+            timeout_scale: factor applied to UI wait timeouts
+        """
+        self.name = name
+        self.latency_ms = latency_ms
+        self.download_kbps = download_kbps
+        self.upload_kbps = upload_kbps
+        self.cpu_rate = cpu_rate
+        self.timeout_scale = timeout_scale
+    
+    @property
+    def throttles_network(self) -> bool:
+        return bool(self.latency_ms or self.download_kbps or self.upload_kbps)
+    
+    @classmethod
+    def from_dict(cls, name: str, data: Dict) -> "EmulationProfile":
+        """Build profile from config entry"""
+        return cls(name, **data)
+    
+    def __str__(self) -> str:
+        return (
+            f"{self.name} (rtt +{self.latency_ms:g}ms, down {self.download_kbps:g}kbps, "
+            f"up {self.upload_kbps:g}kbps, cpu {self.cpu_rate:g}x, timeouts x{self.timeout_scale:g})"
+        )
+
+
+PROFILES: Dict[str, EmulationProfile] = {
+    "fast-3g": EmulationProfile("fast-3g", latency_ms=562.5, download_kbps=1440, upload_kbps=675, timeout_scale=3),
+    "slow-4g": EmulationProfile("slow-4g", latency_ms=150, download_kbps=1600, upload_kbps=750, timeout_scale=2),
+    "4x-cpu": EmulationProfile("4x-cpu", cpu_rate=4, timeout_scale=2),
+    "mobile": EmulationProfile(
+        "mobile", latency_ms=150, download_kbps=1600, upload_kbps=750, cpu_rate=4, timeout_scale=3
+    )
+}
+
+# (session_id, window_handle or None) -> timeout scale
+_timeout_scales: Dict[Tuple[str, Optional[str]], float] = {}
+
+
+def get_profile(name: str, custom: Dict[str, Dict] = None) -> EmulationProfile:
+    """
+    Get profile by name.
+    
+    Args:
+        name: built-in or custom profile name
+        custom: {name: {latency_ms, download_kbps, ...}} profiles from config
+    """
+    if custom and name in custom:
+        return EmulationProfile.from_dict(name, custom[name])
+    if name not in PROFILES:
+        raise ValueError(f"Unknown emulation profile: {name}. Available: {sorted(set(PROFILES) | set(custom or {}))}")
+    return PROFILES[name]
+
+
+def apply_profile(driver: WebDriver, profile: EmulationProfile, window_handle: str = None):
+    """
+    Apply network and CPU throttling to driver's current window (Chromium only).
+    
+    Args:
+        window_handle: window the profile belongs to (None = whole driver)
+    """
+    if not hasattr(driver, "execute_cdp_cmd"):
+        raise ValueError(f"Emulation profile '{profile.name}' requires a Chromium browser (CDP)")
+    
+    if profile.throttles_network:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.emulateNetworkConditions", {
+            "offline": False,
+            "latency": profile.latency_ms,
+            # CDP expects bytes/s, -1 disables throttling
+            "downloadThroughput": profile.download_kbps * 1000 / 8 if profile.download_kbps else -1,
+            "uploadThroughput": profile.upload_kbps * 1000 / 8 if profile.upload_kbps else -1
+        })
+    if profile.cpu_rate != 1:
+        driver.execute_cdp_cmd("Emulation.setCPUThrottlingRate", {"rate": profile.cpu_rate})
+    
+    _timeout_scales[(driver.session_id, window_handle)] = profile.timeout_scale
+
+
+def timeout_scale(driver: WebDriver, window_handle: str = None) -> float:
+    """Get wait timeout factor for driver window (1 without emulation)"""
+    session_id = getattr(driver, "session_id", None)
+    return _timeout_scales.get((session_id, window_handle), _timeout_scales.get((session_id, None), 1.0))
+
+
+def forget(driver: WebDriver, window_handle: str = None):
+    """Drop emulation state of a closed driver (or one of its windows)"""
+    session_id = getattr(driver, "session_id", None)
+    if window_handle is not None:
+        _timeout_scales.pop((session_id, window_handle), None)
+        return
+    for key in [key for key in _timeout_scales if key[0] == session_id]:
+        _timeout_scales.pop(key)
+
@@ -0,0 +1,70 @@
+"""
+ETag cache - conditional GETs for API clients.
+Reusable across any API testing project.
+
+The first GET stores the response's ETag and parsed body; later GETs send
+If-None-Match and a 304 Not Modified reuses the stored body, so the server
+can skip serializing (and, with a cheap ETag, recomputing) the response.
+Responses without an ETag are never cached. Entries are kept per endpoint
+and token, as different users may see different data.
+"""
+
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from infra.api_wrapper import ApiWrapper
+
+
+class ETagCache:
+    """Thread-safe store of ETag + body per (endpoint, token)"""
+    
+    def __init__(self):
+        self._entries: Dict[Tuple[str, str], Tuple[str, Any]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, api: ApiWrapper, endpoint: str, token: str = None) -> Any:
+        """
+        GET endpoint, revalidating the cached body with If-None-Match.
+        
+        Returns:
+            parsed JSON (cached body on 304)
+        """
+        key = (endpoint, token or "")
+        with self._lock:
+            entry = self._entries.get(key)
+        headers = {"If-None-Match": entry[0]} if entry else None
+        
+        response = api.get(endpoint, token=token, headers=headers)
+        if response.status_code == 304 and entry:
+            with self._lock:
+                self.hits += 1
+            return entry[1]
+        response.raise_for_status()
+        
+        body = response.json()
+        etag = response.headers.get("ETag")
+        with self._lock:
+            self.misses += 1
+            if etag:
+                self._entries[key] = (etag, body)
+            else:
+                self._entries.pop(key, None)
+        return body
+    
+    def etag(self, endpoint: str, token: str = None) -> Optional[str]:
+        """Stored ETag of endpoint (None if its last response had none)"""
+        with self._lock:
+            entry = self._entries.get((endpoint, token or ""))
+        return entry[0] if entry else None
+    
+    def invalidate(self, endpoint: str = None):
+        """Drop cached entries (of one endpoint, or all)"""
+        with self._lock:
+            for key in [key for key in self._entries if endpoint is None or key[0] == endpoint]:
+                del self._entries[key]
+    
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
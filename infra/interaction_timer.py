@@ -0,0 +1,237 @@
+"""
+Interaction timer - user-perceived latency of UI interactions.
+Reusable across any web testing project.
+
+For one interaction (e.g. a click) these durations are measured:
+- event_ms: Event Timing duration of the click (input delay + handlers +
+  next paint, INP-like; None when below the 16ms reporting threshold)
+- dom_ms: click dispatch -> DOM reflects the change
+- visual_ms: click dispatch -> next paint after the DOM reflects the change
+  (async work such as API calls included)
+- backend_ms: click dispatch -> backend reflects the change (API polling,
+  resolution = poll interval + one request)
+
+All durations start at the browser's click event timestamp: for backend_ms it
+is mapped to the test's clock (performance.now() read between two
+perf_counter() calls), so page object waits and WebDriver round trips before
+the click are not counted as backend time.
+
+Each metric is also recorded as action "<name>.<metric>" in the latency
+recorder, so interactions take part in run-to-run comparison.
+"""
+
+import time
+from typing import Callable, Dict, List, Optional
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.ui import WebDriverWait
+
+from infra.latency_budget import percentile
+from infra.latency_recorder import get_recorder
+
+
+ARM_SCRIPT = """
+const condition = arguments[0];
+const state = window.__interaction = {clickAt: null, reflectedAt: null, paintAt: null, eventMs: null};
+const text = selector => {
+    const element = document.querySelector(selector);
+    return element ? element.textContent.trim() : null;
+};
+const initial = condition.selector ? text(condition.selector) : null;
+const satisfied = () => {
+    switch (condition.kind) {
+        case 'text': return text(condition.selector) === String(condition.value);
+        case 'text_changed': return text(condition.selector) !== initial;
+        case 'present': return document.querySelector(condition.selector) !== null;
+        case 'gone': return document.querySelector(condition.selector) === null;
+        case 'url_excludes': return !location.href.includes(condition.value);
+    }
+    return false;
+};
+const check = () => {
+    if (state.clickAt === null || state.reflectedAt !== null || !satisfied()) return;
+    state.reflectedAt = performance.now();
+    observer.disconnect();
+    // First frame rendered after the change
+    requestAnimationFrame(() => setTimeout(() => { state.paintAt = performance.now(); }, 0));
+};
+const observer = new MutationObserver(check);
+observer.observe(document, {subtree: true, childList: true, characterData: true, attributes: true});
+document.addEventListener('click', event => {
+    state.clickAt = event.timeStamp;
+    setTimeout(check, 0);
+}, {capture: true, once: true});
+try {
+    new PerformanceObserver(list => list.getEntries().forEach(entry => {
+        if (entry.name === 'click' && state.eventMs === null && entry.startTime >= state.clickAt - 1) {
+            state.eventMs = entry.duration;
+        }
+    })).observe({type: 'event', durationThreshold: 16});
+} catch (e) {}
+"""
+
+READ_SCRIPT = "return window.__interaction || null;"
+
+CLOCK_SCRIPT = "const state = window.__interaction; return [performance.now(), state ? state.clickAt : null];"
+
+
+def poll_until(predicate: Callable[[], bool], started: float, timeout: float, interval: float) -> Optional[float]:
+    """
+    Poll predicate until true.
+    
+    Returns:
+        ms from started (perf_counter) to first true result, None on timeout
+    """
+    deadline = started + timeout
+    while time.perf_counter() < deadline:
+        if predicate():
+            return (time.perf_counter() - started) * 1000
+        time.sleep(interval)
+    return None
+
+
+class InteractionResult:
+    """Durations of one interaction trial"""
+    
+    METRICS = ("event_ms", "visual_ms", "dom_ms", "backend_ms")
+    
+    def __init__(
+        self,
+        name: str,
+        event_ms: Optional[float],
+        visual_ms: Optional[float],
+        dom_ms: Optional[float],
+        backend_ms: Optional[float]
+    ):
+        self.name = name
+        self.event_ms = event_ms
+        self.visual_ms = visual_ms
+        self.dom_ms = dom_ms
+        self.backend_ms = backend_ms
+    
+    @property
+    def completed(self) -> bool:
+        """UI reflected the change within timeout"""
+        return self.visual_ms is not None
+    
+    def to_dict(self) -> Dict:
+        return {"name": self.name, **{metric: getattr(self, metric) for metric in self.METRICS}}
+
+
+class InteractionTimer:
+    """Measure click-to-paint and click-to-backend latency of interactions"""
+    
+    def __init__(self, driver: WebDriver, timeout: float = 10, poll_interval: float = 0.025):
+        """
+        Args:
+            driver: WebDriver with the page under test open
+            timeout: max seconds to wait for UI/backend to reflect the change
+            poll_interval: seconds between backend polls
+        """
+        self.driver = driver
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+    
+    def measure(
+        self,
+        name: str,
+        action: Callable[[], None],
+        condition: Dict,
+        backend_check: Callable[[], bool] = None
+    ) -> InteractionResult:
+        """
+        Run one interaction and measure it.
+        
+        Args:
+            name: interaction name (e.g. "cart_increase")
+            action: performs the click (e.g. page object method)
+            condition: DOM state that reflects the change:
+                {"kind": "text", "selector": css, "value": expected}
+                {"kind": "text_changed" | "present" | "gone", "selector": css}
+                {"kind": "url_excludes", "value": text}
+            backend_check: returns True once the API reflects the change
+        """
+        self.driver.execute_script(ARM_SCRIPT, condition)
+        started = time.perf_counter()
+        action()
+        clicked = self._click_time(started)
+        
+        backend_ms = None
+        if backend_check is not None:
+            backend_ms = poll_until(backend_check, clicked, self.timeout, self.poll_interval)
+        
+        remaining = max(0.5, self.timeout - (time.perf_counter() - clicked))
+        try:
+            state = WebDriverWait(self.driver, remaining, poll_frequency=0.05).until(self._painted)
+        except TimeoutException:
+            state = self.driver.execute_script(READ_SCRIPT) or {}
+        
+        click_at = state.get("clickAt")
+        
+        def since_click(key: str) -> Optional[float]:
+            value = state.get(key)
+            return value - click_at if value is not None and click_at is not None else None
+        
+        result = InteractionResult(
+            name,
+            event_ms=state.get("eventMs"),
+            visual_ms=since_click("paintAt"),
+            dom_ms=since_click("reflectedAt"),
+            backend_ms=backend_ms
+        )
+        recorder = get_recorder()
+        for metric in InteractionResult.METRICS:
+            if getattr(result, metric) is not None:
+                recorder.record_action(f"{name}.{metric}", getattr(result, metric))
+        return result
+    
+    def _click_time(self, started: float) -> float:
+        """perf_counter() time of the browser's click event (started if none was seen)"""
+        before = time.perf_counter()
+        now, click_at = self.driver.execute_script(CLOCK_SCRIPT)
+        after = time.perf_counter()
+        if click_at is None:
+            return started
+        return max(started, (before + after) / 2 - (now - click_at) / 1000)
+    
+    @staticmethod
+    def _painted(driver: WebDriver):
+        """Interaction state once the post-change frame was painted (False before)"""
+        state = driver.execute_script(READ_SCRIPT)
+        return state if state and state.get("paintAt") is not None else False
+
+
+def summarize(results: List[InteractionResult]) -> Dict[str, Dict[str, float]]:
+    """
+    Distribution of each metric over trials.
+    
+    Returns:
+        {metric: {"n", "p50", "p75", "p95", "max"}} (metrics without values omitted)
+    """
+    summary = {}
+    for metric in InteractionResult.METRICS:
+        values = [getattr(result, metric) for result in results if getattr(result, metric) is not None]
+        if values:
+            summary[metric] = {
+                "n": len(values),
+                "p50": percentile(values, 50),
+                "p75": percentile(values, 75),
+                "p95": percentile(values, 95),
+                "max": max(values)
+            }
+    return summary
+
+
+def format_summary(results: List[InteractionResult]) -> str:
+    """Format per-interaction distributions as report lines"""
+    names = sorted({result.name for result in results})
+    lines = [f"{'interaction':<22} {'metric':<11} {'n':>4} {'p50 ms':>9} {'p75 ms':>9} {'p95 ms':>9} {'max ms':>9}"]
+    for name in names:
+        summary = summarize([result for result in results if result.name == name])
+        for metric, stats in summary.items():
+            lines.append(
+                f"{name:<22} {metric:<11} {stats['n']:>4} {stats['p50']:>9.1f} "
+                f"{stats['p75']:>9.1f} {stats['p95']:>9.1f} {stats['max']:>9.1f}"
+            )
+    return "\n".join(lines)
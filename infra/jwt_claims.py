@@ -0,0 +1,134 @@
+"""
+JWT claims - local inspection of bearer tokens.
+Reusable across any API testing project.
+
+A JWT's payload (user id, role, expiry) is readable without a network call:
+it is the base64url JSON between the first and second dot. Claims are
+decoded WITHOUT verifying the signature - fine for a test client reading its
+own tokens, never for trusting a token - and cached per token.
+
+CachedToken keeps one login token (e.g. the config admin's) for the whole
+session and logs in again only when the token is about to expire, instead
+of logging in for every test.
+"""
+
+import base64
+import json
+import threading
+import time
+from functools import lru_cache
+from typing import Callable, Dict, Optional
+
+# Claim names used for the user id by common JWT issuers
+USER_ID_CLAIMS = ("id", "_id", "userId", "user_id", "sub")
+
+
+class TokenClaims:
+    """Decoded payload of one JWT"""
+    
+    __slots__ = ("claims",)
+    
+    def __init__(self, claims: Dict):
+        self.claims = claims
+    
+    def get(self, key: str, default=None):
+        return self.claims.get(key, default)
+    
+    @property
+    def user_id(self) -> Optional[str]:
+        for key in USER_ID_CLAIMS:
+            if self.claims.get(key):
+                return str(self.claims[key])
+        user = self.claims.get("user")
+        return (user.get("_id") or user.get("id")) if isinstance(user, dict) else None
+    
+    @property
+    def role(self) -> Optional[str]:
+        role = self.claims.get("role")
+        if role is None and self.claims.get("isAdmin") is not None:
+            role = "admin" if self.claims["isAdmin"] else "user"
+        return role
+    
+    @property
+    def expires_at(self) -> Optional[float]:
+        """Expiry as epoch seconds (None if the token does not expire)"""
+        exp = self.claims.get("exp")
+        return float(exp) if exp is not None else None
+    
+    @property
+    def issued_at(self) -> Optional[float]:
+        iat = self.claims.get("iat")
+        return float(iat) if iat is not None else None
+    
+    def expires_in(self, now: float = None) -> Optional[float]:
+        """Seconds until expiry (negative if expired, None if the token does not expire)"""
+        if self.expires_at is None:
+            return None
+        return self.expires_at - (time.time() if now is None else now)
+    
+    def is_expiring(self, margin: float = 60, now: float = None) -> bool:
+        """Expired or expiring within margin seconds"""
+        remaining = self.expires_in(now)
+        return remaining is not None and remaining <= margin
+
+
+def _b64url_decode(segment: str) -> bytes:
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+@lru_cache(maxsize=4096)
+def token_claims(token: str) -> TokenClaims:
+    """
+    Decode JWT payload without signature verification (cached per token).
+    
+    Raises:
+        ValueError if the token is not a JWT
+    """
+    parts = (token or "").split(".")
+    if len(parts) != 3:
+        raise ValueError("Token is not a JWT (expected header.payload.signature)")
+    try:
+        claims = json.loads(_b64url_decode(parts[1]))
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Token payload is not base64url JSON: {e}") from e
+    if not isinstance(claims, dict):
+        raise ValueError("Token payload is not a JSON object")
+    return TokenClaims(claims)
+
+
+class CachedToken:
+    """Login token reused until it is about to expire"""
+    
+    def __init__(self, login: Callable[[], str], margin: float = 60):
+        """
+        Args:
+            login: performs the login, returns the token
+            margin: log in again this many seconds before expiry
+        """
+        self.login = login
+        self.margin = margin
+        self.logins = 0
+        self._token: Optional[str] = None
+        self._lock = threading.Lock()
+    
+    def _valid(self, token: Optional[str]) -> bool:
+        if not token:
+            return False
+        try:
+            return not token_claims(token).is_expiring(self.margin)
+        except ValueError:
+            # Opaque token: expiry unknown, reuse it
+            return True
+    
+    def get(self) -> str:
+        """Cached token, logging in when there is none or it is expiring"""
+        with self._lock:
+            if not self._valid(self._token):
+                self._token = self.login()
+                self.logins += 1
+            return self._token
+    
+    def invalidate(self):
+        """Force a new login on next get() (e.g. after a 401)"""
+        with self._lock:
+            self._token = None
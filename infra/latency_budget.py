@@ -0,0 +1,125 @@
+"""
+Latency budgets - percentile SLOs evaluated against recorded samples.
+Reusable across any API testing project.
+"""
+
+import math
+from typing import Dict, List, Optional
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile (0-100) of values"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class BudgetResult:
+    """Outcome of one budget evaluation"""
+    
+    PASS = "PASS"
+    FAIL = "FAIL"
+    SKIP = "SKIP"
+    
+    def __init__(self, budget: "LatencyBudget", status: str, observed_ms: float, count: int):
+        self.budget = budget
+        self.status = status
+        self.observed_ms = observed_ms
+        self.count = count
+    
+    @property
+    def failed(self) -> bool:
+        return self.status == self.FAIL
+    
+    def __str__(self) -> str:
+        budget = self.budget
+        if self.status == self.SKIP:
+            detail = f"insufficient samples ({self.count} < {budget.min_samples})"
+        elif self.failed:
+            over = self.observed_ms - budget.limit_ms
+            detail = (
+                f"{self.observed_ms:.{budget.precision}f}{budget.unit} > {budget.limit_ms:g}{budget.unit} "
+                f"(+{over:.{budget.precision}f}{budget.unit}, +{over / budget.limit_ms:.1%})"
+            )
+        else:
+            detail = f"{self.observed_ms:.{budget.precision}f}{budget.unit} <= {budget.limit_ms:g}{budget.unit}"
+        return f"{self.status}  {budget.label:<28} p{budget.percentile:<5g} {detail:<42} n={self.count}"
+
+
+class LatencyBudget:
+    """Percentile budget for one route (or test duration)"""
+    
+    def __init__(
+        self,
+        route: Optional[str],
+        percentile: float,
+        limit_ms: float,
+        method: str = None,
+        min_samples: int = 1,
+        unit: str = "ms"
+    ):
+        """
+        Args:
+            route: route name (None for test duration budgets)
+            percentile: percentile 0-100
+            limit_ms: upper bound in ms (or in unit)
+            method: optional HTTP method filter
+            min_samples: evaluations with fewer samples are skipped
+            unit: unit of values, "" for unitless scores (e.g. CLS)
+        """
+        self.route = route
+        self.percentile = percentile
+        self.limit_ms = limit_ms
+        self.method = method.upper() if method else None
+        self.min_samples = min_samples
+        self.unit = unit
+    
+    @property
+    def precision(self) -> int:
+        """Decimals shown for observed values"""
+        return 1 if self.unit else 3
+    
+    @property
+    def label(self) -> str:
+        if self.route is None:
+            return "test duration"
+        return f"{self.method} {self.route}" if self.method else self.route
+    
+    @classmethod
+    def parse(
+        cls,
+        key: str,
+        limits: Dict[str, float],
+        min_samples: int = 1,
+        unit: str = "ms"
+    ) -> List["LatencyBudget"]:
+        """
+        Build budgets from config entry.
+        
+        Args:
+            key: "ROUTE" or "METHOD ROUTE" (e.g. "PRODUCT_SEARCH", "POST CART")
+            limits: {"p95": 150, "p99": 400}
+        """
+        parts = key.split()
+        method, route = (parts[0], parts[1]) if len(parts) == 2 else (None, parts[0])
+        return [
+            cls(route, float(name.lstrip("pP")), float(limit), method=method, min_samples=min_samples, unit=unit)
+            for name, limit in limits.items()
+        ]
+    
+    def evaluate(self, values: List[float]) -> BudgetResult:
+        """Evaluate budget against latency values (ms)"""
+        if len(values) < max(1, self.min_samples):
+            return BudgetResult(self, BudgetResult.SKIP, 0.0, len(values))
+        observed = percentile(values, self.percentile)
+        status = BudgetResult.FAIL if observed > self.limit_ms else BudgetResult.PASS
+        return BudgetResult(self, status, observed, len(values))
+
+
+def format_results(title: str, results: List[BudgetResult]) -> str:
+    """Format budget results as report lines"""
+    lines = [title]
+    lines.extend(f"  {result}" for result in results)
+    return "\n".join(lines)
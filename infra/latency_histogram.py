@@ -0,0 +1,184 @@
+"""
+Latency histogram - compact log-linear histogram for latency recording.
+Reusable across any load or performance testing project.
+
+Values are stored in microsecond buckets (HdrHistogram-style): exact below
+128us, then 64 linear sub-buckets per power of two (< 1.6% relative error).
+Histograms merge exactly by summing bucket counts, so percentiles of merged
+runs are never averaged.
+"""
+
+import math
+from typing import Dict, Iterable, Optional
+
+
+class LatencyHistogram:
+    """Sparse log-linear latency histogram with exact merging"""
+    
+    SUB_BUCKET_BITS = 7
+    SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+    SUB_BUCKET_HALF_BITS = SUB_BUCKET_BITS - 1
+    
+    def __init__(self):
+        self._counts: Dict[int, int] = {}
+        self.count = 0
+        self._sum_us = 0
+        self._min_us: Optional[int] = None
+        self._max_us: Optional[int] = None
+    
+    # ==================== BUCKETING ====================
+    
+    @classmethod
+    def _bucket_index(cls, value_us: int) -> int:
+        """Map microsecond value to bucket index"""
+        if value_us < cls.SUB_BUCKET_COUNT:
+            return value_us
+        shift = value_us.bit_length() - cls.SUB_BUCKET_BITS
+        return (shift << cls.SUB_BUCKET_HALF_BITS) + (value_us >> shift)
+    
+    @classmethod
+    def _bucket_upper(cls, index: int) -> int:
+        """Highest microsecond value equivalent to bucket index"""
+        if index < cls.SUB_BUCKET_COUNT:
+            return index
+        shift = (index >> cls.SUB_BUCKET_HALF_BITS) - 1
+        mantissa = index - (shift << cls.SUB_BUCKET_HALF_BITS)
+        return ((mantissa + 1) << shift) - 1
+    
+    # ==================== RECORDING ====================
+    
+    def record(self, value_ms: float, count: int = 1):
+        """Record latency value in milliseconds"""
+        value_us = max(0, int(round(value_ms * 1000)))
+        index = self._bucket_index(value_us)
+        self._counts[index] = self._counts.get(index, 0) + count
+        self.count += count
+        self._sum_us += value_us * count
+        if self._min_us is None or value_us < self._min_us:
+            self._min_us = value_us
+        if self._max_us is None or value_us > self._max_us:
+            self._max_us = value_us
+    
+    def record_corrected(self, value_ms: float, expected_interval_ms: float):
+        """
+        Record value with coordinated-omission correction.
+        
+        For closed-loop measurements: when a response took longer than the
+        expected interval between requests, back-fill the samples the
+        stalled client never sent (value - interval, value - 2*interval, ...).
+        """
+        self.record(value_ms)
+        if expected_interval_ms <= 0:
+            return
+        missing = value_ms - expected_interval_ms
+        while missing >= expected_interval_ms:
+            self.record(missing)
+            missing -= expected_interval_ms
+    
+    def record_all(self, values_ms: Iterable[float]):
+        """Record several values in milliseconds"""
+        for value in values_ms:
+            self.record(value)
+    
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        """Merge another histogram into this one (exact)"""
+        for index, count in other._counts.items():
+            self._counts[index] = self._counts.get(index, 0) + count
+        self.count += other.count
+        self._sum_us += other._sum_us
+        if other._min_us is not None:
+            if self._min_us is None or other._min_us < self._min_us:
+                self._min_us = other._min_us
+        if other._max_us is not None:
+            if self._max_us is None or other._max_us > self._max_us:
+                self._max_us = other._max_us
+        return self
+    
+    def reset(self):
+        """Drop all recorded values"""
+        self._counts.clear()
+        self.count = 0
+        self._sum_us = 0
+        self._min_us = None
+        self._max_us = None
+    
+    # ==================== STATISTICS ====================
+    
+    @property
+    def min(self) -> float:
+        """Minimum recorded value in ms"""
+        return (self._min_us or 0) / 1000
+    
+    @property
+    def max(self) -> float:
+        """Maximum recorded value in ms"""
+        return (self._max_us or 0) / 1000
+    
+    @property
+    def mean(self) -> float:
+        """Mean recorded value in ms"""
+        if not self.count:
+            return 0.0
+        return self._sum_us / self.count / 1000
+    
+    def percentile(self, percentile: float) -> float:
+        """
+        Get value at percentile (0-100) in ms.
+        
+        Returns the highest value equivalent to the bucket holding the
+        requested rank, capped by the recorded maximum.
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(percentile / 100 * self.count))
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= rank:
+                return min(self._bucket_upper(index), self._max_us) / 1000
+        return self.max
+    
+    def percentiles(self, percentiles: Iterable[float] = (50, 90, 95, 99, 99.9)) -> Dict[str, float]:
+        """Get several percentiles as {"p50": ms, ...}"""
+        return {
+            f"p{p:g}": self.percentile(p)
+            for p in percentiles
+        }
+    
+    def summary(self) -> Dict[str, float]:
+        """Get count, min, mean, max and common percentiles"""
+        data = {
+            "count": self.count,
+            "min": self.min,
+            "mean": round(self.mean, 3),
+            "max": self.max
+        }
+        data.update(self.percentiles())
+        return data
+    
+    # ==================== SERIALIZATION ====================
+    
+    def to_dict(self) -> Dict:
+        """Compact serializable form (for streaming between processes)"""
+        return {
+            "counts": dict(self._counts),
+            "count": self.count,
+            "sum_us": self._sum_us,
+            "min_us": self._min_us,
+            "max_us": self._max_us
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "LatencyHistogram":
+        """Restore histogram from to_dict() output"""
+        histogram = cls()
+        histogram._counts = {int(k): v for k, v in data.get("counts", {}).items()}
+        histogram.count = data.get("count", 0)
+        histogram._sum_us = data.get("sum_us", 0)
+        histogram._min_us = data.get("min_us")
+        histogram._max_us = data.get("max_us")
+        return histogram
+    
+    def copy(self) -> "LatencyHistogram":
+        """Get independent copy"""
+        return LatencyHistogram.from_dict(self.to_dict())
@@ -0,0 +1,212 @@
+"""
+Latency recorder - collects per-route latency samples during a test run.
+Reusable across any API testing project.
+
+ApiWrapper records every request here. Samples are keyed by route name,
+resolved from concrete paths (e.g. /api/products/123) back to endpoint
+templates (e.g. PRODUCT_BY_ID = /api/products/{id}). Page objects record
+action timings (e.g. CartPage.open) by name. With network timing enabled,
+requests also carry their connect/TTFB/download/server breakdown.
+"""
+
+import re
+import threading
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from infra.network_timing import NetworkTiming
+
+
+class RouteResolver:
+    """Resolve concrete request paths to named endpoint templates"""
+    
+    def __init__(self, endpoints: Dict[str, str] = None):
+        self._routes: List[Tuple[str, "re.Pattern", int]] = []
+        self._cache: Dict[str, Optional[str]] = {}
+        if endpoints:
+            self.register(endpoints)
+    
+    @classmethod
+    def from_class(cls, endpoints_class) -> "RouteResolver":
+        """Build resolver from class with NAME = "/path/{param}" attributes"""
+        return cls({
+            name: value
+            for name, value in vars(endpoints_class).items()
+            if name.isupper() and isinstance(value, str)
+        })
+    
+    def register(self, endpoints: Dict[str, str]):
+        """Register {name: template} routes"""
+        for name, template in endpoints.items():
+            pattern = re.escape(template)
+            pattern = re.sub(r"\\{[^}]+\\}", "[^/]+", pattern)
+            self._routes.append((name, re.compile(f"^{pattern}$"), template.count("{")))
+        # Literal routes win over parameterized ones (/api/cart/clear vs /api/cart/{id})
+        self._routes.sort(key=lambda route: route[2])
+        self._cache.clear()
+    
+    def resolve(self, endpoint: str) -> Optional[str]:
+        """Get route name for endpoint path or URL (None if unknown)"""
+        path = urlparse(endpoint).path if endpoint.startswith("http") else endpoint.split("?", 1)[0]
+        if path not in self._cache:
+            self._cache[path] = next(
+                (name for name, pattern, _ in self._routes if pattern.match(path)),
+                None
+            )
+        return self._cache[path]
+
+
+class LatencySample:
+    """One recorded request"""
+    
+    __slots__ = ("route", "method", "elapsed_ms", "status", "test_id", "warmup")
+    
+    def __init__(self, route: str, method: str, elapsed_ms: float, status: int, test_id: str, warmup: bool):
+        self.route = route
+        self.method = method
+        self.elapsed_ms = elapsed_ms
+        self.status = status
+        self.test_id = test_id
+        self.warmup = warmup
+    
+    def to_list(self) -> list:
+        """Compact serializable form"""
+        return [self.route, self.method, self.elapsed_ms, self.status, self.test_id, self.warmup]
+
+
+class LatencyRecorder:
+    """Process-wide store of request latency samples"""
+    
+    def __init__(self, resolver: RouteResolver = None, warmup_samples: int = 0):
+        """
+        Args:
+            resolver: maps request paths to route names
+            warmup_samples: first N samples per route are flagged as warm-up
+        """
+        self.resolver = resolver or RouteResolver()
+        self.warmup_samples = warmup_samples
+        self.current_test: Optional[str] = None
+        self._samples: List[LatencySample] = []
+        self._per_route: Dict[str, int] = {}
+        self._actions: Dict[str, List[float]] = {}
+        self._network: Dict[Tuple[str, str], List[NetworkTiming]] = {}
+        self._lock = threading.Lock()
+    
+    def record(
+        self,
+        method: str,
+        endpoint: str,
+        elapsed_ms: float,
+        status: int = 0,
+        timing: Optional[NetworkTiming] = None
+    ):
+        """Record request latency (and its network breakdown, if measured)"""
+        route = self.resolver.resolve(endpoint) or endpoint.split("?", 1)[0]
+        with self._lock:
+            seen = self._per_route.get(route, 0)
+            self._per_route[route] = seen + 1
+            self._samples.append(LatencySample(
+                route, method.upper(), elapsed_ms, status,
+                self.current_test, seen < self.warmup_samples
+            ))
+            if timing is not None and seen >= self.warmup_samples:
+                self._network.setdefault((method.upper(), route), []).append(timing)
+    
+    def record_action(self, name: str, elapsed_ms: float):
+        """Record named action timing (e.g. page object method)"""
+        with self._lock:
+            self._actions.setdefault(name, []).append(elapsed_ms)
+    
+    def samples(
+        self,
+        route: str = None,
+        method: str = None,
+        test_id: str = None,
+        include_warmup: bool = False
+    ) -> List[float]:
+        """Get latency values (ms) matching filters"""
+        with self._lock:
+            samples = list(self._samples)
+        return [
+            sample.elapsed_ms
+            for sample in samples
+            if (route is None or sample.route == route)
+            and (method is None or sample.method == method.upper())
+            and (test_id is None or sample.test_id == test_id)
+            and (include_warmup or not sample.warmup)
+        ]
+    
+    def routes(self) -> List[Tuple[str, str]]:
+        """Get recorded (method, route) pairs"""
+        with self._lock:
+            return sorted({(sample.method, sample.route) for sample in self._samples})
+    
+    def actions(self) -> Dict[str, List[float]]:
+        """Get action timings {name: [ms, ...]}"""
+        with self._lock:
+            return {name: list(values) for name, values in self._actions.items()}
+    
+    def network(self) -> Dict[Tuple[str, str], List[NetworkTiming]]:
+        """Get non-warm-up network breakdowns {(method, route): [timing, ...]}"""
+        with self._lock:
+            return {key: list(timings) for key, timings in self._network.items()}
+    
+    def network_metrics(self) -> Dict[str, List[float]]:
+        """Get network breakdown values grouped by "METHOD ROUTE.field" (e.g. "GET PRODUCTS.ttfb_ms")"""
+        metrics: Dict[str, List[float]] = {}
+        for (method, route), timings in self.network().items():
+            for field in NetworkTiming.FIELDS:
+                values = [getattr(timing, field) for timing in timings if getattr(timing, field) is not None]
+                if values:
+                    metrics[f"{method} {route}.{field}"] = values
+        return metrics
+    
+    def endpoint_metrics(self) -> Dict[str, List[float]]:
+        """Get non-warm-up latencies grouped by "METHOD ROUTE" """
+        metrics: Dict[str, List[float]] = {}
+        with self._lock:
+            for sample in self._samples:
+                if not sample.warmup:
+                    metrics.setdefault(f"{sample.method} {sample.route}", []).append(sample.elapsed_ms)
+        return metrics
+    
+    def export(self) -> Dict:
+        """Serializable samples (e.g. to send from xdist worker to controller)"""
+        with self._lock:
+            return {
+                "requests": [sample.to_list() for sample in self._samples],
+                "actions": {name: list(values) for name, values in self._actions.items()},
+                "network": [
+                    [method, route, [timing.to_list() for timing in timings]]
+                    for (method, route), timings in self._network.items()
+                ]
+            }
+    
+    def merge(self, exported: Dict):
+        """Merge samples from export()"""
+        with self._lock:
+            for route, method, elapsed_ms, status, test_id, warmup in exported.get("requests", []):
+                self._samples.append(LatencySample(route, method, elapsed_ms, status, test_id, warmup))
+                self._per_route[route] = self._per_route.get(route, 0) + 1
+            for name, values in exported.get("actions", {}).items():
+                self._actions.setdefault(name, []).extend(values)
+            for method, route, timings in exported.get("network", []):
+                self._network.setdefault((method, route), []).extend(
+                    NetworkTiming.from_list(values) for values in timings
+                )
+    
+    def clear(self):
+        """Drop all samples"""
+        with self._lock:
+            self._samples.clear()
+            self._per_route.clear()
+            self._actions.clear()
+            self._network.clear()
+
+
+_recorder = LatencyRecorder()
+
+
+def get_recorder() -> LatencyRecorder:
+    """Get process-wide latency recorder"""
+    return _recorder
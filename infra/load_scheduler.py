@@ -0,0 +1,226 @@
+"""
+Open-loop load scheduler - issues requests at a target arrival rate.
+Reusable across any load testing project.
+
+Unlike closed-loop virtual users, the scheduler never waits for a response
+before sending the next request. Latency is measured from the INTENDED send
+time, so server slowness (and client queueing) shows up in the percentiles
+instead of silently lowering the request rate (coordinated omission).
+"""
+
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from infra.latency_histogram import LatencyHistogram
+
+
+class ArrivalSchedule:
+    """Intended send times (seconds from start) for an open-loop run"""
+    
+    def __init__(self, kind: str, steps: List[Tuple[float, float]], seed: int = None):
+        """
+        Args:
+            kind: constant, step or poisson
+            steps: list of (rps, duration_seconds)
+            seed: random seed for poisson arrivals
+        """
+        self.kind = kind
+        self.steps = steps
+        self.seed = seed
+    
+    @classmethod
+    def constant(cls, rps: float, duration: float) -> "ArrivalSchedule":
+        """Evenly spaced arrivals at fixed rate"""
+        return cls("constant", [(rps, duration)])
+    
+    @classmethod
+    def step(cls, steps: List[Tuple[float, float]]) -> "ArrivalSchedule":
+        """Evenly spaced arrivals, rate changes at each step"""
+        return cls("step", list(steps))
+    
+    @classmethod
+    def poisson(cls, rps: float, duration: float, seed: int = None) -> "ArrivalSchedule":
+        """Random arrivals with exponential inter-arrival times"""
+        return cls("poisson", [(rps, duration)], seed=seed)
+    
+    @property
+    def duration(self) -> float:
+        """Total schedule duration in seconds"""
+        return sum(duration for _, duration in self.steps)
+    
+    @property
+    def expected_count(self) -> int:
+        """Expected number of arrivals"""
+        return int(sum(rps * duration for rps, duration in self.steps))
+    
+    def rate_at(self, offset: float) -> float:
+        """Target rate at offset seconds from start"""
+        start = 0.0
+        for rps, duration in self.steps:
+            if offset < start + duration:
+                return rps
+            start += duration
+        return self.steps[-1][0] if self.steps else 0.0
+    
+    def __iter__(self) -> Iterator[float]:
+        rng = random.Random(self.seed)
+        start = 0.0
+        for rps, duration in self.steps:
+            end = start + duration
+            if rps > 0:
+                if self.kind == "poisson":
+                    offset = start + rng.expovariate(rps)
+                    while offset < end:
+                        yield offset
+                        offset += rng.expovariate(rps)
+                else:
+                    for i in range(int(rps * duration)):
+                        yield start + i / rps
+            start = end
+
+
+class LoadResult:
+    """Outcome of one open-loop run"""
+    
+    def __init__(self, schedule: ArrivalSchedule):
+        self.schedule = schedule
+        # Latency from intended send time (coordinated-omission corrected)
+        self.corrected = LatencyHistogram()
+        # Latency from actual send time (what a closed-loop tool would report)
+        self.uncorrected = LatencyHistogram()
+        # How late each request left the client
+        self.send_lag = LatencyHistogram()
+        self.errors: Dict[str, int] = {}
+        self.sent = 0
+        self.elapsed = 0.0
+        self.max_dispatch_lag_ms = 0.0
+        self.lag_threshold_ms = 0.0
+    
+    @property
+    def succeeded(self) -> int:
+        """Number of successful requests"""
+        return self.corrected.count
+    
+    @property
+    def error_count(self) -> int:
+        """Number of failed requests"""
+        return sum(self.errors.values())
+    
+    @property
+    def error_rate(self) -> float:
+        """Failed requests / sent requests"""
+        return self.error_count / self.sent if self.sent else 0.0
+    
+    @property
+    def achieved_rps(self) -> float:
+        """Sent requests per second"""
+        return self.sent / self.elapsed if self.elapsed else 0.0
+    
+    @property
+    def client_saturated(self) -> bool:
+        """
+        True if the load generator itself could not keep up.
+        Results of a saturated run under-state the target rate.
+        """
+        return self.send_lag.percentile(99) > self.lag_threshold_ms \
+            or self.max_dispatch_lag_ms > self.lag_threshold_ms
+    
+    def summary(self) -> Dict[str, Any]:
+        """Serializable summary of the run"""
+        return {
+            "schedule": self.schedule.kind,
+            "target_rps": round(self.schedule.expected_count / self.schedule.duration, 2)
+            if self.schedule.duration else 0.0,
+            "achieved_rps": round(self.achieved_rps, 2),
+            "sent": self.sent,
+            "errors": dict(self.errors),
+            "error_rate": round(self.error_rate, 4),
+            "client_saturated": self.client_saturated,
+            "corrected_ms": self.corrected.summary(),
+            "uncorrected_ms": self.uncorrected.summary(),
+            "send_lag_ms": self.send_lag.summary()
+        }
+    
+    def __str__(self) -> str:
+        corrected = self.corrected.percentiles((50, 99))
+        uncorrected = self.uncorrected.percentiles((50, 99))
+        text = (
+            f"{self.sent} requests at {self.achieved_rps:.1f} rps, "
+            f"{self.error_count} errors, "
+            f"p50 {corrected['p50']:.1f}ms / p99 {corrected['p99']:.1f}ms "
+            f"(uncorrected p50 {uncorrected['p50']:.1f}ms / p99 {uncorrected['p99']:.1f}ms)"
+        )
+        if self.client_saturated:
+            text += " [CLIENT SATURATED - results under-state target load]"
+        return text
+
+
+class OpenLoopScheduler:
+    """Fire operations at scheduled times without waiting for responses"""
+    
+    def __init__(self, max_workers: int = 64, lag_threshold_ms: float = 50.0):
+        """
+        Args:
+            max_workers: max concurrent in-flight operations
+            lag_threshold_ms: send lag (p99) above which the client is flagged as saturated
+        """
+        self.max_workers = max_workers
+        self.lag_threshold_ms = lag_threshold_ms
+    
+    def run(
+        self,
+        schedule: ArrivalSchedule,
+        operation: Callable[[], Any],
+        on_complete: Optional[Callable[[float, float, Optional[BaseException]], None]] = None
+    ) -> LoadResult:
+        """
+        Run operation according to schedule.
+        
+        Args:
+            schedule: arrival schedule
+            operation: callable issuing one request (exceptions count as errors)
+            on_complete: optional callback(intended_offset, corrected_ms, error)
+        
+        Returns:
+            LoadResult with corrected and uncorrected histograms
+        """
+        result = LoadResult(schedule)
+        result.lag_threshold_ms = self.lag_threshold_ms
+        lock = threading.Lock()
+        
+        def _execute(intended: float, start: float):
+            sent_at = time.perf_counter()
+            error = None
+            try:
+                operation()
+            except Exception as e:
+                error = e
+            finished = time.perf_counter()
+            corrected_ms = (finished - intended) * 1000
+            with lock:
+                result.send_lag.record((sent_at - intended) * 1000)
+                if error is None:
+                    result.corrected.record(corrected_ms)
+                    result.uncorrected.record((finished - sent_at) * 1000)
+                else:
+                    name = type(error).__name__
+                    result.errors[name] = result.errors.get(name, 0) + 1
+            if on_complete:
+                on_complete(intended - start, corrected_ms, error)
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            start = time.perf_counter()
+            for offset in schedule:
+                intended = start + offset
+                delay = intended - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    result.max_dispatch_lag_ms = max(result.max_dispatch_lag_ms, -delay * 1000)
+                executor.submit(_execute, intended, start)
+                result.sent += 1
+        result.elapsed = time.perf_counter() - start
+        return result
@@ -0,0 +1,193 @@
+"""
+Network timing - per-request breakdown of HTTP latency for requests sessions.
+Reusable across any API testing project.
+
+A transport adapter swaps urllib3's connection classes for timed ones, which
+mark (per thread) when a new connection was opened and when the request was
+sent and the response headers arrived. Each request then splits into:
+- connect_ms:  DNS + TCP (+ TLS) of a new connection, 0 if the pooled connection was reused
+- ttfb_ms:     request sent -> first response byte (network round trip + server)
+- download_ms: headers -> body read
+- client_ms:   the rest (request prep, pool checkout, upload, decoding)
+and, when the server sends a Server-Timing header:
+- server_ms:   server's own processing time ("total" entry, else sum of entries)
+- network_ms:  ttfb_ms - server_ms
+
+Many new connections (low reuse) with high connect_ms point at connection
+churn (pooling); growing server_ms points at the backend.
+"""
+
+import re
+import threading
+import time
+from typing import Dict, List, Optional
+
+from requests import Response
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from infra.latency_budget import percentile
+
+
+_marks = threading.local()
+
+
+def _mark(name: str, value: float):
+    setattr(_marks, name, value)
+
+
+# ==================== TIMED CONNECTIONS ====================
+
+class _TimedConnectionMixin:
+    """Record connect duration and request/response timestamps of the calling thread"""
+    
+    def connect(self):
+        started = time.perf_counter()
+        super().connect()
+        _mark("connect_ms", getattr(_marks, "connect_ms", 0.0) + (time.perf_counter() - started) * 1000)
+    
+    def getresponse(self, *args, **kwargs):
+        _mark("sent_at", time.perf_counter())
+        response = super().getresponse(*args, **kwargs)
+        _mark("headers_at", time.perf_counter())
+        return response
+
+
+class _TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class TimingAdapter(HTTPAdapter):
+    """HTTPAdapter whose connections record network timing marks"""
+    
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool
+        }
+
+
+# ==================== TIMING ====================
+
+SERVER_TIMING_DURATION = re.compile(r"(?:^|;)\s*dur\s*=\s*\"?([0-9.]+)\"?", re.IGNORECASE)
+
+
+def parse_server_timing(header: Optional[str]) -> Dict[str, float]:
+    """
+    Parse Server-Timing header into {metric: duration ms}.
+    
+    Example:
+        'db;dur=53, app;desc="Render";dur=47.2, cache' -> {"db": 53.0, "app": 47.2}
+    """
+    durations: Dict[str, float] = {}
+    if not header:
+        return durations
+    for entry in header.split(","):
+        name, _, params = entry.partition(";")
+        match = SERVER_TIMING_DURATION.search(params)
+        if name.strip() and match:
+            durations[name.strip()] = durations.get(name.strip(), 0.0) + float(match.group(1))
+    return durations
+
+
+class NetworkTiming:
+    """Network breakdown of one request"""
+    
+    __slots__ = ("connect_ms", "ttfb_ms", "download_ms", "client_ms", "server_ms", "network_ms", "size", "new_connection")
+    
+    FIELDS = ("connect_ms", "ttfb_ms", "download_ms", "client_ms", "server_ms", "network_ms", "size")
+    
+    def __init__(
+        self,
+        connect_ms: float,
+        ttfb_ms: float,
+        download_ms: float,
+        client_ms: float,
+        server_ms: Optional[float],
+        size: int,
+        new_connection: bool
+    ):
+        self.connect_ms = connect_ms
+        self.ttfb_ms = ttfb_ms
+        self.download_ms = download_ms
+        self.client_ms = client_ms
+        self.server_ms = server_ms
+        self.network_ms = max(ttfb_ms - server_ms, 0.0) if server_ms is not None else None
+        self.size = size
+        self.new_connection = new_connection
+    
+    def to_list(self) -> list:
+        """Compact serializable form"""
+        return [
+            self.connect_ms, self.ttfb_ms, self.download_ms, self.client_ms,
+            self.server_ms, self.size, self.new_connection
+        ]
+    
+    @classmethod
+    def from_list(cls, values: list) -> "NetworkTiming":
+        return cls(*values)
+
+
+def start_timing():
+    """Reset timing marks of the calling thread (call right before sending)"""
+    _marks.connect_ms = 0.0
+    _marks.sent_at = None
+    _marks.headers_at = None
+
+
+def finish_timing(response: Response, started: float, finished: float) -> Optional[NetworkTiming]:
+    """
+    Build timing of the request sent since start_timing().
+    
+    Args:
+        response: received response (body already read)
+        started: perf_counter() before sending
+        finished: perf_counter() after the body was read
+    Returns:
+        None if the request did not go through a TimingAdapter
+    """
+    sent_at = getattr(_marks, "sent_at", None)
+    headers_at = getattr(_marks, "headers_at", None)
+    if sent_at is None or headers_at is None:
+        return None
+    connect_ms = _marks.connect_ms
+    ttfb_ms = (headers_at - sent_at) * 1000
+    download_ms = max((finished - headers_at) * 1000, 0.0)
+    total_ms = (finished - started) * 1000
+    server = parse_server_timing(response.headers.get("Server-Timing"))
+    server_ms = server.get("total", sum(server.values())) if server else None
+    return NetworkTiming(
+        connect_ms=connect_ms,
+        ttfb_ms=ttfb_ms,
+        download_ms=download_ms,
+        client_ms=max(total_ms - connect_ms - ttfb_ms - download_ms, 0.0),
+        server_ms=server_ms,
+        size=len(response.content),
+        new_connection=connect_ms > 0
+    )
+
+
+def summarize(timings: List[NetworkTiming]) -> Dict[str, Optional[float]]:
+    """Medians of each field plus connection reuse ratio"""
+    summary: Dict[str, Optional[float]] = {"n": len(timings)}
+    for field in NetworkTiming.FIELDS:
+        values = [getattr(timing, field) for timing in timings if getattr(timing, field) is not None]
+        summary[field] = percentile(values, 50) if values else None
+    summary["reuse"] = (
+        sum(not timing.new_connection for timing in timings) / len(timings) if timings else None
+    )
+    return summary
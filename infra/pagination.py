@@ -0,0 +1,248 @@
+"""
+Pagination - bounded-memory iteration over large API lists.
+Reusable across any API testing project.
+
+Two paths:
+- iter_pages(): walks page/limit pagination, optionally fetching the next N
+  pages concurrently while the caller consumes the current one; stops at the
+  first short page (or at the total page count, when the API reports it)
+- iter_json_array(): parses a streamed response holding one huge JSON array
+  (or an array under a top-level key, e.g. {"users": [...]}) element by
+  element, so only one element and one network chunk are in memory
+"""
+
+import codecs
+import json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterator, List, Optional
+
+from requests import Response
+
+
+PageFetcher = Callable[[int, int], Any]
+
+# Page count fields reported by common pagination formats
+TOTAL_PAGES_KEYS = ("totalPages", "pages", "total_pages")
+
+# What may follow an array element ("" = end of the complete response)
+_VALUE_END = ("", ",", "]", " ", "\t", "\r", "\n")
+
+
+def page_items(result: Any, key: str = None) -> List:
+    """Items of one page (bare list, or list under key in an object)"""
+    if isinstance(result, list):
+        return result
+    return result.get(key, []) if key else []
+
+
+def total_pages(result: Any) -> Optional[int]:
+    """Total page count, if the page reports it"""
+    if isinstance(result, dict):
+        for key in TOTAL_PAGES_KEYS:
+            if isinstance(result.get(key), int):
+                return result[key]
+        pagination = result.get("pagination")
+        if isinstance(pagination, dict):
+            return total_pages(pagination)
+    return None
+
+
+def iter_pages(
+    fetch_page: PageFetcher,
+    limit: int = 100,
+    key: str = None,
+    prefetch: int = 0,
+    start_page: int = 1,
+    max_pages: int = None
+) -> Iterator[Any]:
+    """
+    Iterate items over all pages.
+    
+    Args:
+        fetch_page: fetch_page(page, limit) -> page response (list or object)
+        limit: page size
+        key: items key in page object (e.g. "products")
+        prefetch: pages fetched ahead concurrently (0 = sequential)
+        start_page: first page number
+        max_pages: stop after this many pages
+    """
+    last_page = start_page + max_pages - 1 if max_pages else None
+    first_item: List = []
+    
+    def repeated(page: int, items: List) -> bool:
+        """Endpoint ignoring page/limit returns the first page again"""
+        if page == start_page:
+            first_item[:] = items[:1]
+            return False
+        return bool(items) and items[:1] == first_item
+    
+    if prefetch <= 0:
+        page = start_page
+        while last_page is None or page <= last_page:
+            result = fetch_page(page, limit)
+            items = page_items(result, key)
+            if repeated(page, items):
+                return
+            yield from items
+            total = total_pages(result)
+            if len(items) < limit or (total is not None and page >= total):
+                return
+            page += 1
+        return
+    
+    with ThreadPoolExecutor(max_workers=prefetch) as executor:
+        pending = deque()
+        next_page = start_page
+        
+        def schedule():
+            nonlocal next_page
+            while len(pending) <= prefetch and (last_page is None or next_page <= last_page):
+                pending.append((next_page, executor.submit(fetch_page, next_page, limit)))
+                next_page += 1
+        
+        schedule()
+        try:
+            while pending:
+                page, future = pending.popleft()
+                result = future.result()
+                items = page_items(result, key)
+                if repeated(page, items):
+                    return
+                total = total_pages(result)
+                if total is not None:
+                    last_page = min(last_page or total, total)
+                finished = len(items) < limit or (last_page is not None and page >= last_page)
+                if not finished:
+                    schedule()
+                yield from items
+                if finished:
+                    return
+        finally:
+            for _, future in pending:
+                future.cancel()
+
+
+def _array_start(text: str, key: Optional[str]) -> int:
+    """Index after the opening bracket of the streamed array (-1 if not buffered yet)"""
+    if key is None:
+        stripped = text.lstrip()
+        if not stripped:
+            return -1
+        if stripped[0] != "[":
+            raise ValueError("Response is not a JSON array")
+        return len(text) - len(stripped) + 1
+    if text.lstrip().startswith("["):
+        return _array_start(text, None)
+    
+    # Top-level key of an object response ({"users": [...]}): walk the depth-1
+    # keys, skipping other keys' values whole (nested keys and strings never match)
+    decoder = json.JSONDecoder()
+    position = _skip_space(text, 0)
+    if position >= len(text):
+        return -1
+    if text[position] != "{":
+        raise ValueError("Response is not a JSON array or object")
+    position += 1
+    while True:
+        position = _skip_space(text, position)
+        if position >= len(text):
+            return -1
+        if text[position] == "}":
+            raise ValueError(f"Response has no array under key '{key}'")
+        try:
+            name, position = decoder.raw_decode(text, position)
+        except ValueError:
+            return -1
+        position = _skip_space(text, position)
+        if position >= len(text):
+            return -1
+        if text[position] != ":":
+            raise ValueError("Invalid JSON object")
+        position = _skip_space(text, position + 1)
+        if position >= len(text):
+            return -1
+        if name == key:
+            if text[position] != "[":
+                raise ValueError(f"Response key '{key}' is not a JSON array")
+            return position + 1
+        try:
+            _, position = decoder.raw_decode(text, position)
+        except ValueError:
+            return -1
+        # A value is complete once its separator arrived (numbers may be cut at the chunk end)
+        position = _skip_space(text, position)
+        if position >= len(text):
+            return -1
+        if text[position] == ",":
+            position += 1
+        elif text[position] != "}":
+            raise ValueError("Invalid JSON object")
+
+
+def _skip_space(text: str, position: int) -> int:
+    while position < len(text) and text[position] in " \t\r\n":
+        position += 1
+    return position
+
+
+def iter_json_array(response: Response, key: str = None, chunk_size: int = 65536) -> Iterator[Any]:
+    """
+    Parse elements of a streamed JSON array incrementally.
+    
+    Args:
+        response: response of a request sent with stream=True
+        key: array key when the response is an object (a bare array response is also accepted)
+        chunk_size: network read size in bytes
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")()
+    chunks = response.iter_content(chunk_size)
+    buffer = ""
+    position = -1
+    done = False
+    
+    def read() -> bool:
+        nonlocal buffer
+        chunk = next(chunks, None)
+        buffer += text_decoder.decode(chunk or b"", final=chunk is None)
+        return chunk is not None
+    
+    try:
+        while position < 0:
+            more = read()
+            position = _array_start(buffer, key)
+            if position < 0 and not more:
+                if buffer.strip():
+                    raise ValueError(f"Response has no array under key '{key}'")
+                return
+        
+        while True:
+            # Skip separators between elements
+            while position < len(buffer) and buffer[position] in " \t\r\n,":
+                position += 1
+            if position >= len(buffer):
+                if done:
+                    raise ValueError("Invalid or truncated JSON array")
+                done = not read()
+                continue
+            if buffer[position] == "]":
+                return
+            try:
+                element, end = decoder.raw_decode(buffer, position)
+            except ValueError:
+                element, end = None, None
+            # A number may be cut at the chunk end (12|3, 1|.5): a complete value is followed by a separator
+            complete = end is not None and (end < len(buffer) or done) and buffer[end:end + 1] in _VALUE_END
+            if not complete:
+                if done:
+                    raise ValueError("Invalid or truncated JSON array")
+                done = not read()
+                continue
+            yield element
+            position = end
+            if position > chunk_size:
+                buffer = buffer[position:]
+                position = 0
+    finally:
+        response.close()
@@ -0,0 +1,281 @@
+"""
+Performance comparison - run-to-run regression detection.
+Reusable across any performance testing project.
+
+Compares a candidate run against a baseline (one or more pooled runs) from
+the results store. Every metric (endpoint latency, test duration, page
+action timing) is tested with Mann-Whitney U, sized with Cliff's delta and a
+bootstrap CI of the median ratio, and flagged only when the change is both
+significant and large enough to matter.
+
+Metrics stored once per run (a test's duration) have too few candidate
+values for Mann-Whitney U. Pool several baseline runs (--baseline RUN_A RUN_B
+or --baseline-last N) and the candidate's median is compared against the
+bootstrap CI of the pooled baseline median instead.
+
+Usage:
+    python -m infra.perf_compare --baseline baseline --candidate latest
+    python -m infra.perf_compare --baseline previous --candidate latest --out perf_report
+    python -m infra.perf_compare --baseline-last 10 --candidate latest
+    python -m infra.perf_compare --set-baseline latest
+"""
+
+import argparse
+import html
+import os
+import sys
+from typing import Dict, List
+
+import numpy as np
+
+from infra.config_provider import ConfigProvider
+from infra.perf_stats import bootstrap_ci, bootstrap_ratio_ci, effect_size_label, mann_whitney_u
+from infra.results_store import ResultsStore
+
+
+class Comparison:
+    """Comparison of one metric between baseline and candidate"""
+    
+    REGRESSION = "REGRESSION"
+    IMPROVEMENT = "improvement"
+    UNCHANGED = "ok"
+    INSUFFICIENT = "insufficient samples"
+    
+    def __init__(self, category: str, key: str, baseline: List[float], candidate: List[float]):
+        self.category = category
+        self.key = key
+        self.baseline_count = len(baseline)
+        self.candidate_count = len(candidate)
+        self.baseline_median = float(np.median(baseline)) if baseline else 0.0
+        self.candidate_median = float(np.median(candidate)) if candidate else 0.0
+        self.p_value = 1.0
+        self.cliffs_delta = 0.0
+        self.ratio = {"ratio": 1.0, "low": 1.0, "high": 1.0}
+        self.verdict = self.INSUFFICIENT
+    
+    @property
+    def effect(self) -> str:
+        return effect_size_label(self.cliffs_delta)
+    
+    def to_row(self) -> List[str]:
+        """Report table row"""
+        return [
+            self.verdict,
+            self.category,
+            self.key,
+            f"{self.baseline_count} / {self.candidate_count}",
+            f"{self.baseline_median:.1f}",
+            f"{self.candidate_median:.1f}",
+            f"{self.ratio['ratio']:.2f}x [{self.ratio['low']:.2f}, {self.ratio['high']:.2f}]",
+            f"{self.p_value:.4f}",
+            f"{self.cliffs_delta:+.2f} ({self.effect})"
+        ]
+
+
+HEADERS = [
+    "verdict", "category", "metric", "n (base / cand)", "base median ms",
+    "cand median ms", "median ratio [95% CI]", "p-value", "Cliff's delta"
+]
+
+
+def _pool(runs: List[Dict]) -> Dict[str, Dict[str, List[float]]]:
+    """Pool metrics of several runs"""
+    pooled: Dict[str, Dict[str, List[float]]] = {}
+    for run in runs:
+        for category, metrics in run.get("metrics", {}).items():
+            for key, values in metrics.items():
+                pooled.setdefault(category, {}).setdefault(key, []).extend(values)
+    return pooled
+
+
+def _compare_to_baseline(
+    comparison: Comparison,
+    base_values: List[float],
+    cand_values: List[float],
+    min_effect: float,
+    min_ratio: float
+):
+    """
+    Few candidate values: candidate median vs bootstrap CI of the pooled baseline median.
+    p_value is the empirical two-sided tail of the candidate in the baseline (reported, not gated:
+    it cannot get below alpha without hundreds of baseline runs).
+    """
+    value = float(np.median(cand_values))
+    base = np.asarray(base_values, dtype=float)
+    median = bootstrap_ci(base)
+    slower = (np.count_nonzero(base >= value) + 1) / (len(base) + 1)
+    faster = (np.count_nonzero(base <= value) + 1) / (len(base) + 1)
+    comparison.p_value = min(1.0, 2 * min(slower, faster))
+    comparison.cliffs_delta = mann_whitney_u(base, [value])["cliffs_delta"]
+    comparison.ratio = {
+        "ratio": value / max(median["value"], 1e-9),
+        "low": value / max(median["high"], 1e-9),
+        "high": value / max(median["low"], 1e-9)
+    }
+    if comparison.cliffs_delta >= min_effect and comparison.ratio["low"] >= min_ratio:
+        comparison.verdict = Comparison.REGRESSION
+    elif comparison.cliffs_delta <= -min_effect and comparison.ratio["high"] <= 1 / min_ratio:
+        comparison.verdict = Comparison.IMPROVEMENT
+    else:
+        comparison.verdict = Comparison.UNCHANGED
+
+
+def compare_runs(
+    baseline_runs: List[Dict],
+    candidate_run: Dict,
+    alpha: float = 0.01,
+    min_effect: float = 0.147,
+    min_ratio: float = 1.1,
+    min_samples: int = 5
+) -> List[Comparison]:
+    """
+    Compare candidate run against pooled baseline runs.
+    
+    Args:
+        alpha: significance level for Mann-Whitney U
+        min_effect: min |Cliff's delta| to flag a change
+        min_ratio: min median ratio (and CI lower bound) to flag a regression
+        min_samples: min samples on each side to test a metric; with fewer candidate
+            samples (one test duration per run) but enough pooled baseline samples, the
+            candidate median is compared against the baseline median's bootstrap CI
+    
+    Returns:
+        comparisons sorted with regressions first
+    """
+    baseline = _pool(baseline_runs)
+    candidate = _pool([candidate_run])
+    comparisons = []
+    
+    for category in sorted(set(baseline) | set(candidate)):
+        keys = set(baseline.get(category, {})) & set(candidate.get(category, {}))
+        for key in sorted(keys):
+            base_values = baseline[category][key]
+            cand_values = candidate[category][key]
+            comparison = Comparison(category, key, base_values, cand_values)
+            comparisons.append(comparison)
+            if len(base_values) < min_samples or not cand_values:
+                continue
+            if len(cand_values) < min_samples:
+                _compare_to_baseline(comparison, base_values, cand_values, min_effect, min_ratio)
+                continue
+            
+            test = mann_whitney_u(base_values, cand_values)
+            comparison.p_value = test["p_value"]
+            comparison.cliffs_delta = test["cliffs_delta"]
+            comparison.ratio = bootstrap_ratio_ci(base_values, cand_values)
+            
+            significant = comparison.p_value < alpha and abs(comparison.cliffs_delta) >= min_effect
+            if significant and comparison.cliffs_delta > 0 and comparison.ratio["low"] >= min_ratio:
+                comparison.verdict = Comparison.REGRESSION
+            elif significant and comparison.cliffs_delta < 0 and comparison.ratio["high"] <= 1 / min_ratio:
+                comparison.verdict = Comparison.IMPROVEMENT
+            else:
+                comparison.verdict = Comparison.UNCHANGED
+    
+    order = {Comparison.REGRESSION: 0, Comparison.IMPROVEMENT: 1, Comparison.UNCHANGED: 2, Comparison.INSUFFICIENT: 3}
+    return sorted(comparisons, key=lambda c: (order[c.verdict], -c.cliffs_delta))
+
+
+# ==================== REPORTS ====================
+
+def render_markdown(title: str, comparisons: List[Comparison]) -> str:
+    """Render comparison as markdown table"""
+    regressions = sum(1 for c in comparisons if c.verdict == Comparison.REGRESSION)
+    lines = [
+        f"# {title}",
+        "",
+        f"**{regressions} regression(s)** in {len(comparisons)} compared metrics.",
+        "",
+        "| " + " | ".join(HEADERS) + " |",
+        "|" + "---|" * len(HEADERS)
+    ]
+    for comparison in comparisons:
+        lines.append("| " + " | ".join(comparison.to_row()) + " |")
+    return "\n".join(lines) + "\n"
+
+
+def render_html(title: str, comparisons: List[Comparison]) -> str:
+    """Render comparison as standalone HTML page"""
+    regressions = sum(1 for c in comparisons if c.verdict == Comparison.REGRESSION)
+    rows = []
+    for comparison in comparisons:
+        css = "regression" if comparison.verdict == Comparison.REGRESSION else ""
+        cells = "".join(f"<td>{html.escape(cell)}</td>" for cell in comparison.to_row())
+        rows.append(f'<tr class="{css}">{cells}</tr>')
+    header = "".join(f"<th>{html.escape(h)}</th>" for h in HEADERS)
+    return f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{html.escape(title)}</title>
+<style>
+body {{ font-family: sans-serif; font-size: 13px; }}
+table {{ border-collapse: collapse; }}
+th, td {{ border: 1px solid #ccc; padding: 3px 6px; text-align: left; }}
+tr.regression {{ background: #fdd; }}
+</style></head><body>
+<h1>{html.escape(title)}</h1>
+<p><b>{regressions} regression(s)</b> in {len(comparisons)} compared metrics.</p>
+<table><tr>{header}</tr>
+{chr(10).join(rows)}
+</table></body></html>
+"""
+
+
+def main(argv: List[str] = None) -> int:
+    """Compare runs from the command line, return exit code (1 on regression)"""
+    config = ConfigProvider()
+    project_root = os.path.dirname(os.path.dirname(__file__))
+    settings = config.results_store
+    
+    parser = argparse.ArgumentParser(description="Compare performance runs")
+    parser.add_argument("--store", default=os.path.join(project_root, settings.get("dir", "results")))
+    parser.add_argument("--baseline", nargs="+", default=["baseline"], help="run ids / baseline names (pooled)")
+    parser.add_argument("--baseline-last", type=int, metavar="N", help="pool the N runs before the candidate instead")
+    parser.add_argument("--candidate", default="latest")
+    parser.add_argument("--set-baseline", metavar="RUN", help="pin RUN as 'baseline' and exit")
+    parser.add_argument("--out", default=os.path.join(project_root, "perf_report"), help="report path without extension")
+    parser.add_argument("--alpha", type=float, default=settings.get("alpha", 0.01))
+    parser.add_argument("--min-effect", type=float, default=settings.get("min_effect", 0.147))
+    parser.add_argument("--min-ratio", type=float, default=settings.get("min_ratio", 1.1))
+    parser.add_argument("--min-samples", type=int, default=settings.get("min_samples", 5))
+    args = parser.parse_args(argv)
+    
+    store = ResultsStore(args.store)
+    if args.set_baseline:
+        print(f"Baseline set to {store.set_baseline(args.set_baseline)}")
+        return 0
+    
+    candidate = store.load(args.candidate)
+    if args.baseline_last:
+        runs = store.list_runs()
+        before = runs[:runs.index(candidate["run_id"])] if candidate["run_id"] in runs else runs
+        if not before:
+            parser.error("--baseline-last: no runs before the candidate")
+        baseline_refs = before[-args.baseline_last:]
+    else:
+        baseline_refs = args.baseline
+    baseline_runs = [store.load(ref) for ref in baseline_refs]
+    comparisons = compare_runs(
+        baseline_runs,
+        candidate,
+        alpha=args.alpha,
+        min_effect=args.min_effect,
+        min_ratio=args.min_ratio,
+        min_samples=args.min_samples
+    )
+    
+    baseline_ids = ", ".join(run["run_id"] for run in baseline_runs)
+    title = f"Performance: {candidate['run_id']} vs {baseline_ids}"
+    with open(f"{args.out}.md", "w", encoding="utf-8") as f:
+        f.write(render_markdown(title, comparisons))
+    with open(f"{args.out}.html", "w", encoding="utf-8") as f:
+        f.write(render_html(title, comparisons))
+    
+    regressions = [c for c in comparisons if c.verdict == Comparison.REGRESSION]
+    print(f"{title}: {len(regressions)} regression(s) in {len(comparisons)} metrics")
+    for comparison in regressions:
+        print("  " + " | ".join(comparison.to_row()))
+    print(f"Report: {args.out}.md, {args.out}.html")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+"""
+Performance statistics - vectorized NumPy tests for latency distributions.
+Reusable across any performance testing project.
+"""
+
+import math
+from typing import Dict, Sequence
+
+import numpy as np
+
+
+def rank_data(values: np.ndarray) -> np.ndarray:
+    """Ranks (1-based) with ties assigned their average rank"""
+    order = np.argsort(values, kind="mergesort")
+    ranks = np.empty(len(values), dtype=float)
+    ranks[order] = np.arange(1, len(values) + 1)
+    _, inverse, counts = np.unique(values, return_inverse=True, return_counts=True)
+    sums = np.bincount(inverse, weights=ranks)
+    return (sums / counts)[inverse]
+
+
+def mann_whitney_u(baseline: Sequence[float], candidate: Sequence[float]) -> Dict[str, float]:
+    """
+    Two-sided Mann-Whitney U test (normal approximation with tie correction).
+    
+    Returns:
+        dict with u (for candidate), p_value and cliffs_delta
+        (cliffs_delta > 0 means candidate tends to be larger/slower)
+    """
+    a = np.asarray(baseline, dtype=float)
+    b = np.asarray(candidate, dtype=float)
+    n1, n2 = len(a), len(b)
+    if n1 == 0 or n2 == 0:
+        return {"u": 0.0, "p_value": 1.0, "cliffs_delta": 0.0}
+    
+    ranks = rank_data(np.concatenate([a, b]))
+    u_candidate = ranks[n1:].sum() - n2 * (n2 + 1) / 2
+    mean_u = n1 * n2 / 2
+    
+    _, counts = np.unique(np.concatenate([a, b]), return_counts=True)
+    n = n1 + n2
+    tie_term = (counts ** 3 - counts).sum() / (n * (n - 1)) if n > 1 else 0.0
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term)
+    if variance <= 0:
+        p_value = 1.0
+    else:
+        # Continuity correction towards the mean
+        z = (abs(u_candidate - mean_u) - 0.5) / math.sqrt(variance)
+        p_value = min(1.0, math.erfc(max(z, 0.0) / math.sqrt(2)))
+    
+    return {
+        "u": float(u_candidate),
+        "p_value": float(p_value),
+        "cliffs_delta": float(2 * u_candidate / (n1 * n2) - 1)
+    }
+
+
+def bootstrap_ratio_ci(
+    baseline: Sequence[float],
+    candidate: Sequence[float],
+    statistic: str = "median",
+    resamples: int = 2000,
+    confidence: float = 0.95,
+    seed: int = 0
+) -> Dict[str, float]:
+    """
+    Bootstrap confidence interval of candidate/baseline statistic ratio.
+    
+    Resampling is fully vectorized: one (resamples x n) index matrix per side.
+    
+    Returns:
+        dict with ratio, low, high
+    """
+    a = np.asarray(baseline, dtype=float)
+    b = np.asarray(candidate, dtype=float)
+    if len(a) == 0 or len(b) == 0:
+        return {"ratio": 1.0, "low": 1.0, "high": 1.0}
+    
+    reduce = np.median if statistic == "median" else np.mean
+    rng = np.random.default_rng(seed)
+    a_stats = reduce(a[rng.integers(0, len(a), size=(resamples, len(a)))], axis=1)
+    b_stats = reduce(b[rng.integers(0, len(b), size=(resamples, len(b)))], axis=1)
+    ratios = b_stats / np.maximum(a_stats, 1e-9)
+    
+    alpha = (1 - confidence) / 2
+    return {
+        "ratio": float(reduce(b) / max(reduce(a), 1e-9)),
+        "low": float(np.quantile(ratios, alpha)),
+        "high": float(np.quantile(ratios, 1 - alpha))
+    }
+
+
+def bootstrap_ci(
+    values: Sequence[float],
+    statistic: str = "median",
+    resamples: int = 2000,
+    confidence: float = 0.95,
+    seed: int = 0
+) -> Dict[str, float]:
+    """
+    Bootstrap (percentile) confidence interval of one sample's statistic.
+    
+    Returns:
+        dict with value, low, high
+    """
+    a = np.asarray(values, dtype=float)
+    if len(a) == 0:
+        return {"value": 0.0, "low": 0.0, "high": 0.0}
+    
+    reduce = np.median if statistic == "median" else np.mean
+    rng = np.random.default_rng(seed)
+    stats = reduce(a[rng.integers(0, len(a), size=(resamples, len(a)))], axis=1)
+    alpha = (1 - confidence) / 2
+    return {
+        "value": float(reduce(a)),
+        "low": float(np.quantile(stats, alpha)),
+        "high": float(np.quantile(stats, 1 - alpha))
+    }
+
+
+def effect_size_label(cliffs_delta: float) -> str:
+    """Conventional magnitude label for Cliff's delta"""
+    magnitude = abs(cliffs_delta)
+    if magnitude < 0.147:
+        return "negligible"
+    if magnitude < 0.33:
+        return "small"
+    if magnitude < 0.474:
+        return "medium"
+    return "large"
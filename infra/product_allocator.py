@@ -0,0 +1,186 @@
+"""
+Product allocator - contention-aware test product selection for parallel runs.
+Reusable across any e-commerce testing project.
+
+With pytest-xdist every worker samples the same catalog, so workers pile onto
+the same products: orders decrement the same stock rows (lock contention) and
+popular products drain to zero mid-run. The allocator, built over a
+CatalogIndex:
+- shards products between workers deterministically (stable hash of the id
+  modulo worker count) - no two workers hand out the same product
+- tracks stock reserved by the worker's tests: a product is handed out only
+  while its stock minus reservations covers the request; reservations are
+  reset on refresh(), when the server stock reflects what was consumed
+- creates dedicated high-stock products for heavy tests (and when the shard
+  runs dry); dedicated products are named with a prefix that keeps them out
+  of every worker's shard and are reused by their owner for the whole run
+"""
+
+import logging
+import os
+import zlib
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from infra.catalog_index import CatalogIndex
+
+logger = logging.getLogger(__name__)
+
+# Name prefix of products created by allocate_dedicated() (excluded from sharding)
+DEDICATED_PREFIX = "Dedicated "
+
+# Shard code of dedicated products
+_EXCLUDED = -1
+
+
+def worker_shard() -> Tuple[int, int]:
+    """
+    Shard of the current process: (index, count).
+    Under pytest-xdist: worker "gw3" of 4 -> (3, 4); otherwise (0, 1).
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "")
+    count = int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", "1") or 1)
+    index = int(worker[2:]) if worker.startswith("gw") and worker[2:].isdigit() else 0
+    return index % max(count, 1), max(count, 1)
+
+
+def shard_of(product_id: str, count: int) -> int:
+    """Stable shard of a product id (same in every process, unlike hash())"""
+    return zlib.crc32(str(product_id).encode("utf-8")) % count
+
+
+class ProductAllocator:
+    """Hands out products of the worker's shard with stock reservations"""
+    
+    def __init__(
+        self,
+        index: CatalogIndex,
+        shard: int = 0,
+        shard_count: int = 1,
+        create_product: Callable[[int], Dict] = None,
+        dedicated_stock: int = 10000
+    ):
+        """
+        Args:
+            index: catalog index of all products
+            shard: this worker's shard (see worker_shard())
+            shard_count: number of shards (workers)
+            create_product: create_product(stock) -> product dict named with DEDICATED_PREFIX
+                (None = no dedicated products)
+            dedicated_stock: stock of created dedicated products
+        """
+        self.index = index
+        self.shard = shard
+        self.shard_count = shard_count
+        self.create_product = create_product
+        self.dedicated_stock = dedicated_stock
+        self.reserved = np.zeros(len(index.ids), dtype=np.int64)
+        self._shards = np.empty(0, dtype=np.int32)
+        self.dedicated: Dict[str, Dict] = {}
+        self._dedicated_used: Dict[str, int] = {}
+    
+    # ==================== SHARDS ====================
+    
+    def _sync(self):
+        """Extend shard codes and reservations to rows appended by the index"""
+        rows = len(self.index.ids)
+        known = len(self._shards)
+        if rows > known:
+            new_shards = [
+                _EXCLUDED if str(product.get("name", "")).startswith(DEDICATED_PREFIX)
+                else shard_of(product.get(self.index.id_key), self.shard_count)
+                for product in self.index.products[known:rows]
+            ]
+            self._shards = np.concatenate([self._shards, np.array(new_shards, dtype=np.int32)])
+        if rows > len(self.reserved):
+            self.reserved = np.concatenate([self.reserved, np.zeros(rows - len(self.reserved), dtype=np.int64)])
+    
+    def shard_rows(self, min_stock: int = 1, **filters) -> np.ndarray:
+        """Rows of this shard matching filters with at least min_stock unreserved"""
+        self._sync()
+        rows = self.index.candidates(min_stock=min_stock, **filters)
+        rows = rows[self._shards[rows] == self.shard]
+        return rows[self.index.stock[rows] - self.reserved[rows] >= min_stock]
+    
+    def refresh(self, products: Iterable[Dict]):
+        """Refresh the index from the server; server stock now includes consumed reservations"""
+        self.index.refresh(products)
+        self._sync()
+        self.reserved[:] = 0
+    
+    # ==================== ALLOCATION ====================
+    
+    def allocate(self, min_stock: int = 1, weights: str = None, **filters) -> Optional[Dict]:
+        """
+        Product of this worker's shard with min_stock units reserved for the caller.
+        Products not handed out since the last full round are preferred. Falls
+        back to a dedicated product when the shard has no match.
+        
+        Args:
+            min_stock: units the test may consume
+            weights: None (uniform), "stock" (unreserved stock) or "price" - probability proportional to the column
+            **filters: min_price, max_price, category (see CatalogIndex.mask())
+        Returns:
+            None if nothing matches and dedicated products are disabled
+        """
+        rows = self.shard_rows(min_stock, **filters)
+        if len(rows) == 0:
+            if self.create_product is None or filters:
+                return None
+            logger.info(f"Shard {self.shard}/{self.shard_count} has no product with stock >= {min_stock}")
+            return self.allocate_dedicated(min_stock)
+        
+        taken = self.index.taken
+        free = rows[~taken[rows]]
+        if len(free) == 0:
+            taken[rows] = False
+            free = rows
+        if weights is not None:
+            column = self.index.stock[free] - self.reserved[free] if weights == "stock" else self.index.prices[free]
+            cumulative = np.cumsum(np.clip(column.astype(np.float64), 0, None))
+        if weights is not None and cumulative[-1] > 0:
+            row = free[np.searchsorted(cumulative, self.index.rng.random() * cumulative[-1], side="right")]
+        else:
+            row = free[self.index.rng.integers(len(free))]
+        taken[row] = True
+        self.reserved[row] += min_stock
+        return self.index.products[row]
+    
+    def allocate_dedicated(self, min_stock: int = 1) -> Dict:
+        """
+        Dedicated high-stock product owned by this worker (created on first use,
+        or when the existing ones cannot cover min_stock).
+        """
+        for product_id, product in self.dedicated.items():
+            if product.get("stock", 0) - self._dedicated_used[product_id] >= min_stock:
+                self._dedicated_used[product_id] += min_stock
+                return product
+        if self.create_product is None:
+            raise ValueError("Dedicated products are disabled (no create_product)")
+        
+        product = self.create_product(max(self.dedicated_stock, min_stock))
+        product_id = product.get(self.index.id_key)
+        self.dedicated[product_id] = product
+        self._dedicated_used[product_id] = min_stock
+        return product
+    
+    def consume(self, product_id: str, quantity: int = 1):
+        """Turn reserved units into consumed stock (e.g. an order was placed)"""
+        if product_id in self.dedicated:
+            return
+        self.index.adjust_stock(product_id, -quantity)
+        self.release(product_id, quantity)
+    
+    def release(self, product_id: str, quantity: int = 1):
+        """Return reserved units"""
+        if product_id in self.dedicated:
+            self._dedicated_used[product_id] = max(self._dedicated_used[product_id] - quantity, 0)
+            return
+        row = self.index.row(product_id)
+        if row is not None and row < len(self.reserved):
+            self.reserved[row] = max(self.reserved[row] - quantity, 0)
+    
+    def dedicated_ids(self) -> List[str]:
+        """Ids of dedicated products created by this worker (for cleanup)"""
+        return list(self.dedicated)
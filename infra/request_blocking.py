@@ -0,0 +1,126 @@
+"""
+Request blocking - skip non-essential assets in functional UI runs.
+Reusable across any web testing project.
+
+Two mechanisms (Chrome only):
+- URL patterns are blocked via CDP Network.setBlockedURLs (e.g. "*.png")
+- external origins fail fast via --host-resolver-rules: every host except
+  the app/API hosts and allowed hosts resolves to NOTFOUND, so unreachable
+  hosts (e.g. image placeholders) cannot stall page loads
+
+Blocked requests are counted from the Chrome performance log. Blocked
+requests are never downloaded, so only counts (by reason and resource
+type) are reported - their size is unknown.
+"""
+
+import json
+from typing import Dict, Iterable, List
+from urllib.parse import urlparse
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+class BlockingProfile:
+    """URL patterns to block and whether to cut off external origins"""
+    
+    def __init__(
+        self,
+        name: str,
+        patterns: List[str] = None,
+        block_external: bool = False,
+        allow_hosts: List[str] = None
+    ):
+        """
+        Args:
+            name: profile name
+            patterns: CDP URL patterns ("*" wildcard), e.g. "*.png"
+            block_external: block hosts other than the app/API hosts
+            allow_hosts: external hosts that stay reachable
+        """
+        self.name = name
+        self.patterns = patterns or []
+        self.block_external = block_external
+        self.allow_hosts = allow_hosts or []
+    
+    @property
+    def active(self) -> bool:
+        return bool(self.patterns or self.block_external)
+    
+    @classmethod
+    def from_dict(cls, name: str, data: Dict) -> "BlockingProfile":
+        """Build profile from config entry"""
+        return cls(name, **data)
+    
+    def host_resolver_rules(self, app_urls: Iterable[str]) -> str:
+        """Chrome --host-resolver-rules value (empty if external origins are allowed)"""
+        if not self.block_external:
+            return ""
+        hosts = ["localhost", "127.0.0.1"] + [urlparse(url).hostname for url in app_urls] + self.allow_hosts
+        excludes = ", ".join(f"EXCLUDE {host}" for host in dict.fromkeys(hosts) if host)
+        return f"MAP * ~NOTFOUND, {excludes}"
+
+
+IMAGE_PATTERNS = ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.ico"]
+MEDIA_PATTERNS = ["*.mp4", "*.webm", "*.ogg", "*.mp3", "*.wav"]
+FONT_PATTERNS = ["*.woff", "*.woff2", "*.ttf", "*.otf", "*fonts.googleapis.com*", "*fonts.gstatic.com*"]
+
+PROFILES: Dict[str, BlockingProfile] = {
+    "none": BlockingProfile("none"),
+    "functional": BlockingProfile(
+        "functional",
+        patterns=IMAGE_PATTERNS + MEDIA_PATTERNS + FONT_PATTERNS,
+        block_external=True
+    )
+}
+
+
+def get_profile(name: str, custom: Dict[str, Dict] = None) -> BlockingProfile:
+    """
+    Get profile by name.
+    
+    Args:
+        name: built-in or custom profile name
+        custom: {name: {patterns, block_external, allow_hosts}} profiles from config
+    """
+    if custom and name in custom:
+        return BlockingProfile.from_dict(name, custom[name])
+    if name not in PROFILES:
+        raise ValueError(f"Unknown request blocking profile: {name}. Available: {sorted(set(PROFILES) | set(custom or {}))}")
+    return PROFILES[name]
+
+
+def apply_patterns(driver: WebDriver, profile: BlockingProfile):
+    """Block profile URL patterns for all following requests"""
+    if profile.patterns:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": profile.patterns})
+
+
+def blocked_requests(driver: WebDriver) -> Dict:
+    """
+    Count blocked requests since last call (drains the performance log).
+    
+    Returns:
+        {"count", "by_reason": {...}, "by_type": {...}, "urls": [first 20]}
+    """
+    urls: Dict[str, str] = {}
+    stats = {"count": 0, "by_reason": {}, "by_type": {}, "urls": []}
+    for entry in driver.get_log("performance"):
+        message = json.loads(entry["message"])["message"]
+        params = message.get("params", {})
+        if message.get("method") == "Network.requestWillBeSent":
+            urls[params.get("requestId")] = params.get("request", {}).get("url", "")
+        elif message.get("method") == "Network.loadingFailed":
+            if params.get("blockedReason"):
+                reason = "pattern"
+            elif params.get("errorText") == "net::ERR_NAME_NOT_RESOLVED":
+                reason = "external"
+            else:
+                continue
+            resource_type = params.get("type", "Other")
+            stats["count"] += 1
+            stats["by_reason"][reason] = stats["by_reason"].get(reason, 0) + 1
+            stats["by_type"][resource_type] = stats["by_type"].get(resource_type, 0) + 1
+            if len(stats["urls"]) < 20:
+                stats["urls"].append(urls.get(params.get("requestId"), ""))
+    return stats
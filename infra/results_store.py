@@ -0,0 +1,111 @@
+"""
+Results store - local per-run performance results.
+Reusable across any performance testing project.
+
+Each run is one JSON file:
+    {
+        "run_id": "20260101_120000_ab12cd",
+        "created": "2026-01-01T12:00:00",
+        "meta": {...},
+        "metrics": {
+            "endpoint": {"GET PRODUCTS": [ms, ...]},
+            "test": {"tests/test_x.py::TestX::test_y": [ms]},
+            "page_action": {"CartPage.open": [ms, ...]}
+        }
+    }
+"""
+
+import json
+import os
+import uuid
+from datetime import datetime
+from typing import Dict, List, Optional
+
+
+class ResultsStore:
+    """Directory of run result files with named baselines"""
+    
+    BASELINES_FILE = "baselines.json"
+    
+    def __init__(self, root: str):
+        self.root = root
+    
+    def _path(self, run_id: str) -> str:
+        return os.path.join(self.root, f"{run_id}.json")
+    
+    def save_run(self, metrics: Dict[str, Dict[str, List[float]]], meta: Dict = None) -> str:
+        """
+        Save run metrics.
+        
+        Returns:
+            run_id of stored run
+        """
+        os.makedirs(self.root, exist_ok=True)
+        now = datetime.now()
+        run_id = f"{now.strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+        with open(self._path(run_id), "w", encoding="utf-8") as f:
+            json.dump({
+                "run_id": run_id,
+                "created": now.isoformat(timespec="seconds"),
+                "meta": meta or {},
+                "metrics": metrics
+            }, f)
+        return run_id
+    
+    def list_runs(self) -> List[str]:
+        """Get stored run IDs, oldest first"""
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(
+            name[:-len(".json")]
+            for name in os.listdir(self.root)
+            if name.endswith(".json") and name != self.BASELINES_FILE
+        )
+    
+    # ==================== BASELINES ====================
+    
+    def _baselines(self) -> Dict[str, str]:
+        path = os.path.join(self.root, self.BASELINES_FILE)
+        if not os.path.exists(path):
+            return {}
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    
+    def set_baseline(self, run_ref: str, name: str = "baseline") -> str:
+        """Pin run as named baseline, return resolved run_id"""
+        run_id = self.resolve(run_ref)
+        baselines = self._baselines()
+        baselines[name] = run_id
+        os.makedirs(self.root, exist_ok=True)
+        with open(os.path.join(self.root, self.BASELINES_FILE), "w", encoding="utf-8") as f:
+            json.dump(baselines, f, indent=2)
+        return run_id
+    
+    def resolve(self, run_ref: str) -> str:
+        """
+        Resolve run reference to run_id.
+        
+        Args:
+            run_ref: run_id, baseline name, "latest" or "previous"
+        """
+        runs = self.list_runs()
+        if run_ref == "latest" and runs:
+            return runs[-1]
+        if run_ref == "previous" and len(runs) > 1:
+            return runs[-2]
+        baselines = self._baselines()
+        if run_ref in baselines:
+            return baselines[run_ref]
+        if run_ref in runs:
+            return run_ref
+        raise ValueError(f"Unknown run: {run_ref}. Stored runs: {len(runs)}, baselines: {list(baselines)}")
+    
+    def load(self, run_ref: str) -> Dict:
+        """Load run by reference"""
+        with open(self._path(self.resolve(run_ref)), "r", encoding="utf-8") as f:
+            return json.load(f)
+    
+    def latest(self) -> Optional[Dict]:
+        """Load latest run (None if store is empty)"""
+        runs = self.list_runs()
+        return self.load(runs[-1]) if runs else None
@@ -0,0 +1,295 @@
+"""
+Saturation finder - step-load ramp to the knee point.
+Reusable across any load testing project.
+
+Steps the open-loop arrival rate up, holds each step until latency is
+stable, and stops at the first step that breaks the p99 SLO, exceeds the
+error budget or stops gaining throughput. The knee is then narrowed by
+bisecting between the last passing and first failing rate (the bracket).
+Finally both bracket rates are measured again knee_trials times; each pair
+gives one knee estimate, and the confidence interval of the max sustainable
+rate is bootstrapped from those estimates.
+"""
+
+from typing import Any, Callable, Dict, List, Optional
+
+from infra.latency_histogram import LatencyHistogram
+from infra.load_scheduler import ArrivalSchedule, OpenLoopScheduler
+from infra.perf_stats import bootstrap_ci
+
+
+class StepResult:
+    """Measurements for one held arrival rate"""
+    
+    def __init__(self, rps: float):
+        self.rps = rps
+        self.latency = LatencyHistogram()
+        self.window_p99s: List[float] = []
+        self.sent = 0
+        self.errors = 0
+        self.elapsed = 0.0
+        self.stable = False
+        self.client_saturated = False
+        self.failure: Optional[str] = None
+    
+    @property
+    def p99(self) -> float:
+        """p99 over the measured (post warm-up) windows"""
+        return self.latency.percentile(99)
+    
+    @property
+    def error_rate(self) -> float:
+        """Failed requests / sent requests"""
+        return self.errors / self.sent if self.sent else 0.0
+    
+    @property
+    def goodput(self) -> float:
+        """Successful requests per second"""
+        return (self.sent - self.errors) / self.elapsed if self.elapsed else 0.0
+    
+    @property
+    def passed(self) -> bool:
+        """True if step stayed within all limits"""
+        return self.failure is None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable form"""
+        return {
+            "rps": round(self.rps, 2),
+            "p99_ms": self.p99,
+            "window_p99s_ms": self.window_p99s,
+            "error_rate": round(self.error_rate, 4),
+            "goodput": round(self.goodput, 2),
+            "stable": self.stable,
+            "client_saturated": self.client_saturated,
+            "failure": self.failure
+        }
+
+
+class SaturationReport:
+    """Outcome of a saturation search"""
+    
+    def __init__(self, name: str, p99_slo_ms: float):
+        self.name = name
+        self.p99_slo_ms = p99_slo_ms
+        self.steps: List[StepResult] = []
+        self.max_sustainable_rps = 0.0
+        self.lower_rps = 0.0
+        self.upper_rps: Optional[float] = None
+        self.knee_reason: Optional[str] = None
+        self.knee_estimates: List[float] = []
+        self.confidence = 0.95
+        self.ci_low: Optional[float] = None
+        self.ci_high: Optional[float] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable form"""
+        return {
+            "name": self.name,
+            "p99_slo_ms": self.p99_slo_ms,
+            "max_sustainable_rps": round(self.max_sustainable_rps, 2),
+            "lower_rps": round(self.lower_rps, 2),
+            "upper_rps": round(self.upper_rps, 2) if self.upper_rps is not None else None,
+            "knee_reason": self.knee_reason,
+            "knee_estimates": [round(estimate, 2) for estimate in self.knee_estimates],
+            "confidence": self.confidence,
+            "ci_low": round(self.ci_low, 2) if self.ci_low is not None else None,
+            "ci_high": round(self.ci_high, 2) if self.ci_high is not None else None,
+            "steps": [step.to_dict() for step in self.steps]
+        }
+    
+    def __str__(self) -> str:
+        upper = f"{self.upper_rps:.1f}" if self.upper_rps is not None else "not reached"
+        interval = (
+            f"{self.confidence:.0%} CI {self.ci_low:.1f} .. {self.ci_high:.1f} over {len(self.knee_estimates)} estimates, "
+            if self.ci_low is not None else ""
+        )
+        lines = [
+            f"Saturation '{self.name}': max sustainable {self.max_sustainable_rps:.1f} rps "
+            f"({interval}bracket {self.lower_rps:.1f} .. {upper}), knee: {self.knee_reason or 'not reached'}",
+            f"{'rps':>8} {'p99 ms':>9} {'err %':>7} {'goodput':>8} {'stable':>7}  verdict"
+        ]
+        for step in sorted(self.steps, key=lambda s: s.rps):
+            lines.append(
+                f"{step.rps:>8.1f} {step.p99:>9.1f} {step.error_rate * 100:>7.2f} "
+                f"{step.goodput:>8.1f} {str(step.stable):>7}  {step.failure or 'ok'}"
+            )
+        return "\n".join(lines)
+
+
+class SaturationFinder:
+    """Find max sustainable arrival rate before SLOs break"""
+    
+    def __init__(
+        self,
+        scheduler: OpenLoopScheduler,
+        p99_slo_ms: float,
+        max_error_rate: float = 0.01,
+        start_rps: float = 5.0,
+        step_factor: float = 1.5,
+        max_rps: float = 500.0,
+        window: float = 5.0,
+        min_windows: int = 2,
+        max_windows: int = 6,
+        stability_tolerance: float = 0.15,
+        min_goodput_ratio: float = 0.9,
+        refine_steps: int = 2,
+        knee_trials: int = 3,
+        confidence: float = 0.95
+    ):
+        """
+        Args:
+            scheduler: open-loop scheduler used for every step
+            p99_slo_ms: p99 latency SLO
+            max_error_rate: max failed/sent ratio
+            start_rps: first step rate
+            step_factor: rate multiplier between steps
+            max_rps: stop ramping above this rate
+            window: measurement window in seconds
+            min_windows: min measured windows per step (after one warm-up window)
+            max_windows: max measured windows before giving up on stability
+            stability_tolerance: max relative p99 change between last two windows
+            min_goodput_ratio: goodput / offered rate below which throughput has flattened
+            refine_steps: bisection rounds between last pass and first failure
+            knee_trials: repeated measurements of the bracket rates for the confidence interval (0 = none)
+            confidence: confidence level of the interval
+        """
+        self.scheduler = scheduler
+        self.p99_slo_ms = p99_slo_ms
+        self.max_error_rate = max_error_rate
+        self.start_rps = start_rps
+        self.step_factor = step_factor
+        self.max_rps = max_rps
+        self.window = window
+        self.min_windows = min_windows
+        self.max_windows = max_windows
+        self.stability_tolerance = stability_tolerance
+        self.min_goodput_ratio = min_goodput_ratio
+        self.refine_steps = refine_steps
+        self.knee_trials = knee_trials
+        self.confidence = confidence
+    
+    # ==================== STEPS ====================
+    
+    def _is_stable(self, window_p99s: List[float]) -> bool:
+        """Check last two windows agree within tolerance"""
+        if len(window_p99s) < 2:
+            return False
+        previous, last = window_p99s[-2], window_p99s[-1]
+        baseline = max(previous, last, 1e-9)
+        return abs(last - previous) / baseline <= self.stability_tolerance
+    
+    def run_step(self, rps: float, operation: Callable[[], Any]) -> StepResult:
+        """Hold one rate until latency is stable, evaluate limits"""
+        step = StepResult(rps)
+        
+        # Warm-up window - excluded from measurements
+        self.scheduler.run(ArrivalSchedule.constant(rps, self.window), operation)
+        
+        for _ in range(self.max_windows):
+            result = self.scheduler.run(ArrivalSchedule.constant(rps, self.window), operation)
+            step.latency.merge(result.corrected)
+            step.window_p99s.append(result.corrected.percentile(99))
+            step.sent += result.sent
+            step.errors += result.error_count
+            step.elapsed += result.elapsed
+            step.client_saturated = step.client_saturated or result.client_saturated
+            if len(step.window_p99s) >= self.min_windows and self._is_stable(step.window_p99s):
+                step.stable = True
+                break
+        
+        step.failure = self._evaluate(step)
+        return step
+    
+    def _evaluate(self, step: StepResult) -> Optional[str]:
+        """Return failure reason or None"""
+        if step.client_saturated:
+            return "client saturated"
+        if step.error_rate > self.max_error_rate:
+            return f"error rate {step.error_rate:.2%} > {self.max_error_rate:.2%}"
+        if step.p99 > self.p99_slo_ms:
+            return f"p99 {step.p99:.1f}ms > {self.p99_slo_ms}ms"
+        if step.goodput < step.rps * self.min_goodput_ratio:
+            return f"throughput flattened ({step.goodput:.1f} of {step.rps:.1f} rps)"
+        if not step.stable:
+            return "latency not stable"
+        return None
+    
+    # ==================== SEARCH ====================
+    
+    def find(self, operation: Callable[[], Any], name: str = "") -> SaturationReport:
+        """
+        Ramp rate until the knee, bisect to narrow the bracket, then repeat the
+        bracket measurements for a confidence interval.
+        
+        Returns:
+            SaturationReport with max sustainable rps, bracket and interval
+        """
+        report = SaturationReport(name, self.p99_slo_ms)
+        last_pass: Optional[StepResult] = None
+        first_fail: Optional[StepResult] = None
+        
+        rps = self.start_rps
+        while rps <= self.max_rps:
+            step = self.run_step(rps, operation)
+            report.steps.append(step)
+            if not step.passed:
+                first_fail = step
+                break
+            last_pass = step
+            rps *= self.step_factor
+        
+        # Bisect between last passing and first failing rate
+        if first_fail is not None and first_fail.failure != "client saturated":
+            low = last_pass.rps if last_pass else 0.0
+            high = first_fail.rps
+            for _ in range(self.refine_steps):
+                middle = (low + high) / 2
+                if middle <= 0:
+                    break
+                step = self.run_step(middle, operation)
+                report.steps.append(step)
+                if step.passed:
+                    last_pass, low = step, middle
+                else:
+                    first_fail, high = step, middle
+        
+        report.lower_rps = last_pass.rps if last_pass else 0.0
+        report.upper_rps = first_fail.rps if first_fail else None
+        report.knee_reason = first_fail.failure if first_fail else None
+        report.max_sustainable_rps = self._interpolate(last_pass, first_fail)
+        
+        # Repeat the bracket: one knee estimate per trial
+        report.confidence = self.confidence
+        if last_pass is not None and first_fail is not None and first_fail.failure != "client saturated":
+            report.knee_estimates.append(report.max_sustainable_rps)
+            for _ in range(self.knee_trials):
+                low = self.run_step(last_pass.rps, operation)
+                high = self.run_step(first_fail.rps, operation)
+                report.steps += [low, high]
+                report.knee_estimates.append(self._interpolate(low, high))
+            if len(report.knee_estimates) > 1:
+                interval = bootstrap_ci(report.knee_estimates, confidence=self.confidence)
+                report.max_sustainable_rps = interval["value"]
+                report.ci_low, report.ci_high = interval["low"], interval["high"]
+        return report
+    
+    def _interpolate(self, low: Optional[StepResult], high: Optional[StepResult]) -> float:
+        """
+        Point estimate inside [low, high] (normally last pass and first failure).
+        Linear interpolation of p99 to the SLO crossing when the knee is a
+        latency failure, otherwise the highest passing rate.
+        """
+        if low is None:
+            return 0.0
+        if high is None or high.passed:
+            return high.rps if high is not None else low.rps
+        if not low.passed:
+            return low.rps
+        if high.p99 <= self.p99_slo_ms:
+            return low.rps
+        span = high.p99 - low.p99
+        if span <= 0:
+            return low.rps
+        fraction = (self.p99_slo_ms - low.p99) / span
+        return low.rps + fraction * (high.rps - low.rps)
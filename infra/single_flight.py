@@ -0,0 +1,144 @@
+"""
+Single flight - coalescing of identical concurrent calls.
+Reusable across any API testing project.
+
+When several threads ask for the same key at once, the first one (the
+leader) runs the call and the others wait for and share its result - or its
+exception - instead of sending their own request. With a ttl, a successful
+result is also reused for ttl seconds after it completed; with ttl 0 only
+calls that overlap in time are coalesced.
+
+A follower gets a result produced after the LEADER's call started, which may
+be before its own call started. A caller that wrote something and then reads
+it back must not join a read that started before its write: put a write
+generation into the key (as ApiWrapper does) and invalidate() cached results
+on writes. Only use it for idempotent reads.
+
+Counters are also summed per process (process_stats()) for the session report.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Iterable, Tuple
+
+COUNTERS = ("calls", "executed", "coalesced", "cached")
+
+_process_totals: Dict[str, int] = dict.fromkeys(COUNTERS, 0)
+_process_lock = threading.Lock()
+
+
+def _count(name: str):
+    with _process_lock:
+        _process_totals[name] += 1
+
+
+def _with_ratio(counts: Dict[str, int]) -> Dict:
+    calls = counts["calls"]
+    return {**counts, "coalescing_ratio": (counts["coalesced"] + counts["cached"]) / calls if calls else 0.0}
+
+
+def process_stats() -> Dict:
+    """Counters of all SingleFlight instances of this process, plus coalescing ratio"""
+    with _process_lock:
+        return _with_ratio(dict(_process_totals))
+
+
+def merge_stats(stats: Iterable[Dict]) -> Dict:
+    """Sum stats of several processes (e.g. xdist workers)"""
+    counts = dict.fromkeys(COUNTERS, 0)
+    for item in stats:
+        for name in COUNTERS:
+            counts[name] += item.get(name, 0)
+    return _with_ratio(counts)
+
+
+class _Call:
+    """One in-flight call shared by its leader and followers"""
+    
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException = None
+
+
+class SingleFlight:
+    """Thread-safe call coalescing per key with optional result ttl"""
+    
+    def __init__(self, ttl: float = 0, cacheable: Callable[[Any], bool] = None):
+        """
+        Args:
+            ttl: seconds a completed result is reused (0 = coalesce in-flight calls only)
+            cacheable: cacheable(result) -> whether the result may be reused for ttl (default: all)
+        """
+        self.ttl = ttl
+        self.cacheable = cacheable
+        self._calls: Dict[Hashable, _Call] = {}
+        self._results: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.executed = 0
+        self.coalesced = 0
+        self.cached = 0
+    
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Result of fn(), shared with concurrent (and, within ttl, recent) callers of key.
+        
+        Raises:
+            whatever fn raised - in the leader and in every follower
+        """
+        with self._lock:
+            self.calls += 1
+            stored = self._results.get(key)
+            if stored and time.monotonic() < stored[0]:
+                self.cached += 1
+                outcome = "cached"
+            else:
+                call = self._calls.get(key)
+                leader = call is None
+                if leader:
+                    call = self._calls[key] = _Call()
+                    self.executed += 1
+                else:
+                    self.coalesced += 1
+                outcome = "executed" if leader else "coalesced"
+        _count("calls")
+        _count(outcome)
+        if outcome == "cached":
+            return stored[1]
+        
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+                if self.ttl and call.error is None and (self.cacheable is None or self.cacheable(call.result)):
+                    self._results[key] = (time.monotonic() + self.ttl, call.result)
+            call.done.set()
+        return call.result
+    
+    def invalidate(self, key: Hashable = None):
+        """Drop reused results (of one key, or all); in-flight calls are unaffected"""
+        with self._lock:
+            if key is None:
+                self._results.clear()
+            else:
+                self._results.pop(key, None)
+    
+    @property
+    def coalescing_ratio(self) -> float:
+        """Share of calls served without executing fn"""
+        return (self.coalesced + self.cached) / self.calls if self.calls else 0.0
+    
+    def stats(self) -> Dict:
+        with self._lock:
+            return _with_ratio({name: getattr(self, name) for name in COUNTERS})
@@ -0,0 +1,227 @@
+"""
+Stage pipeline - threaded multi-stage pipeline with bounded queues.
+Reusable across any load testing project.
+
+Items flow source -> stage 1 -> stage 2 -> ... Each stage has its own worker
+threads and a bounded input queue: a slow stage fills its queue and then
+blocks the stage before it (backpressure), so queue depth over time shows
+where the bottleneck is. A stage handler returns the item for the next
+stage, or None when the item leaves the pipeline early (e.g. cancelled).
+
+Reported per stage: throughput, handler latency (the stage's own work) and
+queue wait; plus end-to-end latency and sampled queue depths.
+"""
+
+import threading
+import time
+from queue import Queue
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from infra.latency_budget import percentile
+
+
+_DONE = object()
+
+
+class Stage:
+    """One pipeline stage: handler run by worker threads over a bounded queue"""
+    
+    def __init__(self, name: str, handler: Callable[[Any], Any], workers: int = 1, queue_size: int = 100):
+        """
+        Args:
+            name: stage name (report label)
+            handler: handler(item) -> item for the next stage, or None to finish the item here
+            workers: concurrent handler threads
+            queue_size: capacity of the stage's input queue
+        """
+        self.name = name
+        self.handler = handler
+        self.workers = workers
+        self.queue_size = queue_size
+
+
+class StageStats:
+    """Counters and latencies of one stage"""
+    
+    def __init__(self, name: str):
+        self.name = name
+        self.processed = 0
+        self.finished = 0
+        self.errors: List[str] = []
+        self.latencies_ms: List[float] = []
+        self.waits_ms: List[float] = []
+        self.started_at: Optional[float] = None
+        self.ended_at: Optional[float] = None
+        self._lock = threading.Lock()
+    
+    def record(self, latency_ms: float, wait_ms: float, forwarded: bool, error: str = None):
+        with self._lock:
+            if self.started_at is None:
+                self.started_at = time.perf_counter() - latency_ms / 1000
+            self.ended_at = time.perf_counter()
+            self.latencies_ms.append(latency_ms)
+            self.waits_ms.append(wait_ms)
+            if error:
+                self.errors.append(error)
+                return
+            self.processed += 1
+            if not forwarded:
+                self.finished += 1
+    
+    @property
+    def throughput(self) -> float:
+        """Processed items per second while the stage was busy"""
+        if self.started_at is None or self.ended_at is None or self.ended_at <= self.started_at:
+            return 0.0
+        return self.processed / (self.ended_at - self.started_at)
+    
+    def to_dict(self) -> Dict:
+        return {
+            "processed": self.processed,
+            "finished": self.finished,
+            "errors": len(self.errors),
+            "throughput": self.throughput,
+            "p50_ms": percentile(self.latencies_ms, 50),
+            "p95_ms": percentile(self.latencies_ms, 95),
+            "p99_ms": percentile(self.latencies_ms, 99),
+            "wait_p95_ms": percentile(self.waits_ms, 95)
+        }
+
+
+class PipelineResult:
+    """Stage stats, end-to-end latencies and queue depth samples of one run"""
+    
+    def __init__(
+        self,
+        stages: List[StageStats],
+        end_to_end_ms: List[float],
+        depths: List[Tuple[float, Dict[str, int]]],
+        elapsed: float
+    ):
+        self.stages = stages
+        self.end_to_end_ms = end_to_end_ms
+        self.depths = depths
+        self.elapsed = elapsed
+    
+    def stage(self, name: str) -> StageStats:
+        return next(stats for stats in self.stages if stats.name == name)
+    
+    @property
+    def errors(self) -> List[str]:
+        return [f"{stats.name}: {error}" for stats in self.stages for error in stats.errors]
+    
+    def max_depth(self, name: str) -> int:
+        return max((depths.get(name, 0) for _, depths in self.depths), default=0)
+    
+    def to_dict(self) -> Dict:
+        return {
+            "elapsed": self.elapsed,
+            "stages": {stats.name: stats.to_dict() for stats in self.stages},
+            "end_to_end_p95_ms": percentile(self.end_to_end_ms, 95),
+            "depths": [[round(at, 3), depths] for at, depths in self.depths]
+        }
+    
+    def __str__(self) -> str:
+        lines = [
+            f"{'stage':<14} {'done':>6} {'err':>5} {'items/s':>8} {'p50 ms':>9} {'p95 ms':>9} "
+            f"{'p99 ms':>9} {'wait p95':>9} {'max queue':>9}"
+        ]
+        for stats in self.stages:
+            summary = stats.to_dict()
+            lines.append(
+                f"{stats.name:<14} {stats.processed:>6} {len(stats.errors):>5} {summary['throughput']:>8.1f} "
+                f"{summary['p50_ms']:>9.1f} {summary['p95_ms']:>9.1f} {summary['p99_ms']:>9.1f} "
+                f"{summary['wait_p95_ms']:>9.1f} {self.max_depth(stats.name):>9}"
+            )
+        lines.append(
+            f"end-to-end p50 {percentile(self.end_to_end_ms, 50):.1f} ms, "
+            f"p95 {percentile(self.end_to_end_ms, 95):.1f} ms, {self.elapsed:.1f}s total"
+        )
+        return "\n".join(lines)
+
+
+class StagePipeline:
+    """Run items through stages with bounded queues and per-stage concurrency"""
+    
+    def __init__(self, stages: List[Stage], sample_interval: float = 0.25):
+        """
+        Args:
+            stages: stages in order
+            sample_interval: seconds between queue depth samples
+        """
+        self.stages = stages
+        self.sample_interval = sample_interval
+    
+    def run(self, source: Iterable[Any]) -> PipelineResult:
+        """Feed source items into the first stage and wait until every item left the pipeline"""
+        queues = [Queue(maxsize=stage.queue_size) for stage in self.stages]
+        stats = [StageStats(stage.name) for stage in self.stages]
+        end_to_end_ms: List[float] = []
+        depths: List[Tuple[float, Dict[str, int]]] = []
+        remaining = [stage.workers for stage in self.stages]
+        lock = threading.Lock()
+        stop_sampling = threading.Event()
+        started = time.perf_counter()
+        
+        def finish(created_at: float):
+            with lock:
+                end_to_end_ms.append((time.perf_counter() - created_at) * 1000)
+        
+        def work(index: int):
+            stage, inbox = self.stages[index], queues[index]
+            outbox = queues[index + 1] if index + 1 < len(queues) else None
+            while True:
+                envelope = inbox.get()
+                if envelope is _DONE:
+                    break
+                item, created_at, queued_at = envelope
+                begun = time.perf_counter()
+                try:
+                    result = stage.handler(item)
+                except Exception as e:
+                    stats[index].record((time.perf_counter() - begun) * 1000, (begun - queued_at) * 1000, False, repr(e))
+                    continue
+                forwarded = result is not None and outbox is not None
+                stats[index].record((time.perf_counter() - begun) * 1000, (begun - queued_at) * 1000, forwarded)
+                if forwarded:
+                    outbox.put((result, created_at, time.perf_counter()))
+                else:
+                    finish(created_at)
+            # Last worker of the stage closes the next one
+            with lock:
+                remaining[index] -= 1
+                closing = remaining[index] == 0
+            if closing and outbox is not None:
+                for _ in range(self.stages[index + 1].workers):
+                    outbox.put(_DONE)
+        
+        def sample():
+            while not stop_sampling.wait(self.sample_interval):
+                depths.append((
+                    time.perf_counter() - started,
+                    {stage.name: queue.qsize() for stage, queue in zip(self.stages, queues)}
+                ))
+        
+        threads = [
+            threading.Thread(target=work, args=(index,), name=f"{stage.name}-{worker}", daemon=True)
+            for index, stage in enumerate(self.stages)
+            for worker in range(stage.workers)
+        ]
+        sampler = threading.Thread(target=sample, name="pipeline-sampler", daemon=True)
+        for thread in threads:
+            thread.start()
+        sampler.start()
+        
+        try:
+            for item in source:
+                now = time.perf_counter()
+                queues[0].put((item, now, now))
+        finally:
+            for _ in range(self.stages[0].workers):
+                queues[0].put(_DONE)
+            for thread in threads:
+                thread.join()
+            stop_sampling.set()
+            sampler.join()
+        
+        return PipelineResult(stats, end_to_end_ms, depths, time.perf_counter() - started)
@@ -0,0 +1,254 @@
+"""
+Tracing - nested timing spans across test layers, exported as files.
+Reusable across any testing project.
+
+Spans (fixture setup, API requests, page actions, waits, navigations,
+teardown) are kept per thread on a stack, so each span's parent is the span
+that was open when it started; spans from other threads hang off the test's
+root span. Every test gets a correlation id (the trace id), sent by the API
+client as X-Request-ID so traces can be joined with backend logs.
+
+Output formats (local files, no collector needed):
+- "chrome": Chrome trace-event JSON - opens in Perfetto (ui.perfetto.dev)
+  or chrome://tracing
+- "otlp": OTLP/JSON (ExportTraceServiceRequest) for OpenTelemetry tooling
+"""
+
+import json
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+
+# perf_counter_ns() is monotonic; shifted onto the epoch so browser
+# timestamps (performance.timeOrigin) land on the same timeline
+_EPOCH_OFFSET_NS = time.time_ns() - time.perf_counter_ns()
+
+
+def now_ns() -> int:
+    """Current time in epoch nanoseconds (monotonic within the process)"""
+    return time.perf_counter_ns() + _EPOCH_OFFSET_NS
+
+
+class Span:
+    """One timed operation"""
+    
+    __slots__ = ("name", "category", "trace_id", "span_id", "parent_id", "start_ns", "end_ns", "thread_id", "args")
+    
+    def __init__(
+        self,
+        name: str,
+        category: str,
+        trace_id: str,
+        parent_id: Optional[str],
+        start_ns: int,
+        args: Dict = None
+    ):
+        self.name = name
+        self.category = category
+        self.trace_id = trace_id
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent_id = parent_id
+        self.start_ns = start_ns
+        self.end_ns = start_ns
+        self.thread_id = threading.get_ident()
+        self.args = args or {}
+
+
+class Tracer:
+    """Process-wide span collector with per-test traces"""
+    
+    def __init__(self):
+        self.enabled = False
+        self.correlation_id: Optional[str] = None
+        self._root: Optional[Span] = None
+        self._spans: List[Span] = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+    
+    def _stack(self) -> List[Span]:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+    
+    # ==================== TESTS ====================
+    
+    def start_test(self, test_id: str):
+        """Start trace of a test (new correlation id, root span)"""
+        self.correlation_id = uuid.uuid4().hex
+        if self.enabled:
+            self._root = Span(test_id, "test", self.correlation_id, None, now_ns(), {"test_id": test_id})
+            self._stack().append(self._root)
+    
+    def end_test(self, **args) -> List[Span]:
+        """Close test root span and return the test's spans"""
+        root, self._root = self._root, None
+        trace_id, self.correlation_id = self.correlation_id, None
+        if root is None:
+            return []
+        root.end_ns = now_ns()
+        root.args.update(args)
+        stack = self._stack()
+        if root in stack:
+            del stack[stack.index(root):]
+        with self._lock:
+            self._spans.append(root)
+            return [span for span in self._spans if span.trace_id == trace_id]
+    
+    # ==================== SPANS ====================
+    
+    @contextmanager
+    def span(self, name: str, category: str, **args) -> Iterator[Optional[Span]]:
+        """Time block as a child of the currently open span"""
+        if not self.enabled:
+            yield None
+            return
+        stack = self._stack()
+        parent = stack[-1] if stack else self._root
+        span = Span(
+            name, category,
+            parent.trace_id if parent else self.correlation_id or "session",
+            parent.span_id if parent else None,
+            now_ns(), args
+        )
+        stack.append(span)
+        try:
+            yield span
+        except BaseException as error:
+            span.args["error"] = type(error).__name__
+            raise
+        finally:
+            span.end_ns = now_ns()
+            if stack and stack[-1] is span:
+                stack.pop()
+            with self._lock:
+                self._spans.append(span)
+    
+    def add_span(self, name: str, category: str, start_ns: int, end_ns: int, **args):
+        """Record already measured span (e.g. browser navigation timing) under the open span"""
+        if not self.enabled:
+            return
+        stack = self._stack()
+        parent = stack[-1] if stack else self._root
+        span = Span(
+            name, category,
+            parent.trace_id if parent else self.correlation_id or "session",
+            parent.span_id if parent else None,
+            start_ns, args
+        )
+        span.end_ns = max(end_ns, start_ns)
+        with self._lock:
+            self._spans.append(span)
+    
+    def spans(self) -> List[Span]:
+        """All finished spans of the session"""
+        with self._lock:
+            return list(self._spans)
+    
+    def clear(self):
+        """Drop all spans"""
+        with self._lock:
+            self._spans.clear()
+
+
+# ==================== EXPORT ====================
+
+def to_chrome_trace(spans: List[Span], process_name: str = "pytest") -> Dict:
+    """Chrome trace-event JSON (complete "X" events, microseconds)"""
+    pid = os.getpid()
+    threads: Dict[int, int] = {}
+    events = [{"ph": "M", "name": "process_name", "pid": pid, "tid": 0, "args": {"name": process_name}}]
+    for span in sorted(spans, key=lambda item: (item.start_ns, -item.end_ns)):
+        tid = threads.setdefault(span.thread_id, len(threads) + 1)
+        events.append({
+            "ph": "X",
+            "name": span.name,
+            "cat": span.category,
+            "ts": span.start_ns / 1000,
+            "dur": (span.end_ns - span.start_ns) / 1000,
+            "pid": pid,
+            "tid": tid,
+            "args": dict(span.args, trace_id=span.trace_id, span_id=span.span_id, parent_id=span.parent_id)
+        })
+    for thread_id, tid in threads.items():
+        name = "main" if thread_id == threading.main_thread().ident else f"thread-{tid}"
+        events.append({"ph": "M", "name": "thread_name", "pid": pid, "tid": tid, "args": {"name": name}})
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def _otlp_value(value) -> Dict:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_trace_id(trace_id: str) -> str:
+    """OTLP trace ids are 32 hex chars (session spans get a stable id derived from the name)"""
+    if len(trace_id) == 32:
+        return trace_id
+    return uuid.uuid5(uuid.NAMESPACE_OID, trace_id).hex
+
+
+def to_otlp(spans: List[Span], service_name: str = "pytest") -> Dict:
+    """OTLP/JSON ExportTraceServiceRequest"""
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": service_name}}]},
+            "scopeSpans": [{
+                "scope": {"name": __name__},
+                "spans": [
+                    {
+                        "traceId": _otlp_trace_id(span.trace_id),
+                        "spanId": span.span_id,
+                        "parentSpanId": span.parent_id or "",
+                        "name": span.name,
+                        "kind": 3 if span.category == "api" else 1,
+                        "startTimeUnixNano": str(span.start_ns),
+                        "endTimeUnixNano": str(span.end_ns),
+                        "attributes": [{"key": "category", "value": {"stringValue": span.category}}] + [
+                            {"key": key, "value": _otlp_value(value)}
+                            for key, value in span.args.items() if value is not None
+                        ]
+                    }
+                    for span in spans
+                ]
+            }]
+        }]
+    }
+
+
+def write_trace(path: str, spans: List[Span], fmt: str = "chrome", name: str = "pytest") -> str:
+    """
+    Write spans to file.
+    
+    Args:
+        path: output file
+        spans: spans to write
+        fmt: "chrome" (trace-event JSON) or "otlp" (OTLP/JSON)
+        name: process name (chrome) or service name (otlp)
+    """
+    if fmt == "chrome":
+        data = to_chrome_trace(spans, name)
+    elif fmt == "otlp":
+        data = to_otlp(spans, name)
+    else:
+        raise ValueError(f"Unsupported trace format: {fmt}. Available: ['chrome', 'otlp']")
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(data, file)
+    return path
+
+
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """Get process-wide tracer"""
+    return _tracer
@@ -0,0 +1,200 @@
+"""
+Web vitals - navigation timing and Core Web Vitals of page loads.
+Reusable across any web testing project.
+
+An observer script is injected before any page script runs (Chrome CDP
+Page.addScriptToEvaluateOnNewDocument) and buffers LCP, CLS and long tasks
+in window.__perfVitals. Each navigation is recorded right after load and
+finalized before the next navigation (or browser stop), when LCP/CLS are final.
+"""
+
+import threading
+from typing import Dict, List, Optional
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+OBSERVER_SCRIPT = """
+(() => {
+    if (window.__perfVitals) return;
+    const vitals = window.__perfVitals = {lcp: null, cls: 0, longTasks: 0, longTaskMs: 0};
+    const observe = (type, onEntry) => {
+        try {
+            new PerformanceObserver(list => list.getEntries().forEach(onEntry))
+                .observe({type: type, buffered: true});
+        } catch (e) {}
+    };
+    observe('largest-contentful-paint', entry => {
+        vitals.lcp = entry.renderTime || entry.startTime;
+    });
+    // CLS = largest session window (shifts < 1s apart, window < 5s)
+    let session = 0, first = 0, last = 0;
+    observe('layout-shift', entry => {
+        if (entry.hadRecentInput) return;
+        if (session && entry.startTime - last < 1000 && entry.startTime - first < 5000) {
+            session += entry.value;
+        } else {
+            session = entry.value;
+            first = entry.startTime;
+        }
+        last = entry.startTime;
+        vitals.cls = Math.max(vitals.cls, session);
+    });
+    observe('longtask', entry => {
+        vitals.longTasks += 1;
+        vitals.longTaskMs += entry.duration;
+    });
+})();
+"""
+
+COLLECT_SCRIPT = """
+const nav = performance.getEntriesByType('navigation')[0];
+const resources = performance.getEntriesByType('resource');
+const fcp = performance.getEntriesByName('first-contentful-paint')[0];
+const vitals = window.__perfVitals || {};
+const since = value => (nav && value > 0) ? value - nav.startTime : null;
+return {
+    time_origin: performance.timeOrigin,
+    ttfb: nav ? since(nav.responseStart) : null,
+    fcp: fcp ? fcp.startTime : null,
+    dom_content_loaded: nav ? since(nav.domContentLoadedEventEnd) : null,
+    load: nav ? since(nav.loadEventEnd) : null,
+    lcp: vitals.lcp === undefined ? null : vitals.lcp,
+    cls: vitals.cls === undefined ? null : vitals.cls,
+    long_tasks: vitals.longTasks === undefined ? null : vitals.longTasks,
+    long_task_ms: vitals.longTaskMs === undefined ? null : vitals.longTaskMs,
+    resource_count: resources.length,
+    resource_kb: resources.reduce((sum, r) => sum + (r.transferSize || 0), 0) / 1024,
+    resources_ms: resources.reduce((end, r) => Math.max(end, r.responseEnd), 0)
+};
+"""
+
+# Metrics re-read when a navigation is finalized (they keep changing after load,
+# and with eager/none page-load strategies load has not happened at record time)
+LATE_METRICS = (
+    "fcp", "load", "lcp", "cls", "long_tasks", "long_task_ms", "resource_count", "resource_kb", "resources_ms"
+)
+
+# Unitless metrics (everything else is ms)
+UNITS = {"cls": "", "long_tasks": "", "resource_count": "", "resource_kb": "KB"}
+
+
+def install_observer(driver: WebDriver) -> bool:
+    """Inject observer script into every new document (Chromium only)"""
+    if not hasattr(driver, "execute_cdp_cmd"):
+        return False
+    driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": OBSERVER_SCRIPT})
+    return True
+
+
+def collect(driver: WebDriver) -> Dict[str, Optional[float]]:
+    """Read navigation timing, resource totals and buffered vitals of current document"""
+    return driver.execute_script(COLLECT_SCRIPT)
+
+
+class NavigationSample:
+    """Metrics of one page navigation"""
+    
+    __slots__ = ("route", "test_id", "metrics")
+    
+    def __init__(self, route: str, test_id: Optional[str], metrics: Dict[str, Optional[float]]):
+        self.route = route
+        self.test_id = test_id
+        self.metrics = metrics
+    
+    def to_dict(self) -> Dict:
+        return {"route": self.route, "test_id": self.test_id, "metrics": self.metrics}
+
+
+class VitalsRecorder:
+    """Navigation samples of the run, keyed by route name"""
+    
+    def __init__(self):
+        self.enabled = True
+        self._samples: List[NavigationSample] = []
+        self._pending: Dict[str, NavigationSample] = {}
+        self._lock = threading.Lock()
+    
+    def begin(self, driver: WebDriver, route: str, test_id: str = None) -> Optional[NavigationSample]:
+        """Record navigation that just finished loading (finalized on next flush)"""
+        if not self.enabled:
+            return None
+        try:
+            metrics = collect(driver)
+        except Exception:
+            return None
+        sample = NavigationSample(route, test_id, metrics)
+        with self._lock:
+            self._samples.append(sample)
+            self._pending[driver.session_id] = sample
+        return sample
+    
+    def flush(self, driver: WebDriver):
+        """Finalize pending navigation of driver with current LCP/CLS/long tasks"""
+        with self._lock:
+            sample = self._pending.pop(getattr(driver, "session_id", None), None)
+        if sample is None:
+            return
+        try:
+            latest = collect(driver)
+        except Exception:
+            return
+        # Full page load since begin() - keep the values read after load
+        if latest.get("time_origin") != sample.metrics.get("time_origin"):
+            return
+        for name in LATE_METRICS:
+            sample.metrics[name] = latest.get(name)
+    
+    def samples(self, route: str = None, test_id: str = None) -> List[NavigationSample]:
+        """Get samples, optionally filtered by route and test"""
+        with self._lock:
+            return [
+                sample for sample in self._samples
+                if (route is None or sample.route == route)
+                and (test_id is None or sample.test_id == test_id)
+            ]
+    
+    def values(self, route: str, metric: str) -> List[float]:
+        """Get recorded values of one metric for route (missing values skipped)"""
+        return [
+            sample.metrics[metric] for sample in self.samples(route)
+            if sample.metrics.get(metric) is not None
+        ]
+    
+    def routes(self) -> List[str]:
+        """Get routes with samples"""
+        with self._lock:
+            return sorted({sample.route for sample in self._samples})
+    
+    def metrics(self) -> Dict[str, List[float]]:
+        """Get all values grouped by "ROUTE.metric" """
+        grouped: Dict[str, List[float]] = {}
+        for sample in self.samples():
+            for name, value in sample.metrics.items():
+                if name != "time_origin" and value is not None:
+                    grouped.setdefault(f"{sample.route}.{name}", []).append(value)
+        return grouped
+    
+    def export(self) -> List[Dict]:
+        """Serializable samples (e.g. to send from xdist worker to controller)"""
+        return [sample.to_dict() for sample in self.samples()]
+    
+    def merge(self, exported: List[Dict]):
+        """Merge samples from export()"""
+        with self._lock:
+            for item in exported:
+                self._samples.append(NavigationSample(item["route"], item["test_id"], item["metrics"]))
+    
+    def clear(self):
+        """Drop all samples"""
+        with self._lock:
+            self._samples.clear()
+            self._pending.clear()
+
+
+_vitals_recorder = VitalsRecorder()
+
+
+def get_vitals_recorder() -> VitalsRecorder:
+    """Get process-wide web vitals recorder"""
+    return _vitals_recorder
@@ -3,8 +3,11 @@ Admin API client for MyStore.
 Handles admin operations for products, users, and orders.
 """
 
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional
 from infra.api_wrapper import ApiWrapper
+from infra.etag_cache import ETagCache
+from infra.pagination import iter_json_array
+from logic.api.models import Collection, Order, User
 from utils.constants import ApiEndpoints
 
 
@@ -13,6 +16,31 @@ class AdminApi:
     
     def __init__(self, api: ApiWrapper = None):
         self.api = api or ApiWrapper()
+        self.etag_cache = ETagCache()
+    
+    def _iter_list(self, endpoint: str, token: str, key: str = None) -> Iterator[Dict]:
+        """Stream list endpoint and parse its items one by one (bounded memory)"""
+        response = self.api.get(endpoint, token=token, stream=True)
+        if not response.ok:
+            response.close()
+            response.raise_for_status()
+        return iter_json_array(response, key)
+    
+    # ==================== STATS ====================
+    
+    def get_stats(self, token: str, cached: bool = False) -> Dict:
+        """
+        Get dashboard stats (totals aggregated by the backend).
+        
+        Args:
+            token: admin token
+            cached: revalidate with the ETag of the previous response (304 reuses it)
+        """
+        if cached:
+            return self.etag_cache.get(self.api, ApiEndpoints.ADMIN_STATS, token)
+        response = self.api.get(ApiEndpoints.ADMIN_STATS, token=token)
+        response.raise_for_status()
+        return response.json()
     
     # ==================== PRODUCTS ====================
     
@@ -22,6 +50,10 @@ class AdminApi:
         response.raise_for_status()
         return response.json()
     
+    def iter_products(self, token: str) -> Iterator[Dict]:
+        """Iterate all products (admin) without loading the whole list."""
+        return self._iter_list(ApiEndpoints.ADMIN_PRODUCTS, token, key="products")
+    
     def create_product(self, product_data: Dict, token: str) -> Dict:
         """
         Create a new product.
@@ -63,6 +95,17 @@ class AdminApi:
         response.raise_for_status()
         return response.json()
     
+    def iter_users(self, token: str) -> Iterator[Dict]:
+        """Iterate all users without loading the whole list."""
+        return self._iter_list(ApiEndpoints.ADMIN_USERS, token, key="users")
+    
+    def get_user_list(self, token: str) -> Collection[User]:
+        """Get all users as typed collection indexed by id."""
+        users = self.get_users(token)
+        if isinstance(users, dict):
+            users = users.get("users", [])
+        return Collection(users, User)
+    
     def get_user_details(self, user_id: str, token: str) -> Dict:
         """Get user details."""
         endpoint = ApiEndpoints.ADMIN_USER_DETAILS.format(id=user_id)
@@ -91,6 +134,18 @@ class AdminApi:
         response.raise_for_status()
         return response.json()
     
+    def iter_orders(self, token: str) -> Iterator[Dict]:
+        """Iterate all orders without loading the whole list."""
+        return self._iter_list(ApiEndpoints.ADMIN_ORDERS, token, key="orders")
+    
+    def find_order(self, order_id: str, token: str) -> Optional[Dict]:
+        """Find order in the admin list (stops reading at the match)."""
+        return next((order for order in self.iter_orders(token) if order.get("_id") == order_id), None)
+    
+    def get_order_list(self, token: str) -> Collection[Order]:
+        """Get all orders as typed collection indexed by id."""
+        return Collection(self.get_orders(token), Order)
+    
     def update_order_status(self, order_id: str, status: str, token: str) -> Dict:
         """
         Update order status.
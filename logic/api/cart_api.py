@@ -3,8 +3,10 @@ Cart API client for MyStore.
 Handles shopping cart operations.
 """
 
+import time
 from typing import Dict, List
 from infra.api_wrapper import ApiWrapper
+from logic.api.models import Cart
 from utils.constants import ApiEndpoints
 
 
@@ -25,6 +27,15 @@ class CartApi:
         response.raise_for_status()
         return response.json()
     
+    def get_cart_model(self, token: str) -> Cart:
+        """
+        Get user's cart as typed model.
+        
+        Returns:
+            Cart with items indexed by product id
+        """
+        return Cart(self.get_cart(token))
+    
     def add_to_cart(self, product_id: str, quantity: int, token: str) -> Dict:
         """
         Add product to cart.
@@ -104,30 +115,20 @@ class CartApi:
         Returns:
             int: Actual quantity found in API (may not match expected if timeout)
         """
-        import time
         max_attempts = int(timeout / 0.5) or 5
         api_quantity = None
         
         for _ in range(max_attempts):
-            cart = self.get_cart(token)
-            cart_items = cart.get("items", [])
-            for item in cart_items:
-                item_product_id = item.get("product", {}).get("_id") or item.get("productId")
-                if item_product_id == product_id:
-                    api_quantity = item.get("quantity", 0)
-                    if api_quantity == expected_quantity:
-                        return api_quantity
+            quantity = self.get_cart_model(token).quantity(product_id)
+            if quantity is not None:
+                api_quantity = quantity
+                if api_quantity == expected_quantity:
+                    return api_quantity
             time.sleep(0.5)
         
         # Final check if still None
         if api_quantity is None:
-            cart = self.get_cart(token)
-            cart_items = cart.get("items", [])
-            for item in cart_items:
-                item_product_id = item.get("product", {}).get("_id") or item.get("productId")
-                if item_product_id == product_id:
-                    api_quantity = item.get("quantity", 0)
-                    break
+            api_quantity = self.get_cart_model(token).quantity(product_id)
         
         return api_quantity if api_quantity is not None else 0
 
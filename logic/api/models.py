@@ -0,0 +1,224 @@
+"""
+Typed response models for MyStore API.
+Thin __slots__ wrappers over the parsed JSON (no copy): fields are read on
+access and collections build their models and id index only when first used.
+Models stay dict-compatible (model["_id"], model.get("stock")) so callers can
+switch from raw responses gradually.
+"""
+
+import random
+from typing import Callable, Dict, Generic, Iterator, List, Optional, TypeVar
+
+
+class Model:
+    """Base model over one JSON object"""
+    
+    __slots__ = ("data",)
+    
+    def __init__(self, data: Dict):
+        self.data = data
+    
+    @property
+    def id(self) -> Optional[str]:
+        return self.data.get("_id") or self.data.get("id")
+    
+    def get(self, key: str, default=None):
+        return self.data.get(key, default)
+    
+    def __getitem__(self, key: str):
+        return self.data[key]
+    
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.id})"
+
+
+class Product(Model):
+    """Catalog product"""
+    
+    __slots__ = ()
+    
+    @property
+    def name(self) -> str:
+        return self.data.get("name", "")
+    
+    @property
+    def price(self) -> float:
+        return self.data.get("price", 0)
+    
+    @property
+    def stock(self) -> int:
+        return self.data.get("stock", 0)
+    
+    @property
+    def category(self) -> Optional[str]:
+        return self.data.get("category")
+
+
+class CartItem(Model):
+    """Cart or order line (product may be populated or just an id)"""
+    
+    __slots__ = ("_product",)
+    
+    def __init__(self, data: Dict):
+        super().__init__(data)
+        self._product: Optional[Product] = None
+    
+    @property
+    def product_id(self) -> Optional[str]:
+        product = self.data.get("product")
+        if isinstance(product, dict):
+            return product.get("_id")
+        return product or self.data.get("productId")
+    
+    @property
+    def product(self) -> Optional[Product]:
+        if self._product is None and isinstance(self.data.get("product"), dict):
+            self._product = Product(self.data["product"])
+        return self._product
+    
+    @property
+    def quantity(self) -> int:
+        return self.data.get("quantity", 0)
+
+
+M = TypeVar("M", bound=Model)
+
+
+class Collection(Generic[M]):
+    """Lazily built models over a JSON list, indexed by id on first lookup"""
+    
+    __slots__ = ("_data", "_model", "_models", "_by_id", "_key")
+    
+    def __init__(self, data: List[Dict], model: Callable[[Dict], M], key: Callable[[M], Optional[str]] = None):
+        """
+        Args:
+            data: parsed JSON list
+            model: model class
+            key: id of a model (default: model.id)
+        """
+        self._data = data
+        self._model = model
+        self._models: List[Optional[M]] = [None] * len(data)
+        self._by_id: Optional[Dict[str, M]] = None
+        self._key = key or (lambda item: item.id)
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def __getitem__(self, index: int) -> M:
+        model = self._models[index]
+        if model is None:
+            model = self._models[index] = self._model(self._data[index])
+        return model
+    
+    def __iter__(self) -> Iterator[M]:
+        for index in range(len(self._data)):
+            yield self[index]
+    
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self.by_id
+    
+    @property
+    def by_id(self) -> Dict[str, M]:
+        """{id: model} (built once)"""
+        if self._by_id is None:
+            self._by_id = {self._key(model): model for model in self}
+        return self._by_id
+    
+    @property
+    def ids(self) -> List[str]:
+        return list(self.by_id)
+    
+    def get(self, item_id: str) -> Optional[M]:
+        return self.by_id.get(item_id)
+
+
+class Catalog(Collection[Product]):
+    """Product list with stock filters"""
+    
+    __slots__ = ("_in_stock",)
+    
+    def __init__(self, data: List[Dict]):
+        super().__init__(data, Product)
+        self._in_stock: Dict[int, List[Product]] = {}
+    
+    def in_stock(self, min_stock: int = 1) -> List[Product]:
+        """Products with stock >= min_stock (cached per threshold)"""
+        if min_stock not in self._in_stock:
+            self._in_stock[min_stock] = [product for product in self if product.stock >= min_stock]
+        return self._in_stock[min_stock]
+    
+    def random(self, min_stock: int = 1, rng: random.Random = None) -> Optional[Product]:
+        """Random product with stock >= min_stock (None if there is none)"""
+        candidates = self.in_stock(min_stock)
+        return (rng or random).choice(candidates) if candidates else None
+
+
+class Cart(Model):
+    """User cart with items indexed by product id"""
+    
+    __slots__ = ("_items",)
+    
+    def __init__(self, data: Dict):
+        super().__init__(data)
+        self._items: Optional[Collection[CartItem]] = None
+    
+    @property
+    def items(self) -> Collection[CartItem]:
+        if self._items is None:
+            self._items = Collection(self.data.get("items", []), CartItem, key=lambda item: item.product_id)
+        return self._items
+    
+    def item(self, product_id: str) -> Optional[CartItem]:
+        return self.items.get(product_id)
+    
+    def quantity(self, product_id: str) -> Optional[int]:
+        """Quantity of product in cart (None if not in cart)"""
+        item = self.item(product_id)
+        return item.quantity if item else None
+    
+    @property
+    def product_ids(self) -> List[str]:
+        return self.items.ids
+
+
+class Order(Model):
+    """Placed order"""
+    
+    __slots__ = ("_items",)
+    
+    def __init__(self, data: Dict):
+        super().__init__(data)
+        self._items: Optional[Collection[CartItem]] = None
+    
+    @property
+    def status(self) -> Optional[str]:
+        return self.data.get("status")
+    
+    @property
+    def total_amount(self) -> float:
+        return self.data.get("totalAmount", 0)
+    
+    @property
+    def items(self) -> Collection[CartItem]:
+        if self._items is None:
+            self._items = Collection(self.data.get("items", []), CartItem, key=lambda item: item.product_id)
+        return self._items
+
+
+class User(Model):
+    """Registered user"""
+    
+    __slots__ = ()
+    
+    @property
+    def name(self) -> str:
+        return self.data.get("name", "")
+    
+    @property
+    def email(self) -> str:
+        return self.data.get("email", "")
+    
+    @property
+    def role(self) -> Optional[str]:
+        return self.data.get("role")
@@ -5,6 +5,7 @@ Handles order creation and retrieval.
 
 from typing import Dict, List
 from infra.api_wrapper import ApiWrapper
+from logic.api.models import Collection, Order
 from utils.constants import ApiEndpoints
 
 
@@ -48,6 +49,15 @@ class OrdersApi:
         response.raise_for_status()
         return response.json()
     
+    def get_my_order_list(self, token: str) -> Collection[Order]:
+        """
+        Get current user's orders as typed collection.
+        
+        Returns:
+            orders indexed by id
+        """
+        return Collection(self.get_my_orders(token), Order)
+    
     def get_order_by_id(self, order_id: str, token: str) -> Dict:
         """
         Get order by ID.
@@ -3,8 +3,10 @@ Products API client for MyStore.
 Handles product listing and search operations.
 """
 
-from typing import Dict, List
+from typing import Dict, Iterator, List
 from infra.api_wrapper import ApiWrapper
+from infra.pagination import iter_pages
+from logic.api.models import Catalog
 from utils.constants import ApiEndpoints
 
 
@@ -54,15 +56,37 @@ class ProductsApi:
         response.raise_for_status()
         return response.json()
     
+    def iter_products(self, limit: int = None, prefetch: int = None) -> Iterator[Dict]:
+        """
+        Iterate all products page by page.
+        
+        Args:
+            limit: page size (default: config 'pagination.page_size')
+            prefetch: pages fetched ahead concurrently (default: config 'pagination.prefetch')
+        """
+        config = self.api.config
+        return iter_pages(
+            lambda page, page_limit: self.get_products(page=page, limit=page_limit),
+            limit=limit or config.get("pagination.page_size", 100),
+            key="products",
+            prefetch=config.get("pagination.prefetch", 0) if prefetch is None else prefetch
+        )
+    
     def get_all_products(self) -> List[Dict]:
         """
-        Get all products (for testing).
+        Get all products (for testing), across all pages.
         
         Returns:
             list of all products
         """
-        result = self.get_products(page=1, limit=1000)
-        if isinstance(result, list):
-            return result
-        return result.get("products", [])
+        return list(self.iter_products())
+    
+    def get_catalog(self) -> Catalog:
+        """
+        Get all products as typed catalog.
+        
+        Returns:
+            Catalog with id index and stock filters
+        """
+        return Catalog(self.get_all_products())
 
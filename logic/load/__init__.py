@@ -0,0 +1 @@
+# Load test flows for MyStore
@@ -0,0 +1,226 @@
+"""
+Checkout contention stress scenario for MyStore.
+Many users race to buy the last units of one product: a product with stock K
+is created, N >> K users put it in their cart, then all of them place the
+order at the same moment (released together by a barrier). A correct backend
+accepts exactly K orders, rejects the rest and ends with stock 0; latency of
+the racing checkouts shows how the backend behaves under row lock contention.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+import requests
+
+from infra.api_wrapper import ApiWrapper
+from infra.latency_budget import percentile
+from infra.product_allocator import DEDICATED_PREFIX
+from logic.api.cart_api import CartApi
+from logic.api.orders_api import OrdersApi
+from logic.api.products_api import ProductsApi
+from utils.data_factory import DataFactory
+
+
+class CheckoutAttempt:
+    """Outcome of one racing checkout"""
+    
+    __slots__ = ("status", "latency_ms", "order_id", "error")
+    
+    def __init__(self, status: Optional[int], latency_ms: float, order_id: str = None, error: str = None):
+        self.status = status
+        self.latency_ms = latency_ms
+        self.order_id = order_id
+        self.error = error
+    
+    @property
+    def succeeded(self) -> bool:
+        return self.status is not None and self.status < 400
+    
+    @property
+    def rejected(self) -> bool:
+        """Refused by the backend (out of stock) - the expected outcome for N - K users"""
+        return self.status is not None and 400 <= self.status < 500
+
+
+class ContentionTrial:
+    """Result of one trial: N users racing for K units"""
+    
+    def __init__(self, users: int, stock: int, attempts: List[CheckoutAttempt], final_stock: Optional[int]):
+        self.users = users
+        self.stock = stock
+        self.attempts = attempts
+        self.final_stock = final_stock
+    
+    @property
+    def succeeded(self) -> int:
+        return sum(attempt.succeeded for attempt in self.attempts)
+    
+    @property
+    def rejected(self) -> int:
+        return sum(attempt.rejected for attempt in self.attempts)
+    
+    @property
+    def errors(self) -> List[str]:
+        """Attempts that neither succeeded nor were rejected (5xx, connection errors)"""
+        return [
+            attempt.error or f"HTTP {attempt.status}"
+            for attempt in self.attempts
+            if not attempt.succeeded and not attempt.rejected
+        ]
+    
+    @property
+    def oversold(self) -> int:
+        """Orders accepted beyond the available stock"""
+        return max(self.succeeded - self.stock, 0)
+    
+    def latency(self, outcome: str = "all") -> Dict[str, float]:
+        """
+        Latency distribution of checkouts.
+        
+        Args:
+            outcome: "all", "succeeded" or "rejected"
+        Returns:
+            {"n", "p50", "p95", "p99", "max"} (empty if no attempt matches)
+        """
+        values = [
+            attempt.latency_ms for attempt in self.attempts
+            if outcome == "all" or getattr(attempt, outcome)
+        ]
+        if not values:
+            return {}
+        return {
+            "n": len(values),
+            "p50": percentile(values, 50),
+            "p95": percentile(values, 95),
+            "p99": percentile(values, 99),
+            "max": max(values)
+        }
+    
+    def to_dict(self) -> Dict:
+        return {
+            "users": self.users,
+            "stock": self.stock,
+            "succeeded": self.succeeded,
+            "rejected": self.rejected,
+            "errors": len(self.errors),
+            "final_stock": self.final_stock,
+            "latency": {outcome: self.latency(outcome) for outcome in ("all", "succeeded", "rejected")}
+        }
+
+
+def format_trials(trials: List[ContentionTrial]) -> str:
+    """Format trials as report lines"""
+    lines = [
+        f"{'N':>5} {'K':>5} {'ok':>5} {'rej':>5} {'err':>5} {'stock':>6} "
+        f"{'outcome':<10} {'n':>5} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}"
+    ]
+    for trial in trials:
+        final_stock = "-" if trial.final_stock is None else trial.final_stock
+        for outcome in ("succeeded", "rejected"):
+            stats = trial.latency(outcome)
+            if not stats:
+                continue
+            lines.append(
+                f"{trial.users:>5} {trial.stock:>5} {trial.succeeded:>5} {trial.rejected:>5} "
+                f"{len(trial.errors):>5} {final_stock:>6} {outcome:<10} {stats['n']:>5} "
+                f"{stats['p50']:>9.1f} {stats['p95']:>9.1f} {stats['p99']:>9.1f} {stats['max']:>9.1f}"
+            )
+    return "\n".join(lines)
+
+
+class CheckoutContention:
+    """Race N users for the last K units of a product"""
+    
+    def __init__(
+        self,
+        create_user: Callable,
+        create_product: Callable,
+        admin_token: str,
+        cleanup=None,
+        pool_size: int = 64
+    ):
+        """
+        Args:
+            create_user: create_test_user fixture function
+            create_product: create_test_product fixture function
+            admin_token: admin token for product creation
+            cleanup: cleanup manager for orders placed during trials
+            pool_size: connections (and threads) for the racing requests
+        """
+        self.create_user = create_user
+        self.create_product = create_product
+        self.admin_token = admin_token
+        self.cleanup = cleanup
+        self.pool_size = pool_size
+        self.api = ApiWrapper(pool_size=pool_size, record_latency=False)
+        self.cart_api = CartApi(self.api)
+        self.orders_api = OrdersApi(self.api)
+        self.products_api = ProductsApi(self.api)
+        self._tokens: List[str] = []
+    
+    def close(self):
+        self.api.close()
+    
+    def tokens(self, count: int) -> List[str]:
+        """Tokens of count users (created on first need, reused across trials)"""
+        while len(self._tokens) < count:
+            self._tokens.append(self.create_user()["token"])
+        return self._tokens[:count]
+    
+    def _checkout(self, barrier: threading.Barrier, token: str, product: Dict) -> CheckoutAttempt:
+        barrier.wait()
+        started = time.perf_counter()
+        try:
+            order = self.orders_api.create_order(
+                items=[{"product": product["_id"], "quantity": 1}],
+                total_amount=product["price"],
+                token=token
+            )
+        except requests.HTTPError as e:
+            return CheckoutAttempt(e.response.status_code, (time.perf_counter() - started) * 1000)
+        except requests.RequestException as e:
+            return CheckoutAttempt(None, (time.perf_counter() - started) * 1000, error=type(e).__name__)
+        latency_ms = (time.perf_counter() - started) * 1000
+        
+        # Register for cleanup
+        order_id = order.get("_id") or order.get("order", {}).get("_id")
+        if order_id and self.cleanup:
+            self.cleanup.register_order(order_id)
+        return CheckoutAttempt(200, latency_ms, order_id)
+    
+    def run(self, users: int, stock: int) -> ContentionTrial:
+        """
+        Run one trial.
+        
+        Args:
+            users: N racing users
+            stock: K units of the contended product
+        """
+        tokens = self.tokens(users)
+        # Dedicated name: other workers' product allocators never hand it out during the race
+        product = self.create_product(
+            self.admin_token,
+            name=f"{DEDICATED_PREFIX}Contended {DataFactory.unique_id()}",
+            stock=stock
+        )
+        product = product.get("product", product)
+        threads = min(users, self.pool_size)
+        
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            # Everyone gets the product into the cart first - only the checkout races
+            list(executor.map(lambda token: self.cart_api.clear_cart(token), tokens))
+            list(executor.map(lambda token: self.cart_api.add_to_cart(product["_id"], 1, token), tokens))
+            
+            # Batches of pool size: more simultaneous requests than connections would queue client-side
+            attempts: List[CheckoutAttempt] = []
+            for start in range(0, users, threads):
+                batch = tokens[start:start + threads]
+                barrier = threading.Barrier(len(batch))
+                attempts += executor.map(lambda token: self._checkout(barrier, token, product), batch)
+            
+            list(executor.map(lambda token: self.cart_api.clear_cart(token), tokens))
+        
+        final_stock = self.products_api.get_product_by_id(product["_id"]).get("stock")
+        return ContentionTrial(users, stock, attempts, final_stock)
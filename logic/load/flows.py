@@ -0,0 +1,258 @@
+"""
+Load flows for MyStore.
+Each flow issues one user journey through the logic/api clients, so load
+runs exercise exactly the calls the functional tests verify.
+
+Flows are split in two phases:
+- prepare(): runs once, creates test data, returns plain (picklable) params
+- __call__(): one iteration, safe to call concurrently from many threads
+"""
+
+import itertools
+import queue
+import random
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Type
+
+from infra.api_wrapper import ApiWrapper
+from utils.cleanup_utils import CleanupManager
+from logic.api.auth_api import AuthApi
+from logic.api.cart_api import CartApi
+from logic.api.orders_api import OrdersApi
+from logic.api.products_api import ProductsApi
+
+
+class FlowData:
+    """Test data factories available to flow preparation"""
+    
+    def __init__(
+        self,
+        create_user: Callable,
+        create_product: Callable,
+        admin_token: str,
+        cleanup=None,
+        users: int = 10,
+        checkout_users: int = 64
+    ):
+        """
+        Args:
+            create_user: create_test_user fixture function
+            create_product: create_test_product fixture function
+            admin_token: admin token for product creation
+            cleanup: cleanup manager for resources created during the run
+            users: number of users to spread per-user flows over
+            checkout_users: users of flows that need one user per in-flight iteration
+                (checkout clears the cart) - at least the max in-flight requests to never wait
+        """
+        self.create_user = create_user
+        self.create_product = create_product
+        self.admin_token = admin_token
+        self.cleanup = cleanup
+        self.users = users
+        self.checkout_users = checkout_users
+    
+    def user_credentials(self, count: int = None) -> List[Dict]:
+        """Create count users (default: users), return [{email, password, token}]"""
+        credentials = []
+        for _ in range(count or self.users):
+            user = self.create_user()
+            credentials.append({
+                "email": user["email"],
+                "password": user["password"],
+                "token": user["token"]
+            })
+        return credentials
+    
+    def high_stock_product(self) -> Dict:
+        """Create product that cannot run out of stock during a run"""
+        product = self.create_product(self.admin_token, stock=1_000_000)
+        return product.get("product", product)
+
+
+class LoadFlow(ABC):
+    """Base class for load flows"""
+    
+    name = ""
+    
+    def __init__(self, api: ApiWrapper, params: Dict, cleanup=None):
+        self.api = api
+        self.params = params
+        self.cleanup = cleanup
+    
+    @classmethod
+    def prepare(cls, data: FlowData) -> Dict:
+        """Create test data for the flow, return params"""
+        return {}
+    
+    @abstractmethod
+    def __call__(self):
+        """Run one iteration"""
+    
+    def export_resources(self) -> Dict:
+        """Resources created during the run (for cleanup in another process)"""
+        return self.cleanup.resources() if self.cleanup else {}
+
+
+class _PerUserFlow(LoadFlow):
+    """Flow that spreads iterations round-robin over prepared users"""
+    
+    def __init__(self, api: ApiWrapper, params: Dict, cleanup=None):
+        super().__init__(api, params, cleanup)
+        self._users = itertools.cycle(params["users"])
+        self._lock = threading.Lock()
+    
+    def _next_user(self) -> Dict:
+        with self._lock:
+            return next(self._users)
+
+
+class _ExclusiveUserFlow(LoadFlow):
+    """Flow that gives every in-flight iteration its own user (iterations wait for a free one)"""
+    
+    def __init__(self, api: ApiWrapper, params: Dict, cleanup=None):
+        super().__init__(api, params, cleanup)
+        self._free_users: queue.Queue = queue.Queue()
+        for user in params["users"]:
+            self._free_users.put(user)
+    
+    @contextmanager
+    def _user(self) -> Iterator[Dict]:
+        user = self._free_users.get()
+        try:
+            yield user
+        finally:
+            self._free_users.put(user)
+
+
+class LoginFlow(_PerUserFlow):
+    """POST login with existing user credentials"""
+    
+    name = "login"
+    
+    def __init__(self, api: ApiWrapper, params: Dict, cleanup=None):
+        super().__init__(api, params, cleanup)
+        self.auth_api = AuthApi(api)
+    
+    @classmethod
+    def prepare(cls, data: FlowData) -> Dict:
+        return {"users": data.user_credentials()}
+    
+    def __call__(self):
+        user = self._next_user()
+        self.auth_api.login(user["email"], user["password"])
+
+
+class CatalogPaginationFlow(LoadFlow):
+    """GET a random catalog page"""
+    
+    name = "catalog"
+    
+    def __init__(self, api: ApiWrapper, params: Dict, cleanup=None):
+        super().__init__(api, params, cleanup)
+        self.products_api = ProductsApi(api)
+    
+    @classmethod
+    def prepare(cls, data: FlowData) -> Dict:
+        return {"pages": 5, "limit": 20}
+    
+    def __call__(self):
+        page = random.randint(1, self.params["pages"])
+        self.products_api.get_products(page=page, limit=self.params["limit"])
+
+
+class SearchFlow(LoadFlow):
+    """GET product search for a known product name"""
+    
+    name = "search"
+    
+    def __init__(self, api: ApiWrapper, params: Dict, cleanup=None):
+        super().__init__(api, params, cleanup)
+        self.products_api = ProductsApi(api)
+    
+    @classmethod
+    def prepare(cls, data: FlowData) -> Dict:
+        product = data.high_stock_product()
+        return {"query": product["name"]}
+    
+    def __call__(self):
+        self.products_api.search_products(self.params["query"])
+
+
+class AddToCartFlow(_PerUserFlow):
+    """POST add product to cart"""
+    
+    name = "add_to_cart"
+    
+    def __init__(self, api: ApiWrapper, params: Dict, cleanup=None):
+        super().__init__(api, params, cleanup)
+        self.cart_api = CartApi(api)
+    
+    @classmethod
+    def prepare(cls, data: FlowData) -> Dict:
+        product = data.high_stock_product()
+        return {"users": data.user_credentials(), "product_id": product["_id"]}
+    
+    def __call__(self):
+        user = self._next_user()
+        self.cart_api.add_to_cart(self.params["product_id"], 1, user["token"])
+
+
+class CheckoutFlow(_ExclusiveUserFlow):
+    """Add product to cart, place order for it, clear cart (no two iterations share a cart)"""
+    
+    name = "checkout"
+    
+    def __init__(self, api: ApiWrapper, params: Dict, cleanup=None):
+        super().__init__(api, params, cleanup)
+        self.cart_api = CartApi(api)
+        self.orders_api = OrdersApi(api)
+    
+    @classmethod
+    def prepare(cls, data: FlowData) -> Dict:
+        product = data.high_stock_product()
+        return {
+            "users": data.user_credentials(data.checkout_users),
+            "product_id": product["_id"],
+            "price": product["price"]
+        }
+    
+    def __call__(self):
+        product_id = self.params["product_id"]
+        with self._user() as user:
+            self.cart_api.add_to_cart(product_id, 1, user["token"])
+            order = self.orders_api.create_order(
+                items=[{"product": product_id, "quantity": 1}],
+                total_amount=self.params["price"],
+                token=user["token"]
+            )
+            self.cart_api.clear_cart(user["token"])
+        
+        # Register for cleanup
+        order_id = order.get("_id") or order.get("order", {}).get("_id")
+        if order_id and self.cleanup:
+            self.cleanup.register_order(order_id)
+
+
+FLOWS: Dict[str, Type[LoadFlow]] = {
+    flow.name: flow
+    for flow in (LoginFlow, CatalogPaginationFlow, SearchFlow, AddToCartFlow, CheckoutFlow)
+}
+
+
+def get_flow(name: str) -> Type[LoadFlow]:
+    """Get flow class by name"""
+    if name not in FLOWS:
+        raise ValueError(f"Unknown load flow: {name}. Available: {', '.join(FLOWS)}")
+    return FLOWS[name]
+
+
+def build_flow(name: str, params: Dict, pool_size: int = 64) -> LoadFlow:
+    """
+    Build flow with its own connection pool.
+    Module-level so it can be sent to worker processes via functools.partial.
+    Created resources are tracked locally and exported with export_resources().
+    """
+    api = ApiWrapper(pool_size=pool_size, record_latency=False)
+    return get_flow(name)(api, params, CleanupManager())
@@ -0,0 +1,127 @@
+"""
+Order lifecycle pipeline for MyStore.
+Mirrors the warehouse batch jobs: customers keep placing orders while admin
+stages move them pending -> processing -> shipped -> delivered, each stage
+with its own concurrency and a bounded queue in front (infra/stage_pipeline.py).
+Every cancel_every-th order is cancelled instead of processed. After the
+run, every order's status is checked against its expected final state.
+"""
+
+from typing import Dict, List
+
+from infra.stage_pipeline import PipelineResult, Stage, StagePipeline
+from logic.api.admin_api import AdminApi
+from logic.api.orders_api import OrdersApi
+
+# Stage names in pipeline order (first one places the order)
+STAGES = ("create", "processing", "shipped", "delivered")
+
+
+class OrderLifecycle:
+    """Place orders and move them through the status lifecycle"""
+    
+    def __init__(
+        self,
+        orders_api: OrdersApi,
+        admin_api: AdminApi,
+        admin_token: str,
+        customer_tokens: List[str],
+        product: Dict,
+        cleanup=None,
+        cancel_every: int = 0
+    ):
+        """
+        Args:
+            orders_api: Orders API client (customer side)
+            admin_api: Admin API client (status updates)
+            admin_token: admin token for status updates
+            customer_tokens: tokens of customers placing orders (round robin)
+            product: high-stock product ordered by everyone
+            cleanup: cleanup manager for placed orders
+            cancel_every: cancel every n-th order instead of processing it (0 = never)
+        """
+        self.orders_api = orders_api
+        self.admin_api = admin_api
+        self.admin_token = admin_token
+        self.customer_tokens = customer_tokens
+        self.product = product
+        self.cleanup = cleanup
+        self.cancel_every = cancel_every
+        self.expected: Dict[str, str] = {}
+    
+    # ==================== STAGES ====================
+    
+    def place_order(self, index: int) -> Dict:
+        """Stage 'create': customer places order (status pending)"""
+        result = self.orders_api.create_order(
+            items=[{"product": self.product["_id"], "quantity": 1}],
+            total_amount=self.product["price"],
+            token=self.customer_tokens[index % len(self.customer_tokens)]
+        )
+        order_id = result.get("_id") or result.get("order", {}).get("_id")
+        
+        # Register for cleanup
+        if self.cleanup:
+            self.cleanup.register_order(order_id)
+        
+        cancelled = bool(self.cancel_every) and index % self.cancel_every == 0
+        self.expected[order_id] = "cancelled" if cancelled else STAGES[-1]
+        return {"id": order_id, "cancel": cancelled}
+    
+    def _transition(self, status: str):
+        def handle(order: Dict):
+            if order["cancel"]:
+                self.admin_api.update_order_status(order["id"], "cancelled", self.admin_token)
+                return None
+            self.admin_api.update_order_status(order["id"], status, self.admin_token)
+            return order
+        
+        return handle
+    
+    def stages(self, workers: Dict[str, int], queue_size: int = 50) -> List[Stage]:
+        """
+        Pipeline stages.
+        
+        Args:
+            workers: concurrency per stage name (missing stages get 1)
+            queue_size: capacity of each stage's input queue
+        """
+        handlers = [self.place_order] + [self._transition(status) for status in STAGES[1:]]
+        return [
+            Stage(name, handler, workers.get(name, 1), queue_size)
+            for name, handler in zip(STAGES, handlers)
+        ]
+    
+    # ==================== RUN ====================
+    
+    def run(
+        self,
+        orders: int,
+        workers: Dict[str, int],
+        queue_size: int = 50,
+        sample_interval: float = 0.25
+    ) -> PipelineResult:
+        """
+        Place orders and move each one to its final state.
+        
+        Args:
+            orders: number of orders
+            workers: concurrency per stage name
+            queue_size: capacity of each stage's input queue
+            sample_interval: seconds between queue depth samples
+        """
+        pipeline = StagePipeline(self.stages(workers, queue_size), sample_interval)
+        return pipeline.run(range(orders))
+    
+    def verify(self) -> List[str]:
+        """Orders not in their expected final state (read back via the admin orders list)"""
+        actual = {
+            order.get("_id"): order.get("status")
+            for order in self.admin_api.iter_orders(self.admin_token)
+            if order.get("_id") in self.expected
+        }
+        return [
+            f"{order_id}: expected {expected}, got {actual.get(order_id, 'missing')}"
+            for order_id, expected in self.expected.items()
+            if actual.get(order_id) != expected
+        ]
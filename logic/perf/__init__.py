@@ -0,0 +1 @@
+# Performance measurement flows for MyStore
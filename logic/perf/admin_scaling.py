@@ -0,0 +1,305 @@
+"""
+Admin list and stats scaling benchmark for MyStore.
+Admin list endpoints return whole tables, so their cost grows with the data.
+The benchmark seeds users, products and orders in steps, measures latency
+and payload size of every admin list endpoint at each step, and measures
+ADMIN_USER_DETAILS for one user with a growing number of orders (an N+1
+over orders shows up as a high cost per order). The series are then fitted
+to O(1)/O(n)/O(n log n)/O(n^2) models (see infra/complexity_fit.py).
+Super-linear fits and a high cost per order are flagged (scaling_flags()):
+as ScalingWarning by default, as failures with 'admin_scaling.enforce_fits'.
+
+ADMIN_STATS (the dashboard aggregation) is measured the same way against the
+total row count, and once more while concurrent writers place orders - the
+aggregation competing with writes is what shows up as database CPU spikes.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+from requests import Response
+
+from infra.api_wrapper import ApiWrapper
+from infra.complexity_fit import ComplexityFit, fit_complexity
+from infra.latency_budget import percentile
+from infra.pagination import page_items
+from infra.perf_stats import mann_whitney_u
+from logic.api.orders_api import OrdersApi
+from utils.constants import ApiEndpoints
+
+# Admin list endpoints: name -> (endpoint, items key in object responses)
+LIST_ENDPOINTS = {
+    "ADMIN_USERS": (ApiEndpoints.ADMIN_USERS, "users"),
+    "ADMIN_PRODUCTS": (ApiEndpoints.ADMIN_PRODUCTS, "products"),
+    "ADMIN_ORDERS": (ApiEndpoints.ADMIN_ORDERS, "orders")
+}
+
+
+class ScalingWarning(UserWarning):
+    """Endpoint fitted super-linear or above its cost per item (admin_scaling.enforce_fits off)"""
+
+
+def scaling_flags(fits: List[ComplexityFit], max_per_item: float = None) -> List[str]:
+    """Super-linear fits, and linear costs per item above max_per_item (ms)"""
+    flags = []
+    for fit in fits:
+        if fit.super_linear:
+            flags.append(f"{fit.name} fits {fit.model}")
+        if max_per_item is not None and fit.per_item > max_per_item:
+            flags.append(f"{fit.name} costs {fit.per_item:.3f} ms per item (> {max_per_item})")
+    return flags
+
+
+class ScalingSeries:
+    """Latency and payload of one endpoint at increasing sizes"""
+    
+    def __init__(self, name: str):
+        self.name = name
+        self.sizes: List[int] = []
+        self.latencies_ms: List[float] = []
+        self.payloads: List[int] = []
+    
+    def add(self, size: int, latency_ms: float, payload: int):
+        self.sizes.append(size)
+        self.latencies_ms.append(latency_ms)
+        self.payloads.append(payload)
+    
+    def latency_fit(self, **kwargs) -> ComplexityFit:
+        """Complexity of median latency vs size"""
+        return fit_complexity(self.sizes, self.latencies_ms, name=self.name, **kwargs)
+    
+    def payload_fit(self, **kwargs) -> ComplexityFit:
+        """Complexity of response bytes vs size"""
+        return fit_complexity(self.sizes, self.payloads, name=self.name, **kwargs)
+    
+    @property
+    def max_payload(self) -> int:
+        return max(self.payloads) if self.payloads else 0
+    
+    def to_dict(self) -> Dict:
+        return {
+            "sizes": self.sizes,
+            "latencies_ms": self.latencies_ms,
+            "payloads": self.payloads
+        }
+
+
+class StatsUnderWrites:
+    """ADMIN_STATS latency idle vs. while concurrent writers place orders"""
+    
+    def __init__(self, idle_ms: List[float], busy_ms: List[float], writers: int, writes: int):
+        self.idle_ms = idle_ms
+        self.busy_ms = busy_ms
+        self.writers = writers
+        self.writes = writes
+        self.comparison = mann_whitney_u(idle_ms, busy_ms)
+    
+    @staticmethod
+    def _distribution(values: List[float]) -> Dict[str, float]:
+        return {
+            "n": len(values),
+            "p50": percentile(values, 50),
+            "p95": percentile(values, 95),
+            "max": max(values) if values else 0.0
+        }
+    
+    @property
+    def slowdown(self) -> float:
+        """Busy p50 / idle p50"""
+        idle = percentile(self.idle_ms, 50)
+        return percentile(self.busy_ms, 50) / idle if idle else 0.0
+    
+    def slower_than(self, max_slowdown: float, alpha: float = 0.01) -> bool:
+        """Busy stats significantly slower (Mann-Whitney U) AND median slowdown above max_slowdown"""
+        return self.comparison["p_value"] < alpha and self.comparison["cliffs_delta"] > 0 and self.slowdown > max_slowdown
+    
+    def to_dict(self) -> Dict:
+        return {
+            "writers": self.writers,
+            "writes": self.writes,
+            "idle": self._distribution(self.idle_ms),
+            "busy": self._distribution(self.busy_ms),
+            "slowdown": self.slowdown,
+            "comparison": self.comparison
+        }
+    
+    def __str__(self) -> str:
+        idle = self._distribution(self.idle_ms)
+        busy = self._distribution(self.busy_ms)
+        p_value = self.comparison["p_value"]
+        return "\n".join([
+            f"{'ADMIN_STATS':<24} {'n':>4} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9}",
+            f"{'idle':<24} {idle['n']:>4} {idle['p50']:>9.1f} {idle['p95']:>9.1f} {idle['max']:>9.1f}",
+            f"{f'{self.writers} writers':<24} {busy['n']:>4} {busy['p50']:>9.1f} {busy['p95']:>9.1f} {busy['max']:>9.1f}",
+            f"slowdown x{self.slowdown:.2f} (p={p_value:.3f}), {self.writes} orders written"
+        ])
+
+
+class AdminScalingBenchmark:
+    """Seed data in steps and measure admin list and user details endpoints"""
+    
+    def __init__(
+        self,
+        api: ApiWrapper,
+        admin_token: str,
+        create_user: Callable,
+        create_product: Callable,
+        cleanup=None,
+        repeats: int = 5
+    ):
+        """
+        Args:
+            api: API wrapper used for measurements (latency recording off)
+            admin_token: token of the admin the endpoints are measured with
+            create_user: create_test_user fixture function
+            create_product: create_test_product fixture function
+            cleanup: cleanup manager for seeded orders
+            repeats: requests per measurement (median is reported, one warm-up extra)
+        """
+        self.api = api
+        self.admin_token = admin_token
+        self.create_user = create_user
+        self.create_product = create_product
+        self.cleanup = cleanup
+        self.repeats = repeats
+        self.orders_api = OrdersApi(api)
+        self._product: Optional[Dict] = None
+        self._seeded = 0
+    
+    # ==================== SEEDING ====================
+    
+    def _order_product(self) -> Dict:
+        if self._product is None:
+            product = self.create_product(self.admin_token, stock=1_000_000)
+            self._product = product.get("product", product)
+        return self._product
+    
+    def _place_order(self, token: str):
+        product = self._order_product()
+        order = self.orders_api.create_order(
+            items=[{"product": product["_id"], "quantity": 1}],
+            total_amount=product["price"],
+            token=token
+        )
+        
+        # Register for cleanup
+        order_id = order.get("_id") or order.get("order", {}).get("_id")
+        if order_id and self.cleanup:
+            self.cleanup.register_order(order_id)
+    
+    def seed(self, total: int):
+        """Seed users, products and orders until total of each was created by the benchmark"""
+        for _ in range(total - self._seeded):
+            user = self.create_user()
+            self.create_product(self.admin_token)
+            self._place_order(user["token"])
+        self._seeded = max(self._seeded, total)
+    
+    # ==================== MEASUREMENT ====================
+    
+    def sample(self, endpoint: str, count: int) -> Tuple[List[float], Response]:
+        """Latencies (ms) of count requests after one warm-up, plus the last response"""
+        latencies = []
+        response = None
+        for attempt in range(count + 1):
+            started = time.perf_counter()
+            response = self.api.get(endpoint, token=self.admin_token)
+            response.raise_for_status()
+            if attempt:
+                latencies.append((time.perf_counter() - started) * 1000)
+        return latencies, response
+    
+    def measure(self, endpoint: str) -> Tuple[float, Response]:
+        """Median latency (ms) over repeats, plus the last response"""
+        latencies, response = self.sample(endpoint, self.repeats)
+        return percentile(latencies, 50), response
+    
+    def table_rows(self) -> int:
+        """Rows of the tables stats aggregate over (users + products + orders)"""
+        rows = 0
+        for endpoint, key in LIST_ENDPOINTS.values():
+            response = self.api.get(endpoint, token=self.admin_token)
+            response.raise_for_status()
+            rows += len(page_items(response.json(), key))
+        return rows
+    
+    def run_lists(self, sizes: List[int]) -> List[ScalingSeries]:
+        """
+        Measure admin list endpoints after seeding each size.
+        
+        Args:
+            sizes: seeded totals, increasing (each list also holds pre-existing data;
+                the series size is the item count the endpoint actually returned)
+        """
+        series = {name: ScalingSeries(name) for name in LIST_ENDPOINTS}
+        for size in sorted(sizes):
+            self.seed(size)
+            for name, (endpoint, key) in LIST_ENDPOINTS.items():
+                latency_ms, response = self.measure(endpoint)
+                series[name].add(len(page_items(response.json(), key)), latency_ms, len(response.content))
+        return list(series.values())
+    
+    def run_user_details(self, order_counts: List[int]) -> ScalingSeries:
+        """
+        Measure ADMIN_USER_DETAILS of one NEW user with a growing number of orders.
+        
+        Args:
+            order_counts: orders of the user at each step, increasing
+        """
+        series = ScalingSeries("ADMIN_USER_DETAILS")
+        user = self.create_user()
+        user_id = user["user_id"]
+        endpoint = ApiEndpoints.ADMIN_USER_DETAILS.format(id=user_id)
+        orders = 0
+        for count in sorted(order_counts):
+            for _ in range(count - orders):
+                self._place_order(user["token"])
+            orders = max(orders, count)
+            latency_ms, response = self.measure(endpoint)
+            series.add(orders, latency_ms, len(response.content))
+        return series
+    
+    def run_stats(self, sizes: List[int]) -> ScalingSeries:
+        """
+        Measure ADMIN_STATS after seeding each size.
+        
+        Args:
+            sizes: seeded totals, increasing (series size is the total row count of all tables)
+        """
+        series = ScalingSeries("ADMIN_STATS")
+        for size in sorted(sizes):
+            self.seed(size)
+            latency_ms, response = self.measure(ApiEndpoints.ADMIN_STATS)
+            series.add(self.table_rows(), latency_ms, len(response.content))
+        return series
+    
+    def run_stats_under_writes(self, writers: int, requests: int) -> StatsUnderWrites:
+        """
+        Measure ADMIN_STATS idle, then again while writers place orders nonstop.
+        
+        Args:
+            writers: concurrent NEW users placing orders
+            requests: stats requests per phase
+        """
+        tokens = [self.create_user()["token"] for _ in range(writers)]
+        idle_ms, _ = self.sample(ApiEndpoints.ADMIN_STATS, requests)
+        
+        stop = threading.Event()
+        
+        def write(token: str) -> int:
+            writes = 0
+            while not stop.is_set():
+                self._place_order(token)
+                writes += 1
+            return writes
+        
+        with ThreadPoolExecutor(max_workers=writers) as executor:
+            futures = [executor.submit(write, token) for token in tokens]
+            try:
+                busy_ms, _ = self.sample(ApiEndpoints.ADMIN_STATS, requests)
+            finally:
+                stop.set()
+            writes = sum(future.result() for future in futures)
+        return StatsUnderWrites(idle_ms, busy_ms, writers, writes)
@@ -0,0 +1,200 @@
+"""
+Authentication benchmark for MyStore.
+Register and login sit on every test's critical path, and login storms hit
+production after every marketing email. Their cost is dominated by password
+hashing (CPU-bound, per request), so latency and throughput are measured at
+increasing concurrency, and login attempts are split into cases that do or
+skip the hash:
+- valid:          user lookup + hash compare + token
+- wrong_password: user lookup + hash compare (rejected)
+- unknown_email:  user lookup only - unless the backend hashes a dummy password
+wrong_password minus unknown_email is the hashing cost. A measurable
+difference between the two rejected cases is also a timing leak: it tells an
+attacker which emails are registered.
+"""
+
+import itertools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+from infra.api_wrapper import ApiWrapper
+from infra.latency_budget import percentile
+from infra.perf_stats import bootstrap_ratio_ci, effect_size_label, mann_whitney_u
+from logic.api.auth_api import AuthApi
+from utils.data_factory import DataFactory
+
+CASES = ("register", "valid", "wrong_password", "unknown_email")
+
+
+class AuthLevel:
+    """Latencies and throughput of one case at one concurrency"""
+    
+    def __init__(self, case: str, concurrency: int, latencies_ms: List[float], errors: List[str], elapsed: float):
+        self.case = case
+        self.concurrency = concurrency
+        self.latencies_ms = latencies_ms
+        self.errors = errors
+        self.elapsed = elapsed
+    
+    @property
+    def throughput(self) -> float:
+        """Completed attempts per second"""
+        return len(self.latencies_ms) / self.elapsed if self.elapsed else 0.0
+    
+    def to_dict(self) -> Dict:
+        return {
+            "case": self.case,
+            "concurrency": self.concurrency,
+            "n": len(self.latencies_ms),
+            "errors": len(self.errors),
+            "throughput": self.throughput,
+            "p50_ms": percentile(self.latencies_ms, 50),
+            "p95_ms": percentile(self.latencies_ms, 95),
+            "p99_ms": percentile(self.latencies_ms, 99)
+        }
+
+
+def format_levels(levels: List[AuthLevel], server_cores: Optional[int] = None) -> str:
+    """Format levels as report lines (throughput also per server core when the server's cores are known)"""
+    per_core = f" {'req/s/core':>10}" if server_cores else ""
+    lines = [
+        f"{'case':<16} {'conc':>5} {'n':>5} {'err':>4} {'req/s':>8}{per_core} "
+        f"{'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}"
+    ]
+    for level in levels:
+        summary = level.to_dict()
+        per_core = f" {level.throughput / server_cores:>10.2f}" if server_cores else ""
+        lines.append(
+            f"{level.case:<16} {level.concurrency:>5} {summary['n']:>5} {summary['errors']:>4} "
+            f"{level.throughput:>8.1f}{per_core} "
+            f"{summary['p50_ms']:>9.1f} {summary['p95_ms']:>9.1f} {summary['p99_ms']:>9.1f}"
+        )
+    return "\n".join(lines)
+
+
+class FailedLoginTiming:
+    """Wrong-password vs unknown-email latency comparison"""
+    
+    def __init__(self, wrong_password_ms: List[float], unknown_email_ms: List[float], alpha: float = 0.01):
+        self.wrong_password_ms = wrong_password_ms
+        self.unknown_email_ms = unknown_email_ms
+        self.alpha = alpha
+        self.test = mann_whitney_u(unknown_email_ms, wrong_password_ms)
+        self.ratio = bootstrap_ratio_ci(unknown_email_ms, wrong_password_ms)
+    
+    @property
+    def hash_cost_ms(self) -> float:
+        """Median extra time of the path that checks a password"""
+        return percentile(self.wrong_password_ms, 50) - percentile(self.unknown_email_ms, 50)
+    
+    @property
+    def effect(self) -> str:
+        return effect_size_label(self.test["cliffs_delta"])
+    
+    @property
+    def leaks(self) -> bool:
+        """Statistically significant, non-negligible difference with the ratio CI excluding 1"""
+        excludes_one = self.ratio["low"] > 1 or self.ratio["high"] < 1
+        return self.test["p_value"] < self.alpha and self.effect != "negligible" and excludes_one
+    
+    def to_dict(self) -> Dict:
+        return {
+            "wrong_password_p50_ms": percentile(self.wrong_password_ms, 50),
+            "unknown_email_p50_ms": percentile(self.unknown_email_ms, 50),
+            "hash_cost_ms": self.hash_cost_ms,
+            "p_value": self.test["p_value"],
+            "cliffs_delta": self.test["cliffs_delta"],
+            "ratio": self.ratio,
+            "leaks": self.leaks
+        }
+    
+    def __str__(self) -> str:
+        return (
+            f"wrong_password p50 {percentile(self.wrong_password_ms, 50):.1f} ms vs "
+            f"unknown_email p50 {percentile(self.unknown_email_ms, 50):.1f} ms "
+            f"(n={len(self.wrong_password_ms)}/{len(self.unknown_email_ms)}): "
+            f"hash cost ~{self.hash_cost_ms:.1f} ms, ratio x{self.ratio['ratio']:.2f} "
+            f"[{self.ratio['low']:.2f}, {self.ratio['high']:.2f}], p={self.test['p_value']:.4f}, "
+            f"{self.effect} effect -> {'TIMING LEAK' if self.leaks else 'no measurable difference'}"
+        )
+
+
+class AuthBenchmark:
+    """Register/login latency and throughput at increasing concurrency"""
+    
+    def __init__(self, api: ApiWrapper, users: List[Dict], create_user: Callable = None):
+        """
+        Args:
+            api: API wrapper with a pool sized for the highest concurrency
+            users: existing users {email, password} for login cases
+            create_user: create_test_user fixture function (registers through api, cleaned up)
+        """
+        self.auth_api = AuthApi(api)
+        self.users = users
+        self.create_user = create_user
+        self._next_user = itertools.cycle(users)
+    
+    def attempt(self, case: str) -> str:
+        """
+        One attempt of case.
+        
+        Returns:
+            error description, "" if the outcome was the expected one
+        """
+        if case == "register":
+            if self.create_user is None:
+                raise ValueError("Register case needs create_user (users must be cleaned up)")
+            self.create_user(client=self.auth_api)
+            return ""
+        
+        if case == "valid":
+            user = next(self._next_user)
+            return "" if self.auth_api.login_or_none(user["email"], user["password"]) else "valid login rejected"
+        if case == "wrong_password":
+            user = next(self._next_user)
+            result = self.auth_api.login_or_none(user["email"], user["password"] + "_wrong")
+            return "wrong password accepted" if result else ""
+        if case == "unknown_email":
+            result = self.auth_api.login_or_none(DataFactory.user()["email"], "TestPass123")
+            return "unknown email accepted" if result else ""
+        raise ValueError(f"Unknown auth case: {case}. Available: {', '.join(CASES)}")
+    
+    def _timed(self, case: str) -> Tuple[float, str]:
+        started = time.perf_counter()
+        try:
+            error = self.attempt(case)
+        except Exception as e:
+            error = repr(e)
+        return (time.perf_counter() - started) * 1000, error
+    
+    def measure(self, case: str, requests: int, concurrency: int) -> AuthLevel:
+        """Send requests attempts of case with concurrency in flight"""
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            started = time.perf_counter()
+            results = list(executor.map(lambda _: self._timed(case), range(requests)))
+            elapsed = time.perf_counter() - started
+        return AuthLevel(
+            case,
+            concurrency,
+            [latency_ms for latency_ms, error in results if not error],
+            [error for _, error in results if error],
+            elapsed
+        )
+    
+    def ramp(self, case: str, concurrency_levels: List[int], requests: int) -> List[AuthLevel]:
+        """Measure case at each concurrency level (requests per level)"""
+        return [self.measure(case, requests, concurrency) for concurrency in sorted(concurrency_levels)]
+    
+    def compare_failed_logins(self, samples: int, alpha: float = 0.01) -> FailedLoginTiming:
+        """
+        Time wrong-password and unknown-email logins one at a time.
+        Attempts alternate, so drift (warm-up, background load) hits both cases equally.
+        """
+        timings: Dict[str, List[float]] = {"wrong_password": [], "unknown_email": []}
+        for index in range(samples * 2):
+            case = "wrong_password" if index % 2 == 0 else "unknown_email"
+            latency_ms, error = self._timed(case)
+            if not error:
+                timings[case].append(latency_ms)
+        return FailedLoginTiming(timings["wrong_password"], timings["unknown_email"], alpha)
@@ -0,0 +1,131 @@
+"""
+Interaction latency flows for MyStore.
+Measures the cart and checkout interactions users perceive as laggy: UI
+click -> painted change (frontend) and click -> change visible through the
+API (backend), so slow interactions can be attributed to one side.
+"""
+
+from typing import List
+
+from infra.interaction_timer import InteractionResult, InteractionTimer
+from logic.api.cart_api import CartApi
+from logic.api.orders_api import OrdersApi
+from logic.ui.cart_page import CartPage
+from logic.ui.home_page import HomePage
+from utils.cleanup_utils import CleanupManager
+
+
+class CartInteractions:
+    """Interaction latency of cart quantity, add to cart and checkout"""
+    
+    def __init__(
+        self,
+        timer: InteractionTimer,
+        cart_api: CartApi,
+        orders_api: OrdersApi,
+        token: str,
+        cleanup: CleanupManager = None
+    ):
+        """
+        Args:
+            timer: interaction timer on the logged in browser
+            cart_api: Cart API client (backend reflection)
+            orders_api: Orders API client (backend reflection)
+            token: token of the logged in browser user
+            cleanup: cleanup manager for orders created by checkout
+        """
+        self.timer = timer
+        self.cart_api = cart_api
+        self.orders_api = orders_api
+        self.token = token
+        self.cleanup = cleanup
+        self.cart_page = CartPage(timer.driver)
+        self.home_page = HomePage(timer.driver)
+    
+    def api_quantity(self, product_id: str) -> int:
+        """Get product quantity in cart via API (0 if not in cart)"""
+        for item in self.cart_api.get_cart(self.token).get("items", []):
+            item_product_id = item.get("product", {}).get("_id") or item.get("productId")
+            if item_product_id == product_id:
+                return item.get("quantity", 0)
+        return 0
+    
+    # ==================== CART PAGE ====================
+    
+    def _change_quantity(self, name: str, product_id: str, delta: int) -> InteractionResult:
+        expected = self.cart_page.get_item_quantity(product_id) + delta
+        action = self.cart_page.increase_item_quantity if delta > 0 else self.cart_page.decrease_item_quantity
+        return self.timer.measure(
+            name,
+            lambda: action(product_id),
+            {"kind": "text", "selector": f'[data-testid="cart-item-quantity-{product_id}"]', "value": expected},
+            lambda: self.api_quantity(product_id) == expected
+        )
+    
+    def increase_quantity(self, product_id: str) -> InteractionResult:
+        """Measure cart + button (cart page must be open)"""
+        return self._change_quantity("cart_increase", product_id, 1)
+    
+    def decrease_quantity(self, product_id: str) -> InteractionResult:
+        """Measure cart - button (cart page must be open, quantity > 1)"""
+        return self._change_quantity("cart_decrease", product_id, -1)
+    
+    def checkout(self) -> InteractionResult:
+        """Measure checkout button (cart page with items must be open)"""
+        orders_before = self.orders_api.get_orders_count(self.token)
+        self.cart_page.is_visible_by_testid(CartPage.CHECKOUT_BTN, timeout=10)
+        result = self.timer.measure(
+            "checkout",
+            self.cart_page.click_checkout,
+            {"kind": "url_excludes", "value": "/cart"},
+            lambda: self.orders_api.get_orders_count(self.token) > orders_before
+        )
+        if self.cleanup:
+            for order in self.orders_api.get_my_orders(self.token):
+                self.cleanup.register_order(order.get("_id"))
+        return result
+    
+    # ==================== HOME PAGE ====================
+    
+    def add_to_cart(self, product_id: str) -> InteractionResult:
+        """Measure add to cart button in product modal (home page must be open)"""
+        expected = self.api_quantity(product_id) + 1
+        self.home_page.click_product(product_id)
+        self.home_page.is_product_modal_visible()
+        return self.timer.measure(
+            "add_to_cart",
+            self.home_page.click_add_to_cart,
+            {"kind": "text_changed", "selector": f'[data-testid="{HomePage.CART_COUNT}"]'},
+            lambda: self.api_quantity(product_id) >= expected
+        )
+    
+    # ==================== TRIALS ====================
+    
+    def quantity_trials(self, product_id: str, trials: int) -> List[InteractionResult]:
+        """Alternate + and - on one cart item (cart page must be open, quantity 1)"""
+        results = []
+        for _ in range(trials):
+            results.append(self.increase_quantity(product_id))
+            results.append(self.decrease_quantity(product_id))
+        return results
+    
+    def add_to_cart_trials(self, product_id: str, trials: int) -> List[InteractionResult]:
+        """Add product to cart repeatedly from the user home page product modal"""
+        results = []
+        for trial in range(trials):
+            if trial:
+                # Reload closes the modal (session is kept in localStorage)
+                self.home_page.refresh()
+            self.home_page.wait_for_product_visible(product_id)
+            results.append(self.add_to_cart(product_id))
+        return results
+    
+    def checkout_trials(self, product_id: str, trials: int) -> List[InteractionResult]:
+        """Fill cart via API and check out, once per trial (creates one order each)"""
+        results = []
+        for _ in range(trials):
+            self.cart_api.clear_cart(self.token)
+            self.cart_api.add_to_cart(product_id, 1, self.token)
+            self.cart_page.open_via_ui()
+            results.append(self.checkout())
+        return results
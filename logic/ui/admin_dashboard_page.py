@@ -10,8 +10,8 @@ from utils.constants import Urls
 class AdminDashboardPage(BasePage):
     """Admin dashboard page interactions"""
     
-    def __init__(self, driver: WebDriver):
-        super().__init__(driver)
+    def __init__(self, driver: WebDriver, window_handle: str = None):
+        super().__init__(driver, window_handle)
     
     def open(self):
         """Navigate to admin dashboard"""
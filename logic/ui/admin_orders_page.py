@@ -11,14 +11,18 @@ from utils.constants import Urls
 class AdminOrdersPage(BasePage):
     """Admin orders page interactions"""
     
+    # Ready condition for navigate(): orders loaded, or search bar once the
+    # orders fetch settled (no orders renders no cards)
+    READY_SELECTOR = '[data-testid^="order-card-"], [data-testid="admin-search-input"]'
+    
     # Test IDs
     SEARCH_INPUT = "admin-search-input"
     
     # Alert modal
     CONFIRM_BTN = "confirm-alert-btn"
     
-    def __init__(self, driver: WebDriver):
-        super().__init__(driver)
+    def __init__(self, driver: WebDriver, window_handle: str = None):
+        super().__init__(driver, window_handle)
     
     def open(self):
         """Navigate to admin orders"""
@@ -59,6 +63,5 @@ class AdminOrdersPage(BasePage):
     def wait_for_status_update(self, order_id: str, timeout: int = 5):
         """Wait for order status to update after change"""
         # Wait a moment for the status to update in the UI
-        import time
-        time.sleep(0.5)
+        self.pause(0.5)
 
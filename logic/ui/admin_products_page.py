@@ -11,6 +11,10 @@ from utils.constants import Urls
 class AdminProductsPage(BasePage):
     """Admin products page interactions"""
     
+    # Ready condition for navigate(): products table loaded, or add button once the
+    # products fetch settled (no products renders no rows)
+    READY_SELECTOR = '[data-testid^="admin-product-row-"], [data-testid="admin-add-btn"]'
+    
     # Test IDs
     SEARCH_INPUT = "admin-search-input"
     ADD_BUTTON = "admin-add-btn"
@@ -25,8 +29,8 @@ class AdminProductsPage(BasePage):
     CREATE_BTN = "create-product-submit-btn"
     SAVE_BTN = "edit-product-save-btn"
     
-    def __init__(self, driver: WebDriver):
-        super().__init__(driver)
+    def __init__(self, driver: WebDriver, window_handle: str = None):
+        super().__init__(driver, window_handle)
     
     def open(self):
         """Navigate to admin products"""
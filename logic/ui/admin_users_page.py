@@ -11,11 +11,15 @@ from utils.constants import Urls
 class AdminUsersPage(BasePage):
     """Admin users page interactions"""
     
+    # Ready condition for navigate(): users table loaded, or search bar once the
+    # users fetch settled (no users renders no rows)
+    READY_SELECTOR = '[data-testid^="admin-user-row-"], [data-testid="admin-search-input"]'
+    
     # Test IDs
     SEARCH_INPUT = "admin-search-input"
     
-    def __init__(self, driver: WebDriver):
-        super().__init__(driver)
+    def __init__(self, driver: WebDriver, window_handle: str = None):
+        super().__init__(driver, window_handle)
     
     def open(self):
         """Navigate to admin users"""
@@ -2,7 +2,10 @@
 Base Page Object - common functionality for all pages.
 """
 
-from typing import List, Tuple
+import functools
+import inspect
+import time
+from typing import Callable, List, Tuple
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support.ui import WebDriverWait
@@ -10,31 +13,132 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import TimeoutException
 
+from infra.app_readiness import wait_until_ready
+from infra.browser_wrapper import activate_window
+from infra.command_profiler import get_command_profiler
 from infra.config_provider import ConfigProvider
+from infra.emulation import timeout_scale
+from infra.latency_recorder import RouteResolver, get_recorder
+from infra.tracing import get_tracer
+from infra.web_vitals import get_vitals_recorder
+from utils.constants import Urls
+
+
+_url_routes = RouteResolver.from_class(Urls)
+
+
+def _timed_action(name: str, method: Callable) -> Callable:
+    """Wrap page object method to record its duration and attribute its WebDriver commands"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        profiler = get_command_profiler()
+        profiler.push(name)
+        started = time.perf_counter()
+        try:
+            with get_tracer().span(name, "page"):
+                self.activate()
+                return method(self, *args, **kwargs)
+        finally:
+            get_recorder().record_action(name, (time.perf_counter() - started) * 1000)
+            profiler.pop()
+    
+    return wrapper
+
+
+class _TracedWait(WebDriverWait):
+    """WebDriverWait that records each until() as a trace span"""
+    
+    def until(self, method, message: str = ""):
+        # EC conditions are closures ("url_contains.<locals>._predicate"), page lambdas name their method
+        condition = getattr(method, "__qualname__", type(method).__name__).split(".<locals>", 1)[0]
+        with get_tracer().span(f"wait {condition}", "wait", timeout=self._timeout):
+            return super().until(method, message)
+
+
+# Navigation timing marks (ms since performance.timeOrigin) shown as spans from navigation start
+_NAVIGATION_MARKS = ("ttfb", "dom_content_loaded", "fcp", "load")
 
 
 class BasePage:
     """Base class for all Page Objects"""
     
-    def __init__(self, driver: WebDriver):
+    # CSS selector that matches once the page's own content is rendered (None = app mounted is enough)
+    READY_SELECTOR = None
+    
+    def __init_subclass__(cls, **kwargs):
+        """Record timing of every public method defined on a page object"""
+        super().__init_subclass__(**kwargs)
+        for name, value in list(vars(cls).items()):
+            if not name.startswith("_") and inspect.isfunction(value):
+                setattr(cls, name, _timed_action(f"{cls.__name__}.{name}", value))
+    
+    def __init__(self, driver: WebDriver, window_handle: str = None):
+        """
+        Args:
+            driver: WebDriver
+            window_handle: bind page to a browser context window (None = current window)
+        """
         self.driver = driver
+        self.window_handle = window_handle
         self.config = ConfigProvider()
-        self.wait = WebDriverWait(driver, self.config.timeout)
+        self.timeout_scale = timeout_scale(driver, window_handle)
+        self.wait = _TracedWait(driver, self.scaled(self.config.timeout))
         self.base_url = self.config.base_url
     
+    # ==================== TIMEOUTS ====================
+    
+    def scaled(self, seconds: float) -> float:
+        """Scale wait timeout for the browser's emulation profile (throttled network/CPU)"""
+        return seconds * self.timeout_scale
+    
+    def pause(self, seconds: float):
+        """Sleep for UI transitions, scaled like wait timeouts"""
+        time.sleep(self.scaled(seconds))
+    
     # ==================== NAVIGATION ====================
     
+    def activate(self):
+        """Switch WebDriver to the page's window (no-op for unbound pages)"""
+        activate_window(self.driver, self.window_handle)
+    
     def navigate(self, path: str = ""):
-        """Navigate to path relative to base URL"""
+        """Navigate to path relative to base URL, wait until ready, record its web vitals"""
+        self.activate()
         url = f"{self.base_url}{path}"
-        self.driver.get(url)
+        vitals = get_vitals_recorder()
+        route = _url_routes.resolve(path or Urls.HOME) or path
+        tracer = get_tracer()
+        with tracer.span(f"navigate {route}", "navigation", url=url):
+            # Finalize previous page before its document is replaced
+            vitals.flush(self.driver)
+            self.driver.get(url)
+            self.wait_until_ready()
+            sample = vitals.begin(self.driver, route, get_recorder().current_test)
+            if sample and sample.metrics.get("time_origin"):
+                origin_ns = int(sample.metrics["time_origin"] * 1_000_000)
+                for mark in _NAVIGATION_MARKS:
+                    if sample.metrics.get(mark) is not None:
+                        tracer.add_span(mark, "navigation", origin_ns, origin_ns + int(sample.metrics[mark] * 1_000_000))
+    
+    def wait_until_ready(self, timeout: int = None) -> bool:
+        """Wait for SPA root mounted, requests settled and READY_SELECTOR rendered"""
+        with get_tracer().span("wait ready", "wait", ready_selector=self.READY_SELECTOR):
+            return wait_until_ready(
+                self.driver,
+                root_selector=self.config.get("app_ready.root_selector", "#root"),
+                ready_selector=self.READY_SELECTOR,
+                settle_ms=self.config.get("app_ready.settle_ms", 100),
+                timeout=self.scaled(timeout or self.config.timeout)
+            )
     
     def get_current_url(self) -> str:
         """Get current page URL"""
+        self.activate()
         return self.driver.current_url
     
     def refresh(self):
         """Refresh current page"""
+        self.activate()
         self.driver.refresh()
     
     # ==================== ELEMENT FINDING ====================
@@ -74,10 +178,10 @@ class BasePage:
     
     def is_visible_by_testid(self, testid: str, timeout: int = None) -> bool:
         """Check if element is visible by data-testid"""
-        timeout = timeout or self.config.timeout
+        timeout = self.scaled(timeout or self.config.timeout)
         try:
             locator = (By.CSS_SELECTOR, f'[data-testid="{testid}"]')
-            WebDriverWait(self.driver, timeout).until(
+            _TracedWait(self.driver, timeout).until(
                 EC.visibility_of_element_located(locator)
             )
             return True
@@ -105,9 +209,9 @@ class BasePage:
     
     def wait_for_url_contains(self, text: str, timeout: int = None) -> bool:
         """Wait until URL contains text"""
-        timeout = timeout or self.config.timeout
+        timeout = self.scaled(timeout or self.config.timeout)
         try:
-            WebDriverWait(self.driver, timeout).until(
+            _TracedWait(self.driver, timeout).until(
                 EC.url_contains(text)
             )
             return True
@@ -117,12 +221,12 @@ class BasePage:
     def confirm_browser_alert(self):
         """Confirm delete action - handle browser alert"""
         # Wait for alert to appear and accept it
-        alert = WebDriverWait(self.driver, 5).until(EC.alert_is_present())
+        alert = _TracedWait(self.driver, self.scaled(5)).until(EC.alert_is_present())
         alert.accept()
         
         # Handle error alert that may appear after deletion
         try:
-            error_alert = WebDriverWait(self.driver, 2).until(EC.alert_is_present())
+            error_alert = _TracedWait(self.driver, self.scaled(2)).until(EC.alert_is_present())
             error_alert.accept()
         except Exception:
             # No error alert, continue
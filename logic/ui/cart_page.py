@@ -12,14 +12,17 @@ from utils.constants import Urls
 class CartPage(BasePage):
     """Cart page interactions"""
     
+    # Ready condition for navigate(): cart items or empty cart message rendered
+    READY_SELECTOR = '[data-testid^="cart-item-"], [data-testid="empty-cart-message"]'
+    
     # Test IDs
     EMPTY_CART_MESSAGE = "empty-cart-message"
     CART_TOTAL = "cart-total"
     CHECKOUT_BTN = "checkout-btn"
     CLEAR_CART_BTN = "clear-cart-btn"
     
-    def __init__(self, driver: WebDriver):
-        super().__init__(driver)
+    def __init__(self, driver: WebDriver, window_handle: str = None):
+        super().__init__(driver, window_handle)
     
     def open(self):
         """Navigate to cart page"""
@@ -27,10 +30,9 @@ class CartPage(BasePage):
     
     def open_via_ui(self):
         """Navigate to cart page via UI click (preserves localStorage)"""
-        import time
         cart_link = self.driver.find_element(By.CSS_SELECTOR, '[data-testid="cart-link"]')
         cart_link.click()
-        time.sleep(1)
+        self.pause(1)
     
     # ==================== CART STATE ====================
     
@@ -12,6 +12,10 @@ from utils.constants import Urls
 class HomePage(BasePage):
     """Home page interactions"""
     
+    # Ready condition for navigate(): product grid rendered, or search bar once the
+    # product fetch settled (empty catalog renders no cards)
+    READY_SELECTOR = '[data-testid^="product-card-"], [data-testid="search-input"]'
+    
     # Test IDs
     SEARCH_INPUT = "search-input"
     SEARCH_BTN = "search-btn"
@@ -25,8 +29,8 @@ class HomePage(BasePage):
     MODAL_PRODUCT_PRICE = "modal-product-price"
     MODAL_PRODUCT_DESCRIPTION = "modal-product-description"
     
-    def __init__(self, driver: WebDriver):
-        super().__init__(driver)
+    def __init__(self, driver: WebDriver, window_handle: str = None):
+        super().__init__(driver, window_handle)
     
     def open(self):
         """Navigate to home page"""
@@ -10,14 +10,17 @@ from utils.constants import Urls
 class LoginPage(BasePage):
     """Login page interactions"""
     
+    # Ready condition for navigate(): login form rendered
+    READY_SELECTOR = '[data-testid="email-input"]'
+    
     # Test IDs
     EMAIL_INPUT = "email-input"
     PASSWORD_INPUT = "password-input"
     SUBMIT_BTN = "submit-btn"
     ERROR_MESSAGE = "error-message"
     
-    def __init__(self, driver: WebDriver):
-        super().__init__(driver)
+    def __init__(self, driver: WebDriver, window_handle: str = None):
+        super().__init__(driver, window_handle)
     
     def open(self):
         """Navigate to login page"""
@@ -12,11 +12,14 @@ from utils.constants import Urls
 class OrdersPage(BasePage):
     """User orders page interactions"""
     
+    # Ready condition for navigate(): orders list loaded
+    READY_SELECTOR = '[data-testid="orders-list"]'
+    
     # Test IDs
     ORDERS_LIST = "orders-list"
     
-    def __init__(self, driver: WebDriver):
-        super().__init__(driver)
+    def __init__(self, driver: WebDriver, window_handle: str = None):
+        super().__init__(driver, window_handle)
     
     def open(self):
         """Navigate to orders page"""
@@ -24,16 +27,15 @@ class OrdersPage(BasePage):
     
     def open_via_ui(self):
         """Navigate to orders page via UI click (preserves localStorage)"""
-        import time
         # Wait for profile button to be visible and clickable, then click
         self.is_visible_by_testid("profile-button", timeout=10)
         self.click_by_testid("profile-button")
-        time.sleep(0.5)
+        self.pause(0.5)
         
         # Wait for orders link to be visible and clickable, then click
         self.is_visible_by_testid("dashboard-my-orders", timeout=10)
         self.click_by_testid("dashboard-my-orders")
-        time.sleep(1)
+        self.pause(1)
     
     # ==================== ORDERS STATE ====================
     
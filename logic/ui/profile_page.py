@@ -10,6 +10,9 @@ from utils.constants import Urls
 class ProfilePage(BasePage):
     """User profile page interactions"""
     
+    # Ready condition for navigate(): profile details loaded
+    READY_SELECTOR = '[data-testid="profile-edit-btn"]'
+    
     # Test IDs - Display mode
     PROFILE_EDIT_BTN = "profile-edit-btn"
     
@@ -20,8 +23,8 @@ class ProfilePage(BasePage):
     PROFILE_ADDRESS_INPUT = "profile-address-input"
     PROFILE_SAVE_BTN = "profile-save-btn"
     
-    def __init__(self, driver: WebDriver):
-        super().__init__(driver)
+    def __init__(self, driver: WebDriver, window_handle: str = None):
+        super().__init__(driver, window_handle)
     
     def open(self):
         """Navigate to profile page"""
@@ -29,16 +32,15 @@ class ProfilePage(BasePage):
     
     def open_via_ui(self):
         """Navigate to profile page via UI click (preserves localStorage)"""
-        import time
         # Wait for profile button to be visible and clickable, then click
         self.is_visible_by_testid("profile-button", timeout=10)
         self.click_by_testid("profile-button")
-        time.sleep(0.5)
+        self.pause(0.5)
         
         # Wait for profile link to be visible and clickable, then click
         self.is_visible_by_testid("dashboard-my-profile", timeout=10)
         self.click_by_testid("dashboard-my-profile")
-        time.sleep(1)
+        self.pause(1)
     
     # ==================== DISPLAY MODE ====================
     
@@ -10,6 +10,9 @@ from utils.constants import Urls
 class RegisterPage(BasePage):
     """Registration page interactions"""
     
+    # Ready condition for navigate(): registration form rendered
+    READY_SELECTOR = '[data-testid="name-input"]'
+    
     # Test IDs
     NAME_INPUT = "name-input"
     EMAIL_INPUT = "email-input"
@@ -23,8 +26,8 @@ class RegisterPage(BasePage):
     MODAL_LOGIN_BTN = "modal-login-btn"
     MODAL_CLOSE_BTN = "modal-close-btn"
     
-    def __init__(self, driver: WebDriver):
-        super().__init__(driver)
+    def __init__(self, driver: WebDriver, window_handle: str = None):
+        super().__init__(driver, window_handle)
     
     def open(self):
         """Navigate to registration page"""
@@ -51,15 +51,13 @@ class TestAddProductToCart:
         new_count = home_page.get_cart_count()
         
         # Verify via API that product was added
-        cart = cart_api.get_cart(token)
-        cart_items = cart.get("items", [])
-        product_ids = [item.get("product", {}).get("_id") for item in cart_items]
+        cart = cart_api.get_cart_model(token)
         
         # Assert
         assert product is not None, "Should get a product from API"
         assert modal_visible, "Product modal should open"
         assert new_count > initial_count, \
             f"Cart count should increase after adding product. Was {initial_count}, now {new_count}"
-        assert product["_id"] in product_ids, \
+        assert cart.item(product["_id"]) is not None, \
             "Product should be in cart (API verification)"
 
@@ -45,11 +45,7 @@ class TestAdminCancelOrder:
         displayed_status = admin_orders_page.get_order_status(order_id)
         
         # Verify via API
-        orders = admin_api.get_orders(token)
-        updated_order = next(
-            (o for o in orders if o["_id"] == order_id),
-            None
-        )
+        updated_order = admin_api.find_order(order_id, token)
         
         # Assert
         assert updated_order is not None, "Order should exist"
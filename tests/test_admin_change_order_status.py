@@ -37,11 +37,7 @@ class TestAdminChangeOrderStatus:
         order_id = order.get("_id") or order.get("order", {}).get("_id")
         
         # Verify initial status is "pending"
-        initial_orders = admin_api.get_orders(token)
-        initial_order = next(
-            (o for o in initial_orders if o["_id"] == order_id),
-            None
-        )
+        initial_order = admin_api.find_order(order_id, token)
         
         # Act
         admin_orders_page.open()
@@ -58,11 +54,7 @@ class TestAdminChangeOrderStatus:
         displayed_status = admin_orders_page.get_order_status(order_id)
         
         # Verify via API
-        orders = admin_api.get_orders(token)
-        updated_order = next(
-            (o for o in orders if o["_id"] == order_id),
-            None
-        )
+        updated_order = admin_api.find_order(order_id, token)
         
         # Assert
         assert initial_order is not None, "Order should exist"
@@ -47,11 +47,10 @@ class TestAdminDeleteOrder:
         order_visible_after = admin_orders_page.is_order_visible(order_id)
         
         # Verify via API
-        orders = admin_api.get_orders(token)
-        order_ids = [o.get("_id") for o in orders]
+        orders = admin_api.get_order_list(token)
         
         # Assert
         assert order_visible_before, "Order should be visible before deletion"
         assert not order_visible_after, "Order should not be visible after deletion"
-        assert order_id not in order_ids, "Order should not exist in API after deletion"
+        assert order_id not in orders, "Order should not exist in API after deletion"
 
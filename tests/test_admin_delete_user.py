@@ -44,13 +44,10 @@ class TestAdminDeleteUser:
         user_visible_after = admin_users_page.is_user_visible(user_id)
         
         # Verify via API
-        users_response = admin_api.get_users(token)
-        # API returns dict with 'users' key containing list of user objects
-        users = users_response.get("users", [])
-        user_ids = [u.get("_id") for u in users]
+        users = admin_api.get_user_list(token)
         
         # Assert
         assert user_visible_before, "User should be visible before deletion"
         assert not user_visible_after, "User should not be visible after deletion"
-        assert user_id not in user_ids, "User should not exist in API after deletion"
+        assert user_id not in users, "User should not exist in API after deletion"
 
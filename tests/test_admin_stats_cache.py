@@ -0,0 +1,56 @@
+"""
+Test cached admin stats reflect new orders.
+"""
+
+import pytest
+from utils.constants import ApiEndpoints
+
+
+class TestAdminStatsCache:
+    """Test ETag-cached dashboard stats are revalidated"""
+    
+    @pytest.mark.admin
+    @pytest.mark.orders
+    def test_cached_stats_reflect_new_order(
+        self,
+        create_test_admin,
+        create_test_user,
+        create_test_order,
+        admin_api
+    ):
+        """
+        Test stats fetched with ETag caching are revalidated, and refetched after an order is placed.
+        Other xdist workers may change stats at any time, so every check accepts a changed ETag.
+        
+        Arrange: Create new admin, fetch stats with caching (skip if the backend sends no ETag)
+        Act: Revalidate stats, place order as a NEW user, fetch stats with caching again
+        Assert: Unchanged stats answered with 304; after the order a new body with a new ETag
+        """
+        # Arrange
+        token = create_test_admin()["token"]
+        cache = admin_api.etag_cache
+        stats_before = admin_api.get_stats(token, cached=True)
+        etag_before = cache.etag(ApiEndpoints.ADMIN_STATS, token)
+        if etag_before is None:
+            pytest.skip("Backend sends no ETag for admin stats - nothing to revalidate")
+        
+        # Act
+        hits = cache.hits
+        admin_api.get_stats(token, cached=True)
+        revalidated = cache.hits > hits
+        etag_revalidated = cache.etag(ApiEndpoints.ADMIN_STATS, token)
+        
+        user = create_test_user()
+        create_test_order(user["token"])
+        hits = cache.hits
+        stats_after = admin_api.get_stats(token, cached=True)
+        etag_after = cache.etag(ApiEndpoints.ADMIN_STATS, token)
+        
+        # Assert
+        assert stats_before, "Stats should not be empty"
+        assert revalidated or etag_revalidated != etag_before, \
+            f"Unchanged stats should be answered with 304 Not Modified (ETag {etag_before})"
+        assert cache.hits == hits and etag_after != etag_revalidated, \
+            f"Stats should be refetched with a new ETag after a new order. ETag before: {etag_revalidated}, after: {etag_after}"
+        assert stats_after != stats_before, \
+            f"Stats should change after a new order. Before: {stats_before}, after: {stats_after}"
@@ -0,0 +1,93 @@
+"""
+Test how admin list and user details endpoints scale with data size.
+"""
+
+import warnings
+import pytest
+from infra.complexity_fit import format_fits
+from logic.perf.admin_scaling import ScalingWarning, scaling_flags
+
+
+class TestBenchmarkAdminScaling:
+    """Test admin endpoints stay linear and within payload limits as data grows"""
+    
+    @pytest.mark.benchmark
+    @pytest.mark.admin
+    def test_admin_lists_scaling_curves(self, admin_scaling, config, record_property):
+        """
+        Test admin users/products/orders lists grow at most linearly with table size.
+        A few median points over ~100 seeded rows are noisy, so super-linear fits are
+        warnings unless 'admin_scaling.enforce_fits' is set.
+        
+        Arrange: NEW admin
+        Act: Seed users, products and orders in steps; measure each admin list at every step
+        Assert: Largest payload within limit; super-linear latency fits flagged
+        """
+        # Arrange
+        sizes = config.get("admin_scaling.sizes", [0, 20, 50, 100])
+        max_payload = config.get("admin_scaling.max_payload_bytes", 5_000_000)
+        enforce_fits = config.get("admin_scaling.enforce_fits", False)
+        
+        # Act
+        series = admin_scaling.run_lists(sizes)
+        
+        record_property("admin_scaling", {item.name: item.to_dict() for item in series})
+        try:
+            fits = [item.latency_fit() for item in series]
+            report = f"{format_fits(fits)}\n\n{format_fits([item.payload_fit() for item in series], unit='B')}"
+        except ValueError as e:
+            record_property("perf_report", f"No complexity fit: {e}\n" + "\n".join(
+                f"{item.name}: sizes {item.sizes}" for item in series
+            ))
+            pytest.skip(f"Admin lists could not be fitted ({e}) - rows deleted concurrently?")
+        record_property("perf_report", report)
+        record_property("admin_scaling_fits", {fit.name: fit.model for fit in fits})
+        flags = scaling_flags(fits)
+        
+        # Assert
+        too_large = [f"{item.name} {item.max_payload} B" for item in series if item.max_payload > max_payload]
+        assert not too_large, \
+            f"Admin list payloads should be <= {max_payload} B. Too large: {too_large}\n{report}"
+        if not enforce_fits:
+            for flag in flags:
+                warnings.warn(ScalingWarning(f"Admin list scales super-linearly: {flag}"))
+        assert not (enforce_fits and flags), \
+            f"Admin lists should scale at most linearly. Flagged: {flags}\n{report}"
+    
+    @pytest.mark.benchmark
+    @pytest.mark.admin
+    def test_user_details_scaling_curve(self, admin_scaling, config, record_property):
+        """
+        Test admin user details cost per order stays low (no N+1 over orders).
+        Flagged as a warning unless 'admin_scaling.enforce_fits' is set (see above).
+        
+        Arrange: NEW admin, NEW user
+        Act: Place orders for the user in steps; measure ADMIN_USER_DETAILS at every step
+        Assert: Linear or better, cost per order within limit - flagged
+        """
+        # Arrange
+        order_counts = config.get("admin_scaling.detail_orders", [0, 10, 25, 50])
+        max_ms_per_order = config.get("admin_scaling.max_ms_per_order", 1.0)
+        enforce_fits = config.get("admin_scaling.enforce_fits", False)
+        
+        # Act
+        series = admin_scaling.run_user_details(order_counts)
+        
+        record_property("admin_user_details_scaling", series.to_dict())
+        try:
+            fit = series.latency_fit()
+        except ValueError as e:
+            record_property("perf_report", f"No complexity fit: {e}\nADMIN_USER_DETAILS: orders {series.sizes}")
+            pytest.skip(f"User details could not be fitted ({e})")
+        report = format_fits([fit])
+        record_property("perf_report", report)
+        record_property("admin_user_details_fit", {"model": fit.model, "ms_per_order": fit.per_item})
+        flags = scaling_flags([fit], max_per_item=max_ms_per_order)
+        
+        # Assert
+        if not enforce_fits:
+            for flag in flags:
+                warnings.warn(ScalingWarning(f"User details N+1 over orders? {flag}"))
+        assert not (enforce_fits and flags), \
+            f"User details should scale at most linearly with orders, <= {max_ms_per_order} ms per order. " \
+            f"Flagged: {flags}\n{report}"
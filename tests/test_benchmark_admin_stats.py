@@ -0,0 +1,76 @@
+"""
+Test admin stats aggregation cost as data grows and under concurrent writes.
+"""
+
+import warnings
+import pytest
+from infra.complexity_fit import format_fits
+from logic.perf.admin_scaling import ScalingWarning, scaling_flags
+
+
+class TestBenchmarkAdminStats:
+    """Test dashboard stats aggregation scales and holds up under writes"""
+    
+    @pytest.mark.benchmark
+    @pytest.mark.admin
+    def test_stats_scaling_curve(self, admin_scaling, config, record_property):
+        """
+        Test stats latency grows at most linearly with users + products + orders.
+        Super-linear fits are warnings unless 'admin_scaling.enforce_fits' is set
+        (too few, too close points to decide reliably).
+        
+        Arrange: NEW admin
+        Act: Seed users, products and orders in steps; measure stats at every step
+        Assert: Super-linear latency fit flagged
+        """
+        # Arrange
+        sizes = config.get("admin_scaling.sizes", [0, 20, 50, 100])
+        enforce_fits = config.get("admin_scaling.enforce_fits", False)
+        
+        # Act
+        series = admin_scaling.run_stats(sizes)
+        
+        record_property("admin_stats_scaling", series.to_dict())
+        try:
+            fit = series.latency_fit()
+        except ValueError as e:
+            record_property("perf_report", f"No complexity fit: {e}\nADMIN_STATS: rows {series.sizes}")
+            pytest.skip(f"Stats could not be fitted ({e}) - rows deleted concurrently?")
+        report = format_fits([fit])
+        record_property("perf_report", report)
+        record_property("admin_stats_fit", fit.model)
+        flags = scaling_flags([fit])
+        
+        # Assert
+        if not enforce_fits:
+            for flag in flags:
+                warnings.warn(ScalingWarning(f"Stats aggregation scales super-linearly: {flag}"))
+        assert not (enforce_fits and flags), \
+            f"Stats should scale at most linearly with table rows. Flagged: {flags}\n{report}"
+    
+    @pytest.mark.benchmark
+    @pytest.mark.admin
+    def test_stats_under_concurrent_writes(self, admin_scaling, config, record_property):
+        """
+        Test stats latency while orders are written concurrently.
+        
+        Arrange: NEW admin, NEW writer users
+        Act: Measure stats idle, then while writers place orders nonstop
+        Assert: No significant (Mann-Whitney U) median slowdown above the limit
+        """
+        # Arrange
+        writers = config.get("admin_scaling.stats_writers", 4)
+        requests = config.get("admin_scaling.stats_requests", 30)
+        max_slowdown = config.get("admin_scaling.max_stats_slowdown", 3.0)
+        alpha = config.get("admin_scaling.stats_alpha", 0.01)
+        
+        # Act
+        result = admin_scaling.run_stats_under_writes(writers, requests)
+        
+        record_property("perf_report", str(result))
+        record_property("admin_stats_under_writes", result.to_dict())
+        
+        # Assert
+        assert result.writes > 0, "Writers should place orders during the measurement"
+        assert not result.slower_than(max_slowdown, alpha), \
+            f"Stats p50 under {writers} writers should be <= x{max_slowdown} of idle (p < {alpha})\n{result}"
@@ -0,0 +1,68 @@
+"""
+Test register/login throughput under concurrency and failed-login timing.
+"""
+
+import pytest
+from logic.perf.auth_benchmark import format_levels
+
+
+class TestBenchmarkAuth:
+    """Test authentication holds throughput in login storms without timing leaks"""
+    
+    @pytest.mark.benchmark
+    @pytest.mark.auth
+    @pytest.mark.parametrize("case", ["register", "valid", "wrong_password", "unknown_email"])
+    def test_auth_throughput_under_concurrency(self, case, auth_benchmark, config, record_property):
+        """
+        Test register/login throughput does not collapse as concurrency grows.
+        
+        Arrange: NEW users for login cases
+        Act: Send attempts of the case at each concurrency level
+        Assert: Expected outcome for every attempt, throughput at max concurrency near the peak
+        """
+        # Arrange
+        settings = config.get("auth_benchmark", {})
+        server_cores = settings.get("server_cores")
+        min_ratio = settings.get("min_throughput_ratio", 0.8)
+        
+        # Act
+        levels = auth_benchmark.ramp(case, settings.get("concurrency", [1, 4, 16, 32]), settings.get("requests", 64))
+        
+        report = format_levels(levels, server_cores)
+        record_property("perf_report", report)
+        record_property("auth_benchmark", [level.to_dict() for level in levels])
+        
+        # Assert
+        errors = [error for level in levels for error in level.errors]
+        peak = max(level.throughput for level in levels)
+        assert not errors, \
+            f"Every '{case}' attempt should have the expected outcome. Errors: {errors[:10]}\n{report}"
+        assert levels[-1].throughput >= min_ratio * peak, \
+            f"'{case}' throughput at concurrency {levels[-1].concurrency} should stay >= " \
+            f"{min_ratio:.0%} of peak {peak:.1f} req/s\n{report}"
+    
+    @pytest.mark.benchmark
+    @pytest.mark.auth
+    def test_failed_logins_take_same_time(self, auth_benchmark, config, record_property):
+        """
+        Test wrong-password and unknown-email logins are indistinguishable by time.
+        
+        Arrange: NEW users (registered emails)
+        Act: Alternate wrong-password and unknown-email logins one at a time
+        Assert: No statistically significant, non-negligible latency difference
+        """
+        # Arrange
+        settings = config.get("auth_benchmark", {})
+        
+        # Act
+        timing = auth_benchmark.compare_failed_logins(
+            settings.get("timing_samples", 50),
+            alpha=settings.get("alpha", 0.01)
+        )
+        
+        record_property("perf_report", str(timing))
+        record_property("failed_login_timing", timing.to_dict())
+        
+        # Assert
+        assert not timing.leaks, \
+            f"Failed logins should not reveal whether the email is registered: {timing}"
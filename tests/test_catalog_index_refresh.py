@@ -0,0 +1,38 @@
+"""
+Test catalog index refresh with repeated products.
+"""
+
+import pytest
+from infra.catalog_index import CatalogIndex
+
+
+class TestCatalogIndexRefresh:
+    """Test catalog index tolerates products repeated by offset pagination"""
+    
+    @pytest.mark.products
+    def test_refresh_indexes_repeated_products_once(self):
+        """
+        Test repeated ids in one product list (offset pages shifted by a concurrent insert) are indexed once.
+        
+        Arrange: Index with one product
+        Act: Refresh with a new product listed twice; build a second index from a list with a repeat
+        Assert: Every id has exactly one live row and the new product can be selected
+        """
+        # Arrange
+        existing = {"_id": "existing", "price": 10, "stock": 5}
+        added = {"_id": "added", "price": 20, "stock": 5}
+        index = CatalogIndex([existing], seed=1)
+        
+        # Act
+        index.refresh([existing, added, added])
+        repeated_index = CatalogIndex([existing, existing], seed=1)
+        
+        # Assert
+        assert list(index.ids) == ["existing", "added"], \
+            f"Each product should have one row. Rows: {list(index.ids)}"
+        assert len(index) == 2 and "added" in index, \
+            f"Both products should be live. Live: {len(index)}"
+        assert index.filter(min_price=15) == [added], \
+            f"New product should be selectable. Found: {index.filter(min_price=15)}"
+        assert list(repeated_index.ids) == ["existing"] and len(repeated_index) == 1, \
+            f"Repeated product in the initial list should have one row. Rows: {list(repeated_index.ids)}"
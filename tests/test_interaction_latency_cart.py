@@ -0,0 +1,58 @@
+"""
+Test user-perceived latency of cart and checkout interactions.
+"""
+
+import pytest
+from infra.interaction_timer import format_summary
+
+
+class TestInteractionLatencyCart:
+    """Test cart interactions: click -> painted change and click -> API reflects change"""
+    
+    @pytest.mark.interaction
+    @pytest.mark.cart
+    @pytest.mark.orders
+    def test_cart_interactions_latency_distribution(
+        self,
+        cart_interactions,
+        cart_api,
+        get_dedicated_product,
+        config,
+        record_property
+    ):
+        """
+        Test cart interactions complete and report latency distributions.
+        
+        Arrange: NEW logged in user, dedicated high-stock product
+        Act: Repeat add to cart, cart +/- and checkout trials, timing UI and API
+        Assert: Every trial reflected in UI and API (distributions reported)
+        """
+        # Arrange
+        trials = config.get("interactions.trials", 10)
+        checkout_trials = config.get("interactions.checkout_trials", 3)
+        token = cart_interactions.token
+        product = get_dedicated_product(min_stock=checkout_trials + trials + 2)
+        product_id = product["_id"]
+        cart_api.clear_cart(token)
+        
+        # Act
+        results = cart_interactions.add_to_cart_trials(product_id, trials)
+        
+        cart_api.clear_cart(token)
+        cart_api.add_to_cart(product_id, 1, token)
+        cart_interactions.cart_page.open_via_ui()
+        results += cart_interactions.quantity_trials(product_id, trials)
+        
+        results += cart_interactions.checkout_trials(product_id, checkout_trials)
+        
+        summary = format_summary(results)
+        record_property("perf_report", summary)
+        record_property("interaction_latency", [result.to_dict() for result in results])
+        
+        # Assert
+        not_painted = [result.name for result in results if result.visual_ms is None]
+        not_persisted = [result.name for result in results if result.backend_ms is None]
+        assert not not_painted, \
+            f"UI should reflect every interaction. Missing: {not_painted}\n{summary}"
+        assert not not_persisted, \
+            f"API should reflect every interaction. Missing: {not_persisted}\n{summary}"
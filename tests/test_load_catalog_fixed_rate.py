@@ -0,0 +1,48 @@
+"""
+Test product catalog latency under fixed open-loop arrival rate.
+"""
+
+import pytest
+from infra.load_scheduler import ArrivalSchedule
+
+
+class TestLoadCatalogFixedRate:
+    """Test catalog p99 at fixed RPS (coordinated-omission corrected)"""
+    
+    @pytest.mark.load
+    @pytest.mark.products
+    def test_catalog_p99_within_slo_at_fixed_rate(
+        self,
+        open_loop_scheduler,
+        load_products_api,
+        config,
+        record_property
+    ):
+        """
+        Test catalog pagination keeps p99 within SLO at target RPS.
+        
+        Arrange: Constant arrival schedule at configured RPS
+        Act: Fire product list requests open-loop (no waiting for responses)
+        Assert: Client kept up, no errors, corrected p99 within SLO
+        """
+        # Arrange
+        rps = config.get("load.rps", 20)
+        duration = config.get("load.duration", 10)
+        p99_slo_ms = config.get("load.p99_slo_ms", 500)
+        schedule = ArrivalSchedule.constant(rps, duration)
+        
+        # Act
+        result = open_loop_scheduler.run(
+            schedule,
+            lambda: load_products_api.get_products(page=1, limit=20)
+        )
+        p99 = result.corrected.percentile(99)
+        record_property("perf_report", f"Catalog @ {rps} rps: {result}")
+        
+        # Assert
+        assert not result.client_saturated, \
+            f"Load generator could not keep up with {rps} rps - results are not valid: {result}"
+        assert result.error_count == 0, \
+            f"Catalog requests should not fail under load. Errors: {result.errors}"
+        assert p99 <= p99_slo_ms, \
+            f"Catalog p99 should be within {p99_slo_ms}ms at {rps} rps. Got {p99:.1f}ms"
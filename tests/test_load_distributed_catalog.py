@@ -0,0 +1,47 @@
+"""
+Test catalog latency under multi-process distributed load.
+"""
+
+import pytest
+from infra.load_scheduler import ArrivalSchedule
+
+
+class TestLoadDistributedCatalog:
+    """Test catalog p99 at production-scale RPS from worker processes"""
+    
+    @pytest.mark.load
+    @pytest.mark.products
+    def test_catalog_p99_within_slo_at_distributed_rate(
+        self,
+        run_distributed_flow,
+        config,
+        record_property
+    ):
+        """
+        Test catalog keeps p99 within SLO when load is fanned out across processes.
+        
+        Arrange: Poisson arrival schedule at configured distributed RPS
+        Act: Run catalog flow shards in worker processes, merge histograms
+        Assert: No worker fell behind, error rate within budget, merged p99 within SLO
+        """
+        # Arrange
+        rps = config.get("load.distributed.rps", 200)
+        duration = config.get("load.distributed.duration", 30)
+        p99_slo_ms = config.get("load.p99_slo_ms", 500)
+        max_error_rate = config.get("load.saturation.max_error_rate", 0.01)
+        schedule = ArrivalSchedule.poisson(rps, duration, seed=1)
+        
+        # Act
+        result = run_distributed_flow("catalog", schedule)
+        p99 = result.corrected.percentile(99)
+        record_property("perf_report", f"Distributed catalog @ {rps} rps: {result}")
+        
+        # Assert
+        assert not result.worker_errors, \
+            f"All workers should start and report a result. Errors: {result.worker_errors}"
+        assert not result.client_saturated, \
+            f"Workers could not keep up with {rps} rps - add workers: {result}"
+        assert result.error_rate <= max_error_rate, \
+            f"Error rate should be within {max_error_rate:.2%}. Got {result.error_rate:.2%}"
+        assert p99 <= p99_slo_ms, \
+            f"Catalog p99 should be within {p99_slo_ms}ms at {rps} rps. Got {p99:.1f}ms"
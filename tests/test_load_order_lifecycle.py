@@ -0,0 +1,44 @@
+"""
+Test order lifecycle throughput (pending -> processing -> shipped -> delivered).
+"""
+
+import pytest
+
+
+class TestLoadOrderLifecycle:
+    """Test orders move through the status lifecycle while new orders arrive"""
+    
+    @pytest.mark.load
+    @pytest.mark.orders
+    def test_orders_reach_final_state(self, order_lifecycle, config, record_property):
+        """
+        Test pipelined status updates deliver (or cancel) every placed order.
+        
+        Arrange: NEW admin, NEW customers, NEW high-stock product
+        Act: Customers place orders while admin stages move them through the lifecycle
+        Assert: No stage errors, every order in its final state, delivery throughput met
+        """
+        # Arrange
+        settings = config.get("order_pipeline", {})
+        min_throughput = settings.get("min_throughput", 5)
+        
+        # Act
+        result = order_lifecycle.run(
+            settings.get("orders", 200),
+            settings.get("workers", {}),
+            queue_size=settings.get("queue_size", 20),
+            sample_interval=settings.get("sample_interval", 0.25)
+        )
+        
+        record_property("perf_report", str(result))
+        record_property("order_pipeline", result.to_dict())
+        mismatches = order_lifecycle.verify()
+        delivered = result.stage("delivered")
+        
+        # Assert
+        assert not result.errors, \
+            f"Status updates should not fail. Errors: {result.errors[:10]}\n{result}"
+        assert not mismatches, \
+            f"Every order should reach its final state. Wrong: {mismatches[:10]}\n{result}"
+        assert delivered.throughput >= min_throughput, \
+            f"Should deliver at least {min_throughput} orders/s, got {delivered.throughput:.1f}\n{result}"
@@ -0,0 +1,40 @@
+"""
+Test max sustainable throughput of key flows (saturation search).
+"""
+
+import pytest
+
+
+class TestLoadSaturationKeyFlows:
+    """Test key flows sustain minimum throughput before SLOs break"""
+    
+    @pytest.mark.load
+    @pytest.mark.parametrize("flow_name", ["login", "catalog", "search", "add_to_cart", "checkout"])
+    def test_flow_sustains_minimum_throughput(
+        self,
+        flow_name,
+        build_load_flow,
+        saturation_finder,
+        config,
+        record_property
+    ):
+        """
+        Test flow reaches configured capacity floor before the knee.
+        
+        Arrange: Prepare flow test data (users, high-stock product) via API
+        Act: Step arrival rate up until p99 SLO, error rate or throughput breaks
+        Assert: Max sustainable rps (lower bound) meets the capacity floor
+        """
+        # Arrange
+        flow = build_load_flow(flow_name)
+        min_rps = config.get("load.saturation.min_rps", 5)
+        
+        # Act
+        report = saturation_finder.find(flow, name=flow_name)
+        record_property("perf_report", str(report))
+        record_property("saturation", report.to_dict())
+        
+        # Assert
+        assert report.lower_rps >= min_rps, \
+            f"'{flow_name}' should sustain at least {min_rps} rps. " \
+            f"Knee at {report.lower_rps:.1f} rps: {report.knee_reason}"
@@ -0,0 +1,46 @@
+"""
+Test run-to-run comparison flags per-test duration regressions.
+"""
+
+import pytest
+from infra.perf_compare import Comparison, compare_runs
+
+
+def _run(run_id: str, duration_ms: float) -> dict:
+    """Stored run with one duration per test (as the results store saves them)"""
+    return {
+        "run_id": run_id,
+        "metrics": {"test": {"tests/test_checkout.py::test_checkout": [duration_ms]}}
+    }
+
+
+class TestPerfCompareTestDurations:
+    """Test single per-run test durations are compared against pooled baseline runs"""
+    
+    @pytest.mark.parametrize("candidate_ms, verdict", [
+        (1600.0, Comparison.REGRESSION),
+        (1010.0, Comparison.UNCHANGED),
+        (600.0, Comparison.IMPROVEMENT)
+    ])
+    def test_test_duration_compared_against_pooled_baseline(self, candidate_ms, verdict):
+        """
+        Test one candidate duration is compared against the durations of several baseline runs.
+        
+        Arrange: 8 baseline runs with the test taking ~1000 ms
+        Act: Compare a candidate run with one duration of the test
+        Assert: Verdict by how far the duration is outside the baseline median's CI
+        """
+        # Arrange
+        baseline_runs = [_run(f"base_{i}", ms) for i, ms in enumerate([980, 1000, 1020, 990, 1010, 1030, 970, 1005])]
+        
+        # Act
+        comparisons = compare_runs(baseline_runs, _run("candidate", candidate_ms), min_samples=5)
+        
+        # Assert
+        assert len(comparisons) == 1, \
+            f"The test duration should be compared once. Got {len(comparisons)} comparisons"
+        comparison = comparisons[0]
+        assert (comparison.baseline_count, comparison.candidate_count) == (8, 1), \
+            f"All baseline runs should be pooled. n: {comparison.baseline_count} / {comparison.candidate_count}"
+        assert comparison.verdict == verdict, \
+            f"{candidate_ms} ms vs ~1000 ms baseline should be {verdict}. Row: {comparison.to_row()}"
@@ -0,0 +1,91 @@
+"""
+Test single-flight GETs never return data older than the caller's own write.
+"""
+
+import json
+import threading
+import pytest
+from requests import Response
+from infra.api_wrapper import ApiWrapper
+from infra.single_flight import SingleFlight
+
+
+class SlowReadBackend:
+    """Fake session: the first GET reads the value, then is held until released"""
+    
+    def __init__(self):
+        self.value = "old"
+        self.write_sent = threading.Event()
+        self.slow_read_done = threading.Event()
+        self.release_slow_read = threading.Event()
+        self.gets = 0
+        self.lock = threading.Lock()
+    
+    def request(self, method, url, **kwargs):
+        if method == "GET":
+            with self.lock:
+                self.gets += 1
+                slow = self.gets == 1
+            value = self.value
+            if slow:
+                self.slow_read_done.set()
+                self.release_slow_read.wait(5)
+            return self._response(value)
+        
+        # Write lands only after a concurrent GET has read the old value
+        self.write_sent.set()
+        self.slow_read_done.wait(5)
+        self.value = "new"
+        return self._response("ok")
+    
+    @staticmethod
+    def _response(value) -> Response:
+        response = Response()
+        response.status_code = 200
+        response._content = json.dumps({"value": value}).encode()
+        return response
+
+
+class TestSingleFlightReadYourWrites:
+    """Test a read-back after a write does not join or reuse a GET answered before the write landed"""
+    
+    @pytest.mark.parametrize("ttl", [0, 60])
+    def test_read_back_after_write_sees_write(self, ttl):
+        """
+        Test a GET started while a write is in flight is not shared with the writer's read-back.
+        ttl 0: the slow GET is still in flight at the read-back; ttl 60: it already completed and was cached.
+        
+        Arrange: Single-flight wrapper over a fake backend whose first GET is held
+        Act: Start a write; while it is in flight start a concurrent GET (answered with the old value);
+             after the write returns, read back
+        Assert: Read-back returns the new value; the concurrent GET returned the old one
+        """
+        # Arrange
+        api = ApiWrapper(base_url="http://backend.test", record_latency=False, network_timing=False)
+        api.single_flight = SingleFlight(ttl=ttl, cacheable=lambda response: response.ok)
+        backend = SlowReadBackend()
+        api.session = backend
+        results = {}
+        
+        def concurrent_get():
+            results["concurrent"] = api.get("/stats").json()["value"]
+        
+        # Act
+        writer = threading.Thread(target=lambda: api.post("/orders", {}))
+        writer.start()
+        backend.write_sent.wait(5)
+        reader = threading.Thread(target=concurrent_get)
+        reader.start()
+        writer.join(5)
+        if ttl:
+            backend.release_slow_read.set()
+            reader.join(5)
+        read_back = api.get("/stats").json()["value"]
+        backend.release_slow_read.set()
+        reader.join(5)
+        
+        # Assert
+        assert results.get("concurrent") == "old", \
+            f"Concurrent GET should have been answered before the write landed. Got: {results.get('concurrent')}"
+        assert read_back == "new", \
+            f"Read-back after the write should see it, not share the concurrent GET. Got: {read_back}"
@@ -0,0 +1,53 @@
+"""
+Test concurrent checkout of the last units of a product (stock oversell).
+"""
+
+import pytest
+from logic.load.contention import format_trials
+
+
+class TestStressCheckoutOversell:
+    """Test racing checkouts never sell more than the stock"""
+    
+    @pytest.mark.stress
+    @pytest.mark.orders
+    @pytest.mark.parametrize("users, stock", [(20, 1), (40, 5), (60, 20)])
+    def test_concurrent_checkout_sells_exactly_stock(
+        self,
+        users,
+        stock,
+        checkout_contention,
+        config,
+        record_property
+    ):
+        """
+        Test N users checking out K units at the same moment get exactly K orders.
+        
+        Arrange: NEW product with stock K, N NEW users with the product in cart
+        Act: All users place the order at once (repeated trials)
+        Assert: Exactly K orders accepted, the rest rejected, stock ends at 0, p99 within limit
+        """
+        # Arrange
+        repeats = config.get("contention.repeats", 3)
+        p99_ms = config.get("contention.p99_ms")
+        
+        # Act
+        trials = [checkout_contention.run(users, stock) for _ in range(repeats)]
+        
+        report = format_trials(trials)
+        record_property("perf_report", report)
+        record_property("checkout_contention", [trial.to_dict() for trial in trials])
+        
+        # Assert
+        for trial in trials:
+            assert not trial.errors, \
+                f"Racing checkouts should be accepted or rejected, not fail. Errors: {trial.errors}\n{report}"
+            assert trial.oversold == 0, \
+                f"Should not oversell: {trial.succeeded} orders accepted for stock {stock}\n{report}"
+            assert trial.succeeded == stock, \
+                f"Exactly {stock} orders should succeed, got {trial.succeeded}\n{report}"
+            assert trial.final_stock == 0, \
+                f"Stock should end at 0, got {trial.final_stock}\n{report}"
+            if p99_ms:
+                assert trial.latency()["p99"] <= p99_ms, \
+                    f"Checkout p99 under contention should be <= {p99_ms} ms\n{report}"
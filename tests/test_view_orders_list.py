@@ -31,8 +31,7 @@ class TestViewOrdersList:
         order = create_test_order(token)
         order_id = order.get("_id") or order.get("order", {}).get("_id")
         
-        api_orders = orders_api.get_my_orders(token)
-        api_order_ids = [o.get("_id") for o in api_orders]
+        api_orders = orders_api.get_my_order_list(token)
         
         # Act - Navigate to Orders via UI clicks (preserves session)
         orders_page = OrdersPage(driver)
@@ -43,8 +42,8 @@ class TestViewOrdersList:
         orders_count = orders_page.get_orders_count()
         
         # Assert
-        assert order_id in api_order_ids, \
-            f"Order {order_id} should exist in API. Found: {api_order_ids}"
+        assert order_id in api_orders, \
+            f"Order {order_id} should exist in API. Found: {api_orders.ids}"
         assert is_on_orders, "Should be on orders page"
         assert orders_count == 1, \
             f"Should have  1 order, got {orders_count}"
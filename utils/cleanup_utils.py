@@ -3,7 +3,7 @@ Cleanup utilities - manage test data cleanup.
 Tracks created resources and cleans them up after tests.
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -48,6 +48,23 @@ class CleanupManager:
         if order_id and order_id not in self._orders:
             self._orders.append(order_id)
     
+    def resources(self) -> Dict[str, List[str]]:
+        """Get registered resource IDs (e.g. to hand over from a worker process)"""
+        return {
+            "users": list(self._users),
+            "products": list(self._products),
+            "orders": list(self._orders)
+        }
+    
+    def register_resources(self, resources: Dict[str, List[str]]):
+        """Register resource IDs exported by resources()"""
+        for user_id in resources.get("users", []):
+            self.register_user(user_id)
+        for product_id in resources.get("products", []):
+            self.register_product(product_id)
+        for order_id in resources.get("orders", []):
+            self.register_order(order_id)
+    
     def cleanup_all(self):
         """Clean up all registered resources"""
         total_resources = len(self._users) + len(self._products) + len(self._orders)